@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+from functools import wraps
+from typing import Any, Awaitable, Callable, Hashable, Sequence
+
+from art_deco.core.arg_processors.processing import rebuild_call
+from art_deco.core.specs.dynamic_arg_specs import DynamicArgSpec, DynamicArgSpecs
+from art_deco.core.specs.static_arg_specs import ArgKind, Sentinels
+from art_deco.core.specs.static_inspector import get_static_arg_specs
+from art_deco.memoize_args.fingerprints import call_key
+
+BatchFunc = Callable[..., Awaitable[Sequence[Any]]]
+
+
+class _Batch:
+    """The calls coalesced into one call of the batch function: their values of the batched arg, the futures awaited
+    by the callers, and the specs of the first call, whose other args are shared by every call of the batch."""
+
+    __slots__ = ('specs', 'batched_spec', 'values', 'futures', 'index_of', 'flush_handle')
+
+    def __init__(self, specs: DynamicArgSpecs, batched_spec: DynamicArgSpec) -> None:
+        self.specs = specs
+        self.batched_spec = batched_spec
+        self.values: list[Any] = []
+        self.futures: list[asyncio.Future] = []
+        self.index_of: dict[Hashable, int] = {}  # Callers with equal hashable values share a slot of the batch
+        self.flush_handle: asyncio.TimerHandle | None = None
+
+    def add(self, value: Any, loop: asyncio.AbstractEventLoop) -> asyncio.Future:
+        try:
+            return self.futures[self.index_of[value]]
+        except (KeyError, TypeError):  # New or unhashable value
+            pass
+        future = loop.create_future()
+        try:
+            self.index_of[value] = len(self.values)
+        except TypeError:
+            pass
+        self.values.append(value)
+        self.futures.append(future)
+        return future
+
+
+def coalesce_args(
+    batched_arg: str,
+    *,
+    max_batch_size: int = 64,
+    max_delay: float = 0.001,
+) -> Callable[[BatchFunc], Callable[..., Awaitable[Any]]]:
+    """Coalesce the concurrent calls of the decorated coroutine function into batches (i.e. the dataloader pattern).
+
+    The decorated function is the batch function: it receives a list of values for ``batched_arg`` and returns the
+    sequence of their results, in the same order. Callers pass a single value for ``batched_arg`` and await its result.
+
+    Each call is bound to the signature of the decorated function, so calls are compatible, and share a batch, when
+    they have the same values for the other args, whether they are passed positionally, by keyword or left to their
+    defaults. A batch is sent once it has ``max_batch_size`` distinct values or ``max_delay`` seconds after its first
+    call. If the batch function raises, every caller of the batch gets the error.
+
+    .. code-block:: python
+
+        @coalesce_args('user_id')
+        async def get_users(user_id: list[int], db: str = 'main') -> list[User]:
+            return await fetch_users(db, user_id)
+
+        user = await get_users(1, db='main')  # Coalesced with get_users(2), get_users(db='main', user_id=3), ...
+    """
+    if max_batch_size <= 0:
+        raise ValueError(f'The maximum size of a batch must be positive, got {max_batch_size}')
+
+    def decorator(batch_func: BatchFunc) -> Callable[..., Awaitable[Any]]:
+        if not inspect.iscoroutinefunction(batch_func):
+            raise TypeError(f'{batch_func} must be a coroutine function (async def) to coalesce its calls')
+        static_specs = get_static_arg_specs(batch_func, parse_type_hints=False)
+        static_batched_arg = static_specs.args_by_name.get(batched_arg)
+        if static_batched_arg is None or static_batched_arg.kind in {ArgKind.VAR_POSITIONAL, ArgKind.VAR_KEYWORD}:
+            raise ValueError(f'{batch_func} has no named parameter {batched_arg} to batch')
+        binding_plan = static_specs.binding_plan
+        batched = frozenset({batched_arg})
+        pending: dict[Hashable, _Batch] = {}
+        running: set[asyncio.Future] = set()  # The event loop only keeps weak references to tasks
+
+        def flush(group: Hashable) -> None:
+            batch = pending.pop(group)
+            if batch.flush_handle is not None:
+                batch.flush_handle.cancel()
+            batch.batched_spec.value = batch.values
+            try:
+                args, kwargs = rebuild_call(batch.specs)
+                batch_call = batch_func(*args, **kwargs)
+            except Exception as error:  # noqa: B902  # Raised before the coroutine is created, fanned out
+                _set_exception(batch.futures, error)
+                return
+            task = asyncio.ensure_future(_resolve(batch_call, batch.futures))
+            running.add(task)
+            task.add_done_callback(running.discard)
+
+        @wraps(batch_func)
+        async def coalesced(*args: Any, **kwargs: Any) -> Any:
+            loop = asyncio.get_running_loop()
+            specs = binding_plan.bind(args, kwargs)
+            missing = [spec.name for spec in specs.args if spec.value is Sentinels.NO_DEFAULT_VALUE]
+            if missing:  # Rejected before joining a batch, whose other callers would get the error
+                raise TypeError(f'{batch_func.__qualname__}() missing required arguments: {missing}')
+            batched_spec = specs.args_by_name[batched_arg]
+            try:
+                others = call_key(specs, ignore=batched)
+            except TypeError:  # Cannot tell whether the other args match those of another call, batch it alone
+                others = None
+            group = (loop, others) if others is not None else (loop, object())
+            batch = pending.get(group)
+            if batch is None:
+                batch = pending[group] = _Batch(specs, batched_spec)
+                batch.flush_handle = loop.call_later(max_delay, flush, group)
+            future = batch.add(batched_spec.value, loop)
+            if len(batch.values) >= max_batch_size:
+                flush(group)
+            return await asyncio.shield(future)  # A cancelled caller must not cancel the result of the others
+
+        return coalesced
+
+    return decorator
+
+
+async def _resolve(batch_call: Awaitable[Sequence[Any]], futures: list[asyncio.Future]) -> None:
+    try:
+        results = await batch_call
+        if len(results) != len(futures):
+            raise ValueError(f'The batch function returned {len(results)} results for {len(futures)} values')
+    except asyncio.CancelledError:
+        for future in futures:
+            future.cancel()
+        raise
+    except Exception as error:  # noqa: B902  # Fanned out to the callers
+        _set_exception(futures, error)
+        return
+    for future, result in zip(futures, results):
+        if not future.done():
+            future.set_result(result)
+
+
+def _set_exception(futures: list[asyncio.Future], error: Exception) -> None:
+    for future in futures:
+        if not future.done():
+            future.set_exception(error)
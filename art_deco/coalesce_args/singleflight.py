@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+import threading
+from dataclasses import dataclass
+from functools import wraps
+from typing import Any, Callable, Collection, Hashable, TypeVar, cast
+
+from art_deco.core.specs.static_inspector import get_static_arg_specs
+from art_deco.memoize_args.fingerprints import call_key
+
+_F = TypeVar('_F', bound=Callable)
+
+
+@dataclass
+class FlightStats:
+    """Counters of the calls of a singleflight callable. Under concurrency, they are updated without locking, so they
+    may be slightly off."""
+
+    calls: int = 0
+    collapsed: int = 0  # Calls that waited for the result of an identical call in flight instead of executing
+
+    @property
+    def collapse_rate(self) -> float:
+        return self.collapsed / self.calls if self.calls else 0.0
+
+    def reset(self) -> None:
+        self.calls = self.collapsed = 0  # noqa: WPS429
+
+
+class _Flight:
+    """A call in flight, whose leader executes it while followers wait for its outcome."""
+
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+def singleflight(*, ignore: Collection[str] = ()) -> Callable[[_F], _F]:
+    """Deduplicate the identical calls of the decorated callable that are in flight at the same time: the first one
+    (the leader) executes, while the others (the followers) wait for its result, or error, instead of executing again.
+
+    Calls are identical when their args are equal once bound to the signature (see
+    :func:`~art_deco.memoize_args.fingerprints.call_key`), leaving out the args in ``ignore``. Calls with args that
+    cannot be fingerprinted always execute. Threads wait for the leader of any thread, while coroutines wait for the
+    leader of their event loop. Unlike memoization, nothing is kept once the leader returns.
+
+    How many calls were collapsed is counted in the ``stats`` attribute (see :class:`FlightStats`) of the decorated
+    callable.
+    """
+    ignored = frozenset(ignore)
+
+    def decorator(wrapped: _F) -> _F:
+        binding_plan = get_static_arg_specs(wrapped, parse_type_hints=False).binding_plan
+        stats = FlightStats()
+
+        def key_of(args: tuple[Any, ...], kwargs: dict[str, Any]) -> Hashable | None:
+            stats.calls += 1
+            try:
+                return call_key(binding_plan.bind(args, kwargs), ignore=ignored)
+            except TypeError:  # Cannot be fingerprinted
+                return None
+
+        if inspect.iscoroutinefunction(wrapped):
+            in_flight_tasks: dict[Hashable, asyncio.Future] = {}
+
+            @wraps(wrapped)
+            async def async_singleflight(*args: Any, **kwargs: Any) -> Any:
+                key = key_of(args, kwargs)
+                if key is None:
+                    return await wrapped(*args, **kwargs)
+                key = (asyncio.get_running_loop(), key)
+                flight = in_flight_tasks.get(key)
+                if flight is not None:
+                    stats.collapsed += 1
+                    return await asyncio.shield(flight)  # A cancelled follower must not cancel the leader
+                flight = in_flight_tasks[key] = asyncio.ensure_future(wrapped(*args, **kwargs))
+                try:
+                    return await asyncio.shield(flight)
+                finally:
+                    del in_flight_tasks[key]  # noqa: WPS420
+
+            decorated: Any = async_singleflight
+        else:
+            in_flight: dict[Hashable, _Flight] = {}
+            lock = threading.Lock()
+
+            @wraps(wrapped)
+            def sync_singleflight(*args: Any, **kwargs: Any) -> Any:
+                key = key_of(args, kwargs)
+                if key is None:
+                    return wrapped(*args, **kwargs)
+                with lock:
+                    flight = in_flight.get(key)
+                    is_leader = flight is None
+                    if is_leader:
+                        flight = in_flight[key] = _Flight()
+                assert flight is not None
+                if not is_leader:
+                    stats.collapsed += 1
+                    flight.done.wait()
+                    if flight.error is not None:
+                        raise flight.error
+                    return flight.result
+                try:
+                    flight.result = wrapped(*args, **kwargs)
+                except BaseException as error:
+                    flight.error = error
+                    raise
+                finally:
+                    with lock:
+                        del in_flight[key]  # noqa: WPS420
+                    flight.done.set()
+                return flight.result
+
+            decorated = sync_singleflight
+
+        decorated.stats = stats
+        return cast(_F, decorated)
+
+    return decorator
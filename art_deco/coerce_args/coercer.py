@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Callable, Collection, Dict, Mapping, Tuple, TypeVar
+
+from art_deco.coerce_args.converters import Converter, compile_converter, identity
+from art_deco.core.arg_processors.api import ArgName, ArgNames, Context, MultiArgValidateFunc
+from art_deco.core.arg_processors.static_decorator import static_process_args
+from art_deco.core.specs.dynamic_arg_specs import DynamicArgSpec
+from art_deco.core.specs.static_arg_specs import ArgKind, StaticArgSpec, StaticArgSpecs
+
+_F = TypeVar('_F', bound=Callable)
+
+
+def coerce_args(
+    *,
+    ignore: Collection[str] = (),
+    codegen: bool = False,
+    adaptive: int = 0,
+) -> Callable[[_F], _F]:
+    """Coerce the arguments of the decorated callable to their annotated types, e.g. ``'1'`` to ``1`` for ``int``,
+    ``('1', '2')`` to ``[1, 2]`` for ``list[int]``, ``None`` or ``'3'`` to ``None`` or ``3`` for ``Optional[int]``.
+
+    Each annotation is compiled once, at decoration time, into a tree of converters (see :func:`compile_converter`),
+    shared by the callables with the same annotation. Values that already have the annotated type are kept as they
+    are (containers too, when all their items are kept, such that the callee can mutate them), and so are default
+    values. The annotations of ``*args`` and ``**kwargs`` apply to each of their values.
+    Conversions never lose precision: ``1.5`` is rejected (ValueError) instead of being truncated to ``1`` for ``int``.
+
+    :param ignore: the names of the arguments to leave untouched.
+    :param codegen: see :func:`~art_deco.core.arg_processors.static_decorator.static_process_args`.
+    :param adaptive: see :func:`~art_deco.core.arg_processors.static_decorator.static_process_args`.
+    """
+    return static_process_args(
+        partial(CoercingProcessor, ignore=frozenset(ignore)), parse_type_hints=True, codegen=codegen, adaptive=adaptive
+    )
+
+
+@dataclass
+class CoercingProcessor:
+    static_specs: StaticArgSpecs
+    ignore: frozenset[ArgName] = frozenset()
+    converters: dict[ArgName, Converter] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.converters = {}
+        for arg in self.static_specs.args:
+            if arg.name in self.ignore or not arg.has_annotation:
+                continue
+            converter = _compile_arg_converter(arg)
+            if converter is not identity:
+                self.converters[arg.name] = converter
+
+    def process_arg(self, arg: DynamicArgSpec, _: Context) -> Any:
+        if arg.is_default:
+            return arg.value
+        return self.converters[arg.name](arg.value)
+
+    def should_process_arg(self, arg: str) -> bool:
+        return arg in self.converters
+
+    def get_wide_checks(self) -> Mapping[ArgNames, MultiArgValidateFunc]:
+        return {}
+
+    def get_inline_hacks(self) -> Mapping[ArgName, Converter]:
+        """The converters only need the value of the argument, so they can be called inline."""
+        inline_hacks: dict[ArgName, Converter] = {}
+        for name, converter in self.converters.items():
+            arg = self.static_specs.args_by_name[name]
+            if arg.has_default:
+                converter = partial(_skip_default, converter, arg.default_val)  # noqa: WPS440
+            inline_hacks[name] = converter
+        return inline_hacks
+
+
+def _compile_arg_converter(arg: StaticArgSpec) -> Converter:
+    converter = compile_converter(arg.annotation)
+    if converter is identity:
+        return identity
+    if arg.kind is ArgKind.VAR_POSITIONAL:
+        return compile_converter(Tuple[arg.annotation, ...])  # type: ignore[name-defined]
+    if arg.kind is ArgKind.VAR_KEYWORD:
+        return compile_converter(Dict[str, arg.annotation])  # type: ignore[name-defined]
+    return converter
+
+
+def _skip_default(converter: Converter, default: Any, value: Any) -> Any:
+    return value if value is default else converter(value)
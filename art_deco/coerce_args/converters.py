@@ -0,0 +1,314 @@
+from __future__ import annotations
+
+import collections.abc
+import inspect
+import numbers
+import sys
+import typing
+from enum import Enum
+from typing import Any, Callable, Hashable, Iterable, Tuple, Union
+
+from typing_extensions import Literal, get_args, get_origin
+
+from art_deco.core.specs.static_arg_specs import Sentinels
+from art_deco.utils.caching import LRUCache
+from art_deco.utils.typing_utils import is_annotated
+
+Converter = Callable[[Any], Any]
+
+if sys.version_info >= (3, 10):
+    from types import UnionType  # noqa: WPS433
+
+    _UNION_ORIGINS: Tuple[Any, ...] = (Union, UnionType)
+else:
+    _UNION_ORIGINS = (Union,)
+
+_NONE_TYPE = type(None)
+_TRUE_STRINGS = frozenset(('true', '1', 'yes', 'on'))
+_FALSE_STRINGS = frozenset(('false', '0', 'no', 'off'))
+_LITERAL_ORIGINS = (Literal, getattr(typing, 'Literal', Literal))
+
+CONVERTERS_CACHE: LRUCache[Hashable, Converter] = LRUCache(maxsize=4096)
+
+
+def identity(value: Any) -> Any:
+    return value
+
+
+def compile_converter(annotation: Any) -> Converter:
+    """Compile the annotation into a tree of converters, which converts values to the annotated type in a single pass,
+    without inspecting the annotation again (see :func:`coerce_args`).
+
+    Converters are cached by annotation in :data:`CONVERTERS_CACHE`, such that the functions sharing an annotation
+    (e.g. ``list[int]``) share its converter. Annotations that the converters cannot enforce (e.g. ``Any``,
+    ``Callable[..., int]``, type variables, forward references) compile to :func:`identity`.
+    """
+    try:
+        key: Hashable = (annotation, repr(annotation))  # Union[int, str] == Union[str, int], but coerces differently
+        hash(key)
+    except TypeError:
+        return _compile(annotation)
+    converter = CONVERTERS_CACHE.get(key)
+    if converter is None:
+        converter = _compile(annotation)
+        CONVERTERS_CACHE.put(key, converter)
+    return converter
+
+
+def _compile(annotation: Any) -> Converter:  # noqa: WPS212, WPS231
+    if annotation is Any or annotation is object or annotation is Sentinels.NO_ANNOTATION:
+        return identity
+    if annotation is None or annotation is _NONE_TYPE:
+        return _to_none
+    if is_annotated(annotation):
+        return compile_converter(annotation.__origin__)
+    supertype = getattr(annotation, '__supertype__', None)  # typing.NewType
+    if supertype is not None:
+        return compile_converter(supertype)
+    origin, args = get_origin(annotation), get_args(annotation)
+    if origin in _UNION_ORIGINS:
+        return _union_converter(args)
+    if origin in _LITERAL_ORIGINS:
+        return _literal_converter(args)
+    if origin is None:
+        return _class_converter(annotation) if isinstance(annotation, type) else identity
+    if not isinstance(origin, type) or origin is type or issubclass(origin, collections.abc.Iterator):
+        return identity  # E.g. Type[int], ClassVar[int], or iterators, which would be consumed
+    # Abstract containers (e.g. Sequence[int]) are converted to the builtin container implementing them
+    if origin is tuple:
+        return _tuple_converter(args)
+    if issubclass(origin, collections.abc.Mapping):
+        return _mapping_converter(_concrete(origin, dict), args)
+    if issubclass(origin, collections.abc.Set):
+        return _collection_converter(_concrete(origin, set), args)
+    if issubclass(origin, collections.abc.Iterable):
+        return _collection_converter(_concrete(origin, list), args)
+    if inspect.isabstract(origin):
+        return identity  # E.g. Callable[..., int]
+    return _class_converter(origin)  # E.g. a user defined generic class
+
+
+def _concrete(origin: type, builtin: type) -> type:
+    return builtin if inspect.isabstract(origin) else origin
+
+
+def _to_none(value: Any) -> None:
+    if value is not None:
+        raise TypeError(f'Expected None, got {value!r}')
+
+
+def _class_converter(cls: type) -> Converter:
+    if cls is bool:
+        return _to_bool
+    if issubclass(cls, Enum):
+        return _enum_converter(cls)
+    if issubclass(cls, int):
+        return _int_converter(cls)
+
+    def to_class(value: Any) -> Any:
+        if value.__class__ is cls or isinstance(value, cls):
+            return value
+        return cls(value)
+
+    return to_class
+
+
+def _int_converter(cls: type) -> Converter:
+    """Numbers are only converted to integers if they are integral, ``int(1.9)`` would truncate them to ``1``."""
+
+    def to_int(value: Any) -> Any:
+        if value.__class__ is cls or isinstance(value, cls):
+            return value
+        converted = cls(value)
+        if isinstance(value, numbers.Number) and converted != value:
+            raise ValueError(f'Cannot coerce {value!r} to {cls.__name__} without losing precision')
+        return converted
+
+    return to_int
+
+
+def _to_bool(value: Any) -> bool:
+    if value.__class__ is bool:
+        return value  # type: ignore[no-any-return]
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in _TRUE_STRINGS:
+            return True
+        if lowered in _FALSE_STRINGS:
+            return False
+        raise ValueError(f'Cannot coerce {value!r} to bool')
+    return bool(value)
+
+
+def _enum_converter(cls: type[Enum]) -> Converter:
+    members_by_name = cls.__members__
+
+    def to_enum(value: Any) -> Enum:
+        if isinstance(value, cls):
+            return value
+        try:
+            return cls(value)
+        except ValueError:
+            if isinstance(value, str) and value in members_by_name:
+                return members_by_name[value]
+            raise
+
+    return to_enum
+
+
+def _union_converter(args: tuple[Any, ...]) -> Converter:
+    """Values that already have one of the types of the union are kept as they are, otherwise they are converted to
+    the first type of the union that accepts them."""
+    exact_types = frozenset(arg for arg in args if isinstance(arg, type) and get_origin(arg) is None)
+    converters = tuple(compile_converter(arg) for arg in args if arg is not _NONE_TYPE)
+    if identity in converters:
+        return identity  # E.g. Optional[Any]
+
+    def to_union(value: Any) -> Any:
+        if value.__class__ in exact_types:
+            return value
+        errors = []
+        for converter in converters:
+            try:
+                return converter(value)
+            except (TypeError, ValueError) as error:
+                errors.append(f'{error.__class__.__name__}: {error}')
+        raise ValueError(f'Cannot coerce {value!r} to any of {args}: {"; ".join(errors)}')
+
+    return to_union
+
+
+def _literal_converter(args: tuple[Any, ...]) -> Converter:
+    """Literal values are compared by type and value (``1`` is not ``True``), values of other types are converted to
+    the types of the literals, e.g. ``'1'`` to ``1`` for ``Literal[1, 2]``."""
+    allowed = {(arg.__class__, arg): arg for arg in args}
+    converters = tuple(_class_converter(cls) for cls in dict.fromkeys(arg.__class__ for arg in args))
+
+    def to_literal(value: Any) -> Any:
+        try:
+            return allowed[value.__class__, value]
+        except (KeyError, TypeError):
+            pass  # noqa: WPS420
+        for converter in converters:
+            try:
+                converted = converter(value)
+                return allowed[converted.__class__, converted]
+            except (KeyError, TypeError, ValueError):
+                continue
+        raise ValueError(f'{value!r} is not one of {args}')
+
+    return to_literal
+
+
+def _check_not_str(value: Any, container: type) -> None:
+    if isinstance(value, (str, bytes)):
+        raise TypeError(f'Cannot coerce {value!r} to {container.__name__}, it would be split into characters')
+
+
+def _collection_converter(container: type, args: tuple[Any, ...]) -> Converter:
+    item_converter = compile_converter(args[0]) if args else identity
+    if item_converter is identity:
+
+        def to_collection(value: Any) -> Any:
+            if value.__class__ is container:
+                return value
+            _check_not_str(value, container)
+            return container(value)
+
+        return to_collection
+
+    def to_collection_of_items(value: Any) -> Any:
+        if value.__class__ is container:
+            items = [item_converter(item) for item in value]
+            return value if _is_unchanged(value, items) else container(items)
+        _check_not_str(value, container)
+        return container(map(item_converter, value))
+
+    return to_collection_of_items
+
+
+def _tuple_converter(args: tuple[Any, ...]) -> Converter:
+    if not args or args == ((),):  # Tuple, Tuple[()]
+        return _collection_converter(tuple, ())
+    if len(args) == 2 and args[1] is Ellipsis:
+        return _collection_converter(tuple, args[:1])
+    item_converters = tuple(compile_converter(arg) for arg in args)
+
+    def to_tuple(value: Any) -> tuple:
+        _check_not_str(value, tuple)
+        values = tuple(value)
+        if len(values) != len(item_converters):
+            raise ValueError(f'Expected {len(item_converters)} values, got {len(values)}: {value!r}')
+        items = tuple(converter(item) for converter, item in zip(item_converters, values))
+        return values if value.__class__ is tuple and _is_unchanged(values, items) else items  # tuple(value) is value
+
+    return to_tuple
+
+
+def _mapping_converter(container: type, args: tuple[Any, ...]) -> Converter:
+    if issubclass(container, collections.Counter):
+        return _counter_converter(container, args)
+    key_converter, value_converter = (compile_converter(arg) for arg in args) if args else (identity, identity)
+    if issubclass(container, collections.defaultdict):
+        return _defaultdict_converter(container, key_converter, value_converter)
+    if key_converter is identity and value_converter is identity:
+        return _collection_converter(container, ())
+
+    def to_mapping(value: Any) -> Any:
+        if value.__class__ is container:
+            items = [(key_converter(key), value_converter(item)) for key, item in value.items()]
+            return value if _are_items_unchanged(value, items) else container(items)
+        return container((key_converter(key), value_converter(item)) for key, item in _items(value))
+
+    return to_mapping
+
+
+def _counter_converter(container: type, args: tuple[Any, ...]) -> Converter:
+    """Counters are annotated with the type of their keys only (e.g. ``Counter[str]``), their values are the counts.
+    Mappings are converted with their counts, other iterables are counted, and keys that are equal once converted
+    (e.g. ``'1'`` and ``1`` for ``Counter[int]``) have their counts summed."""
+    key_converter = compile_converter(args[0]) if args else identity
+    if key_converter is identity:
+        return _collection_converter(container, ())
+
+    def to_counter(value: Any) -> Any:
+        if value.__class__ is container and all(key_converter(key) is key for key in value):
+            return value
+        _check_not_str(value, container)
+        counter = container()
+        if isinstance(value, collections.abc.Mapping):
+            for key, count in value.items():
+                counter[key_converter(key)] += count
+        else:
+            counter.update(map(key_converter, value))
+        return counter
+
+    return to_counter
+
+
+def _defaultdict_converter(container: type, key_converter: Converter, value_converter: Converter) -> Converter:
+    """Default dicts keep the ``default_factory`` of the converted value, other mappings convert to a default dict
+    without factory, which behaves like a dict."""
+
+    def to_defaultdict(value: Any) -> Any:
+        items = [(key_converter(key), value_converter(item)) for key, item in _items(value)]
+        if value.__class__ is container and _are_items_unchanged(value, items):
+            return value
+        default_factory = value.default_factory if isinstance(value, collections.defaultdict) else None
+        return container(default_factory, items)
+
+    return to_defaultdict
+
+
+def _is_unchanged(values: Iterable[Any], converted: Iterable[Any]) -> bool:
+    """Whether the converter kept every value as it is, such that the container can be kept too (with its identity,
+    for callees mutating it)."""
+    return all(new is old for new, old in zip(converted, values))
+
+
+def _are_items_unchanged(mapping: Any, converted: Iterable[tuple[Any, Any]]) -> bool:
+    return all(new_key is key and new is old for (key, old), (new_key, new) in zip(mapping.items(), converted))
+
+
+def _items(value: Any) -> Iterable[tuple[Any, Any]]:
+    return value.items() if isinstance(value, collections.abc.Mapping) else dict(value).items()
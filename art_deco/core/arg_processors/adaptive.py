@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import inspect
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import update_wrapper
+from types import CodeType
+from typing import AbstractSet, Any, Callable, Mapping, Optional, Tuple, TypeVar
+
+from art_deco.core.arg_processors.api import ArgName, ArgsProcessor, SupportsInlineHacks
+from art_deco.core.specs.static_arg_specs import ArgKind, StaticArgSpec, StaticArgSpecs
+
+_F = TypeVar('_F', bound=Callable)
+
+# The number of positional values, with their types, and the names of the keyword values, with their types
+CallShape = Tuple[Tuple[type, ...], Tuple[Tuple[str, type], ...]]
+
+_WRAPPED = '__art_deco_wrapped__'
+_MISS = '__art_deco_miss__'
+_GENERIC = '__art_deco_generic__'
+_RECORD = '__art_deco_record__'
+_ADAPTIVE = '__art_deco_adaptive__'
+_FAST = '__art_deco_fast__'
+_KEYWORDS = '__art_deco_keywords__'
+
+
+@dataclass
+class AdaptiveStats:
+    """Diagnostics of an adaptive wrapper (see :func:`adaptive_wrapper`).
+
+    :ivar shapes: histogram of the shapes of the calls made during the warm-up.
+    :ivar specialized: the shape the fast path is specialized for, None until the end of the warm-up, or if the
+        dominant shape could not be specialized.
+    :ivar misses: the number of calls, after the warm-up, which did not match the guard of the fast path.
+    """
+
+    warmup: int
+    shapes: Counter[CallShape] = field(default_factory=Counter)
+    specialized: Optional[CallShape] = None
+    misses: int = 0
+
+
+def adaptive_wrapper(
+    wrapped: _F,
+    static_specs: StaticArgSpecs,
+    processor: ArgsProcessor,
+    args_to_process: AbstractSet[ArgName],
+    generic: Callable,
+    warmup: int,
+) -> _F | None:
+    """A wrapper that forwards the calls to the ``generic`` one while recording their shapes (see :data:`CallShape`),
+    then, after ``warmup`` calls, installs a fast path specialized (via ``exec``, like
+    :func:`~art_deco.core.arg_processors.codegen.compile_wrapper`) for the dominant shape.
+
+    The fast path checks that the call has the same shape, with the same exact types for the values of the args to
+    process (the guard), then calls the inline hacks of the processor (see :class:`SupportsInlineHacks`) on them
+    directly, without binding dynamic specs. Hacks with a ``specialize(cls)`` method (e.g. those built by
+    :func:`~art_deco.hack_args.dispatch.dispatch_arg_hacker`) are replaced by the converter they return for the
+    type of the guard. Calls that miss the guard go through the generic wrapper. The fast path is installed once, in
+    place of the code of the wrapper.
+
+    Returns None under the same conditions as ``compile_wrapper``. The :class:`AdaptiveStats` of the wrapper are
+    exposed as its ``adaptive_stats`` attribute.
+    """
+    if not inspect.isfunction(wrapped) or inspect.iscoroutinefunction(wrapped):
+        return None
+    if not isinstance(processor, SupportsInlineHacks) or processor.get_wide_checks():
+        return None
+    inline_hacks = processor.get_inline_hacks()
+    if not args_to_process <= inline_hacks.keys():
+        return None
+    inline_hacks = {name: inline_hacks[name] for name in args_to_process}
+    stats = AdaptiveStats(warmup)
+    lock = threading.Lock()
+    # The wrapper is generated without closure, such that its code can be replaced by the code of the fast path (which
+    # shares its globals) at the end of the warm-up, sparing the fast path a call to forward the arguments
+    namespace: dict[str, Any] = {}
+
+    def record(*args: Any, **kwargs: Any) -> Any:
+        stats.shapes[get_call_shape(args, kwargs)] += 1
+        if sum(stats.shapes.values()) >= warmup:
+            with lock:
+                if adaptive.__code__ is warmup_code:
+                    adaptive.__code__ = _specialize(wrapped, static_specs, inline_hacks, generic, stats, namespace)
+        return generic(*args, **kwargs)
+
+    namespace[_RECORD] = record
+    source = f'def {_ADAPTIVE}(*args, **kwargs):\n    return {_RECORD}(*args, **kwargs)'
+    exec(source, namespace)  # noqa: S102  # pylint: disable=exec-used
+    adaptive = namespace[_ADAPTIVE]
+    warmup_code = adaptive.__code__
+    adaptive.adaptive_stats = stats
+    return update_wrapper(adaptive, wrapped)  # type: ignore[no-any-return]
+
+
+def get_call_shape(args: tuple, kwargs: Mapping[str, Any]) -> CallShape:
+    return tuple(map(type, args)), tuple((name, type(value)) for name, value in kwargs.items())
+
+
+def _specialize(  # noqa: WPS211
+    wrapped: Callable,
+    static_specs: StaticArgSpecs,
+    inline_hacks: Mapping[ArgName, Callable[[Any], Any]],
+    generic: Callable,
+    stats: AdaptiveStats,
+    namespace: dict[str, Any],
+) -> CodeType:
+    """The code of the fast path for the dominant shape of the warm-up, or of a call to the generic wrapper if it
+    cannot be specialized, defined in the namespace."""
+
+    def miss(*args: Any, **kwargs: Any) -> Any:
+        stats.misses += 1
+        return generic(*args, **kwargs)
+
+    namespace.update({_WRAPPED: wrapped, _GENERIC: generic, _MISS: miss})
+    shape, _ = stats.shapes.most_common(1)[0]
+    fast_path = _generate_fast_path(static_specs, inline_hacks, shape)
+    if fast_path is None:
+        source = f'def {_FAST}(*args, **kwargs):\n    return {_GENERIC}(*args, **kwargs)'
+    else:
+        source, fast_path_namespace = fast_path
+        namespace.update(fast_path_namespace)
+        stats.specialized = shape
+    exec(source, namespace)  # noqa: S102  # pylint: disable=exec-used
+    return namespace[_FAST].__code__  # type: ignore[no-any-return]
+
+
+def _generate_fast_path(  # noqa: WPS231
+    static_specs: StaticArgSpecs,
+    inline_hacks: Mapping[ArgName, Callable[[Any], Any]],
+    shape: CallShape,
+) -> tuple[str, dict[str, Any]] | None:
+    """The source of the fast path and its namespace, or None if calls of this shape cannot be bound statically (e.g.
+    calls that raise TypeError, keyword values of positional only params) or processed inline (e.g. variable args)."""
+    plan = static_specs.binding_plan
+    positional_types, keyword_types = shape
+    n_args, keywords = len(positional_types), [name for name, _ in keyword_types]
+    namespace: dict[str, Any] = {_KEYWORDS: frozenset(keywords)}
+    guards = [f'len(args) != {n_args}', f'kwargs.keys() != {_KEYWORDS}' if keywords else 'kwargs']
+    keyword: dict[str, str] = {}  # The expressions of the values passed by keyword, by name
+
+    def add(prefix: str, value: Any) -> str:
+        name = f'__art_deco_{prefix}_{len(namespace)}__'
+        namespace[name] = value
+        return name
+
+    def process(arg: StaticArgSpec, value: str, cls: type | None) -> str:
+        if arg.name not in inline_hacks:
+            return value
+        hack = inline_hacks[arg.name]
+        specialize = getattr(hack, 'specialize', None)
+        if cls is None:
+            return f'{add("hack", hack)}({value})'
+        guards.append(f'type({value}) is not {add("type", cls)}')
+        return f'{add("hack", hack if specialize is None else specialize(cls))}({value})'
+
+    if n_args > len(plan.positional):
+        if plan.var_positional is None or plan.var_positional.name in inline_hacks:
+            return None
+    positional = [
+        process(arg, f'args[{i}]', cls) for i, (arg, cls) in enumerate(zip(plan.positional, positional_types))
+    ]
+    positional.extend(f'args[{i}]' for i in range(len(plan.positional), n_args))
+    bound_positionally = {arg.name for arg in plan.positional[:n_args]}
+    for name, cls in keyword_types:
+        arg = plan.by_name.get(name)
+        if arg is None or arg.kind in {ArgKind.VAR_POSITIONAL, ArgKind.VAR_KEYWORD}:
+            if plan.var_keyword is None or plan.var_keyword.name in inline_hacks:
+                return None
+            keyword[name] = f'kwargs[{name!r}]'
+        elif arg.kind is ArgKind.POSITIONAL_ONLY or name in bound_positionally:
+            return None  # Bound to **kwargs, or an error (multiple values)
+        else:
+            keyword[name] = process(arg, f'kwargs[{name!r}]', cls)
+    for arg in plan.positional[n_args:] + plan.keyword_only:
+        if arg.name in keyword:
+            continue
+        if not arg.has_default:
+            return None  # Missing argument
+        value = process(arg, add('default', arg.default_val), None)
+        if arg.kind is ArgKind.POSITIONAL_ONLY:  # Like the generic wrapper, which passes them positionally
+            positional.append(value)
+        elif arg.name in inline_hacks:
+            keyword[arg.name] = value
+    call_args = positional
+    if keyword:
+        call_args.append(f'**{{{", ".join(f"{name!r}: {value}" for name, value in keyword.items())}}}')
+    source = '\n'.join(
+        [
+            f'def {_FAST}(*args, **kwargs):',
+            f'    if {" or ".join(guards)}:',
+            f'        return {_MISS}(*args, **kwargs)',
+            f'    return {_WRAPPED}({", ".join(call_args)})',
+        ]
+    )
+    return source, namespace
@@ -1,14 +1,16 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Callable, Mapping, Tuple
+from typing import Any, Awaitable, Callable, Mapping, Optional, Tuple
 
 from typing_extensions import Protocol, runtime_checkable
 
 from art_deco.core.specs.dynamic_arg_specs import DynamicArgSpec, DynamicArgSpecs
 from art_deco.core.specs.static_arg_specs import StaticArgSpecs
+from art_deco.utils.slots import slotted
 
 
+@slotted()
 @dataclass
 class Context:
     static_args: StaticArgSpecs
@@ -17,7 +19,7 @@ class Context:
 
 ArgName = str
 ArgNames = Tuple[str, ...]
-MultiArgValidateFunc = Callable[..., None]
+MultiArgValidateFunc = Callable[..., Optional[Awaitable[None]]]  # Async checks are awaited for coroutine functions
 
 
 @runtime_checkable
@@ -30,3 +32,16 @@ class ArgsProcessor(Protocol):
 
     def get_wide_checks(self) -> Mapping[ArgNames, MultiArgValidateFunc]:
         ...  # noqa: WPS428  # pragma: no cover
+
+
+@runtime_checkable
+class SupportsInlineHacks(Protocol):
+    """Optional extension of :class:`ArgsProcessor` for processors that can process some arguments from their value
+    alone, i.e. independently of the dynamic specs and of the context of the call."""
+
+    def get_inline_hacks(self) -> Mapping[ArgName, Callable[[Any], Any]]:
+        """Value to value callables equivalent to ``process_arg`` for the arguments, by name."""
+        ...  # noqa: WPS428  # pragma: no cover
+
+    def get_wide_checks(self) -> Mapping[ArgNames, MultiArgValidateFunc]:
+        ...  # noqa: WPS428  # pragma: no cover
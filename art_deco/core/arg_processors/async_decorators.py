@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import inspect
+from typing import Any, Callable, TypeVar, cast
+
+import wrapt
+
+from art_deco.core.arg_processors.api import ArgsProcessor, Context
+from art_deco.core.arg_processors.async_processing import async_process
+from art_deco.core.arg_processors.dynamic_decorator import CacheKeyFunc, DynamicProcessors, bind_dynamic_call
+from art_deco.core.arg_processors.static_decorator import bind_call, create_static_processor, passthrough
+from art_deco.core.specs.static_arg_specs import StaticArgSpecs
+from art_deco.core.specs.static_inspector import ParseTypeHints
+
+_F = TypeVar('_F', bound=Callable)
+
+
+def async_static_process_args(
+    processor_factory: Callable[[StaticArgSpecs], ArgsProcessor],
+    *,
+    parse_type_hints: ParseTypeHints = True,
+) -> Callable[[_F], _F]:
+    """Like :func:`~art_deco.core.arg_processors.static_decorator.static_process_args`, for coroutine functions whose
+    processor may return awaitables, which are awaited concurrently (see
+    :func:`~art_deco.core.arg_processors.async_processing.async_process`).
+
+    The arguments are processed when the coroutine runs, rather than when the coroutine function is called.
+    """
+
+    def decorator(wrapped: _F) -> _F:
+        _check_coroutine_function(wrapped)
+        static_specs, processor, args_to_process = create_static_processor(wrapped, processor_factory, parse_type_hints)
+        if not args_to_process and not processor.get_wide_checks():
+            return cast(_F, passthrough(wrapped))  # pylint: disable=no-value-for-parameter
+        should_process_arg = args_to_process.__contains__
+        binding_plan = static_specs.binding_plan
+
+        @wrapt.decorator
+        async def wrapper(  # pylint: disable=too-many-locals
+            func: _F,
+            instance: Any | None,
+            args: tuple[Any, ...],
+            kwargs: dict[str, Any],
+        ) -> Any:
+            dynamic_specs, n_bound_args = bind_call(binding_plan, instance, args, kwargs)
+            context = Context(static_specs, dynamic_specs)
+            new_call = await async_process(processor, context, should_process_arg, n_bound_args)
+            if new_call is None:
+                return await func(*args, **kwargs)
+            new_args, new_kwargs = new_call
+            return await func(*new_args, **new_kwargs)
+
+        return cast(_F, wrapper(wrapped))  # pylint: disable=no-value-for-parameter
+
+    return decorator
+
+
+def async_dynamic_process_args(
+    processor_factory: Callable[[Context], ArgsProcessor],
+    *,
+    parse_type_hints: ParseTypeHints = True,
+    cache_key: CacheKeyFunc | None = None,
+    max_cached_processors: int = 128,
+) -> Callable[[_F], _F]:
+    """Like :func:`~art_deco.core.arg_processors.dynamic_decorator.dynamic_process_args`, for coroutine functions whose
+    processor may return awaitables, which are awaited concurrently."""
+    processors = DynamicProcessors(processor_factory, cache_key, max_cached_processors)
+
+    def decorator(wrapped: _F) -> _F:
+        _check_coroutine_function(wrapped)
+
+        @wrapt.decorator
+        async def wrapper(  # pylint: disable=too-many-locals
+            func: _F,
+            instance: Any | None,  # pylint: disable=unused-argument
+            args: tuple[Any, ...],
+            kwargs: dict[str, Any],
+        ) -> Any:
+            context = bind_dynamic_call(func, parse_type_hints, args, kwargs)
+            processor, should_process_arg = processors.get(context)
+            new_call = await async_process(processor, context, should_process_arg)
+            if new_call is None:
+                return await func(*args, **kwargs)
+            new_args, new_kwargs = new_call
+            return await func(*new_args, **new_kwargs)
+
+        return cast(_F, wrapper(wrapped))  # pylint: disable=no-value-for-parameter
+
+    return decorator
+
+
+def _check_coroutine_function(wrapped: Callable) -> None:
+    if not inspect.iscoroutinefunction(wrapped):
+        raise TypeError(f'{wrapped} must be a coroutine function (async def) to process its arguments asynchronously')
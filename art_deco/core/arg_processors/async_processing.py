@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+from functools import partial
+from typing import Any, Callable, Iterable
+
+from art_deco.core.arg_processors.api import ArgsProcessor, Context
+from art_deco.core.arg_processors.processing import (
+    ShouldProcessArg,
+    rebuild_call,
+    update_variable_arg,
+    variable_args_to_process,
+)
+
+
+async def async_process(
+    processor: ArgsProcessor,
+    context: Context,
+    should_process_arg: ShouldProcessArg,
+    n_bound_args: int = 0,
+) -> tuple[list, dict[str, Any]] | None:
+    """Like :func:`~art_deco.core.arg_processors.processing.process`, but the processor may return awaitables, from
+    ``process_arg`` (e.g. async hacks) or from its wide checks.
+
+    The awaitables of a stage are awaited concurrently, such that a stage takes as long as its slowest hack. The stages
+    still follow each other, since each one needs the values processed by the previous one: variable args, named args,
+    then wide checks.
+    """
+    var_specs = variable_args_to_process(context.dynamic_args, should_process_arg)
+    new_values = await _resolve_all(
+        partial(processor.process_arg, var_spec.combined_arg, context) for var_spec in var_specs
+    )
+    changed = False
+    for var_spec, new_val in zip(var_specs, new_values):
+        changed = update_variable_arg(var_spec, new_val) or changed
+
+    specs = [spec for spec in context.dynamic_args.args if should_process_arg(spec.name)]
+    new_values = await _resolve_all(partial(processor.process_arg, spec, context) for spec in specs)
+    for spec, new_val in zip(specs, new_values):  # noqa: WPS440
+        changed = changed or new_val is not spec.value
+        spec.value = new_val
+
+    args_by_name = context.dynamic_args.args_by_name
+    await _resolve_all(
+        partial(multi_arg_check, context, *[args_by_name[name].value for name in multi_args])
+        for multi_args, multi_arg_check in processor.get_wide_checks().items()
+    )
+    if not changed:
+        return None
+    return rebuild_call(context.dynamic_args, n_bound_args)
+
+
+async def _resolve_all(calls: Iterable[Callable[[], Any]]) -> list[Any]:
+    """Make the calls, in order, and await concurrently the awaitables they return.
+
+    Errors raised by the calls themselves are raised right away. Errors of the awaitables are raised once all of them
+    completed, the first one in the order of the calls (i.e. of the args), such that they don't depend on timings.
+    """
+    results: list[Any] = []
+    try:
+        for call in calls:
+            results.append(call())
+    except BaseException:
+        for result in results:
+            if inspect.iscoroutine(result):
+                result.close()  # Never awaited, close it to avoid warnings
+        raise
+    awaitables = {i: result for i, result in enumerate(results) if inspect.isawaitable(result)}
+    if awaitables:
+        resolved = await asyncio.gather(*awaitables.values(), return_exceptions=True)
+        for i, value in zip(awaitables, resolved):
+            if isinstance(value, BaseException):
+                raise value
+            results[i] = value
+    return results
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import inspect
+from functools import update_wrapper
+from itertools import islice
+from typing import AbstractSet, Any, Callable, Iterable, Mapping, TypeVar
+
+from art_deco.core.arg_processors.api import ArgName, ArgsProcessor, SupportsInlineHacks
+from art_deco.core.specs.static_arg_specs import ArgKind, StaticArgSpecs
+
+_F = TypeVar('_F', bound=Callable)
+
+_WRAPPED = '__art_deco_wrapped__'
+_REBUILD_VAR_POSITIONAL = '__art_deco_rebuild_var_positional__'
+_REBUILD_VAR_KEYWORD = '__art_deco_rebuild_var_keyword__'
+_COMPILED = '__art_deco_compiled__'
+_VAR_PREFIXES = {ArgKind.VAR_POSITIONAL: '*', ArgKind.VAR_KEYWORD: '**'}  # noqa: WPS407
+_VAR_REBUILDERS = {  # noqa: WPS407
+    ArgKind.VAR_POSITIONAL: _REBUILD_VAR_POSITIONAL,
+    ArgKind.VAR_KEYWORD: _REBUILD_VAR_KEYWORD,
+}
+
+
+def compile_wrapper(
+    wrapped: _F,
+    static_specs: StaticArgSpecs,
+    processor: ArgsProcessor,
+    args_to_process: AbstractSet[ArgName],
+) -> _F | None:
+    """Generate (via ``exec``, like ``dataclasses`` does for ``__init__``) a wrapper specialized to the signature of
+    ``wrapped`` that calls the inline hacks of the processor directly, without binding dynamic specs.
+
+    Returns None if the generated wrapper could not have the same semantics as the generic processing engine, namely
+    if:
+
+    - ``wrapped`` is not a plain (sync) function (e.g. classes, coroutine functions, callable objects)
+    - the processor has "wide" checks, since those take a :class:`Context` of the call
+    - the processor cannot provide an inline (i.e., value to value) hack for every argument to process
+    """
+    if not inspect.isfunction(wrapped) or inspect.iscoroutinefunction(wrapped):
+        return None
+    if not isinstance(processor, SupportsInlineHacks) or processor.get_wide_checks():
+        return None
+    inline_hacks = processor.get_inline_hacks()
+    if not args_to_process <= inline_hacks.keys():
+        return None
+    source, namespace = _generate_source(wrapped, static_specs, {name: inline_hacks[name] for name in args_to_process})
+    exec(source, namespace)  # noqa: S102  # pylint: disable=exec-used
+    return update_wrapper(namespace[_COMPILED], wrapped)  # type: ignore[no-any-return]
+
+
+def _generate_source(  # noqa: WPS231
+    wrapped: Callable,
+    static_specs: StaticArgSpecs,
+    inline_hacks: Mapping[ArgName, Callable[[Any], Any]],
+) -> tuple[str, dict[str, Any]]:
+    namespace: dict[str, Any] = {
+        _WRAPPED: wrapped,
+        _REBUILD_VAR_POSITIONAL: _rebuild_var_positional,
+        _REBUILD_VAR_KEYWORD: _rebuild_var_keyword,
+    }
+    kinds = [arg.kind for arg in static_specs.args]
+    last_positional_only = max((i for i, kind in enumerate(kinds) if kind is ArgKind.POSITIONAL_ONLY), default=-1)
+    params: list[str] = []
+    call_args: list[str] = []
+    body: list[str] = []
+    for i, arg in enumerate(static_specs.args):
+        if arg.kind is ArgKind.KEYWORD_ONLY and ArgKind.VAR_POSITIONAL not in kinds and '*' not in params:
+            params.append('*')
+        param = f'{_VAR_PREFIXES.get(arg.kind, "")}{arg.name}'
+        call_args.append(f'{arg.name}={arg.name}' if arg.kind is ArgKind.KEYWORD_ONLY else param)
+        if arg.has_default:
+            namespace[f'__art_deco_default_{i}__'] = arg.default_val
+            param = f'{param}=__art_deco_default_{i}__'
+        params.append(param)
+        if i == last_positional_only:
+            params.append('/')
+
+        if arg.name not in inline_hacks:
+            continue
+        hack = f'__art_deco_hack_{i}__'
+        namespace[hack] = inline_hacks[arg.name]
+        rebuild = _VAR_REBUILDERS.get(arg.kind)
+        if rebuild is None:
+            body.append(f'    {arg.name} = {hack}({arg.name})')
+        else:
+            # Variable arguments are only processed if there are values for them, like in the generic processing engine
+            body.append(f'    if {arg.name}:')
+            body.append(f'        {arg.name} = {rebuild}({arg.name}, {hack}({arg.name}))')
+    body.append(f'    return {_WRAPPED}({", ".join(call_args)})')
+    source = f'def {_COMPILED}({", ".join(params)}):\n' + '\n'.join(body)
+    return source, namespace
+
+
+def _rebuild_var_positional(old_values: tuple, new_values: Iterable) -> tuple:
+    """Replace the values of the variable positional arguments, in order, like the generic processing engine does."""
+    replaced = tuple(islice(new_values, len(old_values)))
+    return replaced + old_values[len(replaced) :]
+
+
+def _rebuild_var_keyword(old_values: dict[str, Any], new_values: Mapping[str, Any]) -> dict[str, Any]:
+    """Look up the new values of the variable keyword arguments, by name, like the generic processing engine does."""
+    return {name: new_values[name] for name in old_values}
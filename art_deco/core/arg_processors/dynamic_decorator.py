@@ -1,20 +1,40 @@
 from __future__ import annotations
 
-from typing import Any, Callable, TypeVar, cast
+from dataclasses import dataclass, field
+from typing import Any, Callable, Hashable, TypeVar, cast
 
 import wrapt
 
-from art_deco.core.arg_processors.api import ArgsProcessor, Context
-from art_deco.core.arg_processors.processing import process
+from art_deco.core.arg_processors.api import ArgName, ArgsProcessor, Context
+from art_deco.core.arg_processors.processing import ShouldProcessArg, process
 from art_deco.core.specs.dynamic_inspector import get_dynamic_arg_specs
-from art_deco.core.specs.static_inspector import ParseTypeHints, get_static_arg_specs
+from art_deco.core.specs.spec_cache import get_cached_static_arg_specs
+from art_deco.core.specs.static_arg_specs import StaticArgSpecs
+from art_deco.core.specs.static_inspector import ParseTypeHints
+from art_deco.utils.caching import LRUCache
 
 _F = TypeVar('_F', bound=Callable)
+CacheKeyFunc = Callable[[Context], Hashable]
 
 
 def dynamic_process_args(
-    processor_factory: Callable[[Context], ArgsProcessor], *, parse_type_hints: ParseTypeHints = True
+    processor_factory: Callable[[Context], ArgsProcessor],
+    *,
+    parse_type_hints: ParseTypeHints = True,
+    cache_key: CacheKeyFunc | None = None,
+    max_cached_processors: int = 128,
 ) -> Callable[[_F], _F]:
+    """Process the arguments of the decorated callable with a processor created when the callable is called.
+
+    :param processor_factory: creates the processor from the context of the call.
+    :param parse_type_hints: whether and how to parse the type hints into the static specs.
+    :param cache_key: by default, a new processor is created for every call. If given, it derives a key from the
+        context of the call (e.g. :func:`call_shape`) and the processors created for a key are reused for the next calls
+        with the same key. Reused processors are asked only once whether to process an argument.
+    :param max_cached_processors: maximum number of reusable processors, the least recently used are evicted first.
+    """
+    processors = DynamicProcessors(processor_factory, cache_key, max_cached_processors)
+
     @wrapt.decorator
     def wrapper(  # pylint: disable=too-many-locals
         func: _F,
@@ -22,18 +42,75 @@ def dynamic_process_args(
         args: tuple[Any, ...],
         kwargs: dict[str, Any],
     ) -> _F:
-        static_specs = get_static_arg_specs(func, parse_type_hints=parse_type_hints)
-        dynamic_specs = get_dynamic_arg_specs(static_specs, args, kwargs)
-        context = Context(static_specs, dynamic_specs)
-
-        processor = processor_factory(context)
-        assert isinstance(processor, ArgsProcessor)
-
-        new_args, new_kwargs = _process(processor, context)
+        context = bind_dynamic_call(func, parse_type_hints, args, kwargs)
+        processor, should_process_arg = processors.get(context)
+        new_call = process(processor, context, should_process_arg)
+        if new_call is None:  # Nothing changed, no need to copy args and kwargs
+            return cast(_F, func(*args, **kwargs))
+        new_args, new_kwargs = new_call
         return cast(_F, func(*new_args, **new_kwargs))
 
     return cast(Callable[[_F], _F], wrapper)
 
 
-def _process(processor: ArgsProcessor, context: Context) -> tuple[list, dict[str, Any]]:
-    return process(processor, context, processor.should_process_arg)
+def bind_dynamic_call(func: Callable, parse_type_hints: ParseTypeHints, args: tuple, kwargs: dict[str, Any]) -> Context:
+    """Inspect the called callable (cached) and bind the call."""
+    static_specs = get_cached_static_arg_specs(func, parse_type_hints=parse_type_hints)
+    return Context(static_specs, get_dynamic_arg_specs(static_specs, args, kwargs))
+
+
+class DynamicProcessors:
+    """Creates the processors of the calls, or reuses them if they have a cache key (see
+    :func:`dynamic_process_args`)."""
+
+    def __init__(
+        self,
+        processor_factory: Callable[[Context], ArgsProcessor],
+        cache_key: CacheKeyFunc | None,
+        max_cached_processors: int,
+    ) -> None:
+        self.processor_factory = processor_factory
+        self.cache_key = cache_key
+        self.processors: LRUCache[Hashable, _ReusableProcessor] = LRUCache(max_cached_processors)
+
+    def get(self, context: Context) -> tuple[ArgsProcessor, ShouldProcessArg]:
+        if self.cache_key is None:
+            processor = _create_processor(self.processor_factory, context)
+            return processor, processor.should_process_arg
+        static_specs = context.static_args
+        key = (id(static_specs), self.cache_key(context))  # The same processor factory may decorate many functions
+        reusable = self.processors.get(key)
+        if reusable is None:
+            reusable = _ReusableProcessor(static_specs, _create_processor(self.processor_factory, context))
+            self.processors.put(key, reusable)
+        return reusable.processor, reusable.should_process_arg
+
+
+def call_shape(context: Context) -> Hashable:
+    """Cache key of the calls that supply the same arguments in the same way (i.e. positionally or by keyword)."""
+    return tuple((arg.name, arg.called_as_kw) for arg in context.dynamic_args.args)
+
+
+def call_shape_and_types(context: Context) -> Hashable:
+    """Cache key of the calls that supply the same arguments, in the same way and with values of the same types."""
+    return tuple((arg.name, arg.called_as_kw, type(arg.value)) for arg in context.dynamic_args.args)
+
+
+def _create_processor(processor_factory: Callable[[Context], ArgsProcessor], context: Context) -> ArgsProcessor:
+    processor = processor_factory(context)
+    assert isinstance(processor, ArgsProcessor)
+    return processor
+
+
+@dataclass
+class _ReusableProcessor:
+    static_specs: StaticArgSpecs  # Kept alive such that its id, which is part of the cache key, is not reused
+    processor: ArgsProcessor
+    _should_process: dict[ArgName, bool] = field(default_factory=dict)
+
+    def should_process_arg(self, arg_name: ArgName) -> bool:
+        try:
+            return self._should_process[arg_name]
+        except KeyError:
+            should_process = self._should_process[arg_name] = self.processor.should_process_arg(arg_name)
+            return should_process
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, TypeVar, cast
+
+import wrapt
+
+_F = TypeVar('_F', bound=Callable)
+
+
+def lazy_decorator(decorator: Callable[[_F], _F]) -> Callable[[_F], _F]:
+    """Defer ``decorator`` to the first call of the decorated callable, such that decorating is almost free (e.g. at
+    import time) and the cost of inspecting the callable (signature, type hints...) is only paid by the callables that
+    are called.
+
+    The deferred decoration runs once, thread-safely, and its errors (e.g. invalid hacks) are raised by the calls,
+    until it succeeds. Only functions and methods are wrapped lazily, classes are decorated right away.
+    """
+
+    def lazy(wrapped: _F) -> _F:
+        if isinstance(wrapped, type):
+            return decorator(cast(_F, wrapped))
+        decorated: list[Callable] = []  # Filled once, by the first call
+        lock = threading.Lock()
+
+        def get_decorated() -> Callable:
+            if not decorated:
+                with lock:
+                    if not decorated:
+                        decorated.append(decorator(wrapped))
+            return decorated[0]
+
+        @wrapt.decorator
+        def wrapper(
+            func: _F,  # pylint: disable=unused-argument
+            instance: Any | None,
+            args: tuple[Any, ...],
+            kwargs: dict[str, Any],
+        ) -> Any:
+            real = get_decorated()
+            if instance is not None:  # Bind the decorated callable the way this wrapper was bound
+                real = real.__get__(instance, type(instance))  # noqa: WPS609
+            return real(*args, **kwargs)
+
+        return cast(_F, wrapper(wrapped))  # pylint: disable=no-value-for-parameter
+
+    return lazy
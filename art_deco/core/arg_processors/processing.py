@@ -1,46 +1,117 @@
 from __future__ import annotations
 
-from typing import Any, Callable
+from itertools import islice
+from typing import Any, Callable, Iterable
 
 from art_deco.core.arg_processors.api import ArgName, ArgsProcessor, Context
+from art_deco.core.specs.dynamic_arg_specs import DynamicArgSpec, DynamicArgSpecs, DynamicVarArgSpec
+from art_deco.core.specs.static_arg_specs import ArgKind
 
+ShouldProcessArg = Callable[[ArgName], bool]
 
-def process(  # pylint: disable=too-many-locals  # noqa: WPS231
+
+def process(
     processor: ArgsProcessor,
     context: Context,
-    should_process_arg: Callable[[str], bool],
-) -> tuple[list, dict[str, Any]]:
+    should_process_arg: ShouldProcessArg,
+    n_bound_args: int = 0,
+) -> tuple[list, dict[str, Any]] | None:
+    """Process the arguments of a call and rebuild the positional and keyword arguments to call the function with.
+
+    Every stage is a single pass over the dynamic specs, which index their args by name and variable arg when they are
+    created.
+
+    :param n_bound_args: number of leading positional args that are already bound to the callable (e.g. the instance of
+        a method), which are left out of the rebuilt args.
+    :return: None if the processor did not replace any value (i.e. it returned the very same objects), in which case
+        the function can be called with its original args and kwargs.
+    """
+    changed = process_variable_args(processor, context, should_process_arg)
+    changed = process_named_args(processor, context, should_process_arg) or changed
+    run_wide_checks(processor, context)
+    if not changed:
+        return None
+    return rebuild_call(context.dynamic_args, n_bound_args)
+
+
+def process_variable_args(processor: ArgsProcessor, context: Context, should_process_arg: ShouldProcessArg) -> bool:
+    """First pass: go through var args, whose values are only combined if the processor processes them.
+
+    Returns whether any value was replaced.
+    """
+    changed = False
+    for var_spec in variable_args_to_process(context.dynamic_args, should_process_arg):
+        new_values = processor.process_arg(var_spec.combined_arg, context)
+        changed = update_variable_arg(var_spec, new_values) or changed
+    return changed
+
+
+def variable_args_to_process(
+    dynamic_specs: DynamicArgSpecs,
+    should_process_arg: ShouldProcessArg,
+) -> list[DynamicVarArgSpec]:
+    """The variable args (e.g. ``*args``, ``**kwargs``) of the call to process, with their values combined."""
+    var_specs: list[DynamicVarArgSpec] = []
+    var_positional = dynamic_specs.var_positional_args
+    if var_positional and should_process_arg(var_positional[0].static.name):
+        var_args_spec = dynamic_specs.var_args_spec
+        assert var_args_spec is not None
+        var_specs.append(var_args_spec)
+    var_keyword = dynamic_specs.var_keyword_args
+    if var_keyword and should_process_arg(var_keyword[0].static.name):
+        var_kwargs_spec = dynamic_specs.var_kwargs_spec
+        assert var_kwargs_spec is not None
+        var_specs.append(var_kwargs_spec)
+    return var_specs
+
+
+def update_variable_arg(var_spec: DynamicVarArgSpec, new_values: Any) -> bool:
+    """Replace the values of the components of a variable arg, in order for ``*args`` and by name for ``**kwargs``.
+
+    Returns whether any value was replaced.
+    """
+    components = var_spec.components
+    new_components_values: Iterable[tuple[DynamicArgSpec, Any]]
+    if var_spec.combined_arg.static.kind is ArgKind.VAR_POSITIONAL:
+        new_components_values = zip(components, new_values)
+    else:
+        new_components_values = ((component, new_values[component.name]) for component in components)
+    changed = False
+    for component, new_val in new_components_values:
+        changed = changed or new_val is not component.value
+        component.value = new_val
+    return changed
+
+
+def process_named_args(processor: ArgsProcessor, context: Context, should_process_arg: ShouldProcessArg) -> bool:
+    """Second pass: go through individual args.
+
+    Returns whether any value was replaced.
+    """
+    changed = False
+    for spec in context.dynamic_args.args:
+        if should_process_arg(spec.name):
+            new_val = processor.process_arg(spec, context)
+            changed = changed or new_val is not spec.value
+            spec.value = new_val
+    return changed
+
+
+def rebuild_call(dynamic_specs: DynamicArgSpecs, n_bound_args: int = 0) -> tuple[list, dict[str, Any]]:
+    """Rebuild args and kwargs from the (processed) values of the dynamic specs, leaving out the first
+    ``n_bound_args`` positional args."""
     new_args: list = []
     new_kwargs: dict[ArgName, Any] = {}
-
-    dynamic_specs = context.dynamic_args
-    args_called_as_kw = dynamic_specs.args_called_as_kw
-
-    # First pass: go through var args
-    var_args_spec = dynamic_specs.var_args_spec
-    if var_args_spec is not None and should_process_arg(var_args_spec.combined_arg.name):
-        new_arg_values = processor.process_arg(var_args_spec.combined_arg, context)
-        for component, new_val in zip(var_args_spec.components, new_arg_values):
-            component.value = new_val
-    var_kwargs_spec = dynamic_specs.var_kwargs_spec
-    if var_kwargs_spec is not None and should_process_arg(var_kwargs_spec.combined_arg.name):
-        new_kwargs_values = processor.process_arg(var_kwargs_spec.combined_arg, context)
-        for component in var_kwargs_spec.components:  # noqa: WPS440
-            component.value = new_kwargs_values[component.name]
-
-    # Second pass: go through individual args
-    for arg_name, spec in dynamic_specs.args_by_name.items():
-        if should_process_arg(arg_name):
-            spec.value = processor.process_arg(spec, context)
-
-        # Rebuild args and kwargs
-        if arg_name in args_called_as_kw:
-            new_kwargs[arg_name] = spec.value
+    for spec in islice(dynamic_specs.args, n_bound_args, None):
+        if spec.called_as_kw:
+            new_kwargs[spec.name] = spec.value
         else:
             new_args.append(spec.value)
+    return new_args, new_kwargs
 
-    # Third pass: go through multi arg checks (i.e., "wide" validation checks across multiple args)
-    new_arg_specs = dynamic_specs.args_by_name
+
+def run_wide_checks(processor: ArgsProcessor, context: Context) -> None:
+    """Third pass: go through multi arg checks (i.e., "wide" validation checks across multiple args)."""
+    args_by_name = context.dynamic_args.args_by_name
     for multi_args, multi_arg_check in processor.get_wide_checks().items():
-        multi_arg_check(context, *[new_arg_specs[name].value for name in multi_args])
-    return new_args, new_kwargs
+        multi_arg_check(context, *[args_by_name[name].value for name in multi_args])
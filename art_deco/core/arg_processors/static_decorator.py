@@ -4,9 +4,13 @@ from typing import Any, Callable, TypeVar, cast
 
 import wrapt
 
+from art_deco.core.arg_processors.adaptive import adaptive_wrapper
 from art_deco.core.arg_processors.api import ArgName, ArgsProcessor, Context
+from art_deco.core.arg_processors.codegen import compile_wrapper
 from art_deco.core.arg_processors.processing import process
-from art_deco.core.specs.dynamic_inspector import get_dynamic_arg_specs
+from art_deco.core.arg_processors.threaded_processing import ThreadedProcessing
+from art_deco.core.specs.binding_plan import BindingPlan
+from art_deco.core.specs.dynamic_arg_specs import DynamicArgSpecs
 from art_deco.core.specs.static_arg_specs import StaticArgSpecs
 from art_deco.core.specs.static_inspector import ParseTypeHints, get_static_arg_specs
 
@@ -14,13 +18,47 @@ _F = TypeVar('_F', bound=Callable)
 
 
 def static_process_args(
-    processor_factory: Callable[[StaticArgSpecs], ArgsProcessor], *, parse_type_hints: ParseTypeHints = True
+    processor_factory: Callable[[StaticArgSpecs], ArgsProcessor],
+    *,
+    parse_type_hints: ParseTypeHints = True,
+    codegen: bool = False,
+    use_threads: bool = False,
+    adaptive: int = 0,
 ) -> Callable[[_F], _F]:
+    """Process the arguments of the decorated callable with a processor created once, at decoration time.
+
+    :param processor_factory: creates the processor from the static specs of the decorated callable.
+    :param parse_type_hints: whether and how to parse the type hints into the static specs.
+    :param codegen: opt in to a wrapper generated for the exact signature of the decorated function, which calls the
+        inline hacks of the processor (see :class:`SupportsInlineHacks`) directly. Falls back to the generic wrapper
+        whenever the generated one could not have the same semantics (see :func:`compile_wrapper`).
+    :param use_threads: opt in to run the independent hacks of each call concurrently in a shared thread pool, for
+        hacks that release the GIL. Cheap hacks still run inline (see :class:`ThreadedProcessing`).
+    :param adaptive: opt in to a wrapper which, after this number of (warm-up) calls, specializes a fast path for the
+        dominant shape of the calls (see :func:`adaptive_wrapper`). Falls back to the generic wrapper like ``codegen``.
+
+    If the processor has neither arguments to process nor wide checks, the decorated callable gets a passthrough
+    wrapper which forwards the arguments untouched.
+    """
+
+    if codegen and use_threads:
+        raise ValueError('Code generated wrappers (codegen=True) call the hacks inline, they cannot use threads')
+    if adaptive and (codegen or use_threads):
+        raise ValueError('Adaptive wrappers call the hacks inline, they cannot be combined with codegen or use_threads')
+    if adaptive < 0:
+        raise ValueError(f'The number of warm-up calls of adaptive wrappers must be positive, got {adaptive}')
+
     def decorator(wrapped: _F) -> _F:
-        static_specs = get_static_arg_specs(wrapped, parse_type_hints=parse_type_hints)
-        processor = processor_factory(static_specs)
-        assert isinstance(processor, ArgsProcessor)
-        args_to_process = {arg_name for arg_name in static_specs.args_by_name if processor.should_process_arg(arg_name)}
+        static_specs, processor, args_to_process = create_static_processor(wrapped, processor_factory, parse_type_hints)
+        if not args_to_process and not processor.get_wide_checks():
+            return cast(_F, passthrough(wrapped))  # pylint: disable=no-value-for-parameter
+        should_process_arg = args_to_process.__contains__
+        if codegen:
+            compiled = compile_wrapper(wrapped, static_specs, processor, args_to_process)
+            if compiled is not None:
+                return compiled
+        binding_plan = static_specs.binding_plan  # Per call, binding only executes the plan
+        process_call = ThreadedProcessing().process if use_threads else process
 
         @wrapt.decorator
         def wrapper(  # pylint: disable=too-many-locals
@@ -29,20 +67,61 @@ def static_process_args(
             args: tuple[Any, ...],
             kwargs: dict[str, Any],
         ) -> _F:
-            args = (instance, *args) if instance is not None else args
-            dynamic_specs = get_dynamic_arg_specs(static_specs, args, kwargs)
-            new_args, new_kwargs = _process(processor, Context(static_specs, dynamic_specs), args_to_process)
-            new_args = new_args[1:] if instance is not None else new_args
+            # Bound inline rather than with bind_call, which would add a frame to every call
+            if instance is None:
+                dynamic_specs, n_bound_args = binding_plan.bind(args, kwargs), 0
+            else:
+                dynamic_specs, n_bound_args = binding_plan.bind(args, kwargs, instance), 1
+            new_call = process_call(processor, Context(static_specs, dynamic_specs), should_process_arg, n_bound_args)
+            if new_call is None:  # Nothing changed, no need to copy args and kwargs
+                return cast(_F, func(*args, **kwargs))
+            new_args, new_kwargs = new_call
             return cast(_F, func(*new_args, **new_kwargs))
 
-        return cast(_F, wrapper(wrapped))  # pylint: disable=no-value-for-parameter
+        generic = cast(_F, wrapper(wrapped))  # pylint: disable=no-value-for-parameter
+        if adaptive:
+            specialized = adaptive_wrapper(wrapped, static_specs, processor, args_to_process, generic, adaptive)
+            if specialized is not None:
+                return specialized
+        return generic
 
     return decorator
 
 
-def _process(
-    processor: ArgsProcessor,
-    context: Context,
-    args_to_process: set[ArgName],
-) -> tuple[list, dict[str, Any]]:
-    return process(processor, context, lambda arg: arg in args_to_process)
+def create_static_processor(
+    wrapped: Callable,
+    processor_factory: Callable[[StaticArgSpecs], ArgsProcessor],
+    parse_type_hints: ParseTypeHints,
+) -> tuple[StaticArgSpecs, ArgsProcessor, frozenset[ArgName]]:
+    """Inspect the callable and create its processor, returning them with the names of the args to process."""
+    static_specs = get_static_arg_specs(wrapped, parse_type_hints=parse_type_hints)
+    processor = processor_factory(static_specs)
+    assert isinstance(processor, ArgsProcessor)
+    args_to_process = frozenset(
+        arg_name for arg_name in static_specs.args_by_name if processor.should_process_arg(arg_name)
+    )
+    return static_specs, processor, args_to_process
+
+
+def bind_call(
+    binding_plan: BindingPlan,
+    instance: Any | None,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> tuple[DynamicArgSpecs, int]:
+    """Bind the call, returning the dynamic specs with the number of leading args that are bound to the instance."""
+    if instance is None:
+        return binding_plan.bind(args, kwargs), 0
+    # The callable is bound to the instance, which is bound to the first parameter of the static specs
+    return binding_plan.bind(args, kwargs, instance), 1
+
+
+@wrapt.decorator
+def passthrough(
+    func: _F,
+    instance: Any | None,  # pylint: disable=unused-argument
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> _F:
+    """Wrapper of the callables which have nothing to process, it doesn't bind the arguments of the call."""
+    return cast(_F, func(*args, **kwargs))
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from time import perf_counter
+from typing import Any, Callable, TypeVar
+
+from art_deco.core.arg_processors.api import ArgNames, ArgsProcessor, Context, MultiArgValidateFunc
+from art_deco.core.arg_processors.processing import (
+    ShouldProcessArg,
+    process,
+    rebuild_call,
+    update_variable_arg,
+    variable_args_to_process,
+)
+from art_deco.core.specs.dynamic_arg_specs import DynamicArgSpec
+
+_T = TypeVar('_T')
+
+SHARED_EXECUTOR_MAX_WORKERS = min(32, (os.cpu_count() or 1) + 4)  # Default of ThreadPoolExecutor
+INLINE_COST_THRESHOLD = 100e-6  # Seconds, above the overhead of dispatching a few hacks to the threads and back
+_COST_SMOOTHING = 0.25
+
+_shared_executor: ThreadPoolExecutor | None = None
+_shared_executor_lock = threading.Lock()
+_worker_state = threading.local()
+
+
+def get_shared_executor() -> ThreadPoolExecutor:
+    """The bounded thread pool shared by every callable processed with threads, created on first use."""
+    global _shared_executor  # noqa: WPS420  # pylint: disable=global-statement
+    if _shared_executor is None:
+        with _shared_executor_lock:
+            if _shared_executor is None:
+                _shared_executor = ThreadPoolExecutor(  # noqa: WPS442
+                    max_workers=SHARED_EXECUTOR_MAX_WORKERS,
+                    thread_name_prefix='art_deco',
+                    initializer=_mark_worker,
+                )
+    return _shared_executor
+
+
+class ThreadedProcessing:
+    """Processes the arguments of the calls of a callable like
+    :func:`~art_deco.core.arg_processors.processing.process`, but runs the independent hacks of each stage (variable
+    args, named args, then wide checks) concurrently in the shared executor.
+
+    It keeps track of the average time spent in the hacks of a call, and processes the calls inline, with
+    :func:`~art_deco.core.arg_processors.processing.process`, while it is below ``inline_cost_threshold``, since
+    dispatching the hacks to the threads would then cost more than it saves. Hacks only run faster in threads if they
+    release the GIL (e.g. hashing, compression, I/O, NumPy).
+
+    Errors are deterministic: if hacks fail, the error of the first one in the order of the arguments is raised, once
+    every hack of the stage completed.
+    """
+
+    def __init__(
+        self,
+        executor_factory: Callable[[], ThreadPoolExecutor] = get_shared_executor,
+        inline_cost_threshold: float = INLINE_COST_THRESHOLD,
+    ) -> None:
+        self.executor_factory = executor_factory
+        self.inline_cost_threshold = inline_cost_threshold
+        # Smoothed time spent in the hacks of a call, the first calls are processed inline to measure it
+        self.cost = 0.0
+
+    def process(
+        self,
+        processor: ArgsProcessor,
+        context: Context,
+        should_process_arg: ShouldProcessArg,
+        n_bound_args: int = 0,
+    ) -> tuple[list, dict[str, Any]] | None:
+        # Hacks running in the workers are processed inline, workers waiting for workers could deadlock the pool
+        if self.cost < self.inline_cost_threshold or getattr(_worker_state, 'is_worker', False):
+            start = perf_counter()
+            new_call = process(processor, context, should_process_arg, n_bound_args)
+            self._add_cost(perf_counter() - start)
+            return new_call
+
+        def process_arg(spec: DynamicArgSpec) -> Any:
+            return processor.process_arg(spec, context)
+
+        var_specs = variable_args_to_process(context.dynamic_args, should_process_arg)
+        new_values, cost = self.run_all(process_arg, [var_spec.combined_arg for var_spec in var_specs])
+        changed = False
+        for var_spec, new_val in zip(var_specs, new_values):
+            changed = update_variable_arg(var_spec, new_val) or changed
+
+        specs = [spec for spec in context.dynamic_args.args if should_process_arg(spec.name)]
+        new_values, named_args_cost = self.run_all(process_arg, specs)
+        for spec, new_val in zip(specs, new_values):  # noqa: WPS440
+            changed = changed or new_val is not spec.value
+            spec.value = new_val
+
+        args_by_name = context.dynamic_args.args_by_name
+
+        def run_wide_check(wide_check: tuple[ArgNames, MultiArgValidateFunc]) -> None:
+            multi_args, multi_arg_check = wide_check
+            multi_arg_check(context, *[args_by_name[name].value for name in multi_args])
+
+        _, wide_checks_cost = self.run_all(run_wide_check, list(processor.get_wide_checks().items()))
+        self._add_cost(cost + named_args_cost + wide_checks_cost)
+        if not changed:
+            return None
+        return rebuild_call(context.dynamic_args, n_bound_args)
+
+    def run_all(self, func: Callable[[_T], Any], items: list[_T]) -> tuple[list[Any], float]:
+        """Call ``func`` on every item, concurrently if there are several of them, returning the results in order with
+        the total time spent in the calls."""
+        if len(items) < 2:
+            results_and_durations = [_timed(func, item) for item in items]
+        else:
+            executor = self.executor_factory()
+            futures: list[Future[tuple[Any, float]]] = [executor.submit(_timed, func, item) for item in items]
+            errors = [future.exception() for future in futures]  # Waits for every call
+            for error in errors:
+                if error is not None:
+                    raise error
+            results_and_durations = [future.result() for future in futures]
+        return [result for result, _ in results_and_durations], sum(duration for _, duration in results_and_durations)
+
+    def _add_cost(self, cost: float) -> None:
+        self.cost += _COST_SMOOTHING * (cost - self.cost)
+
+
+def _timed(func: Callable[[_T], Any], item: _T) -> tuple[Any, float]:
+    start = perf_counter()
+    result = func(item)
+    return result, perf_counter() - start
+
+
+def _mark_worker() -> None:
+    _worker_state.is_worker = True
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import builtins
+import threading
+import types
+from dataclasses import dataclass, field
+from typing import Any, Callable, Tuple
+
+from typing_extensions import get_type_hints
+
+from art_deco.utils.caching import CacheStats
+
+_MISSING = object()
+_Snapshot = Tuple[Tuple[str, Any], ...]  # The values of the global names an annotation referenced when evaluated
+
+
+@dataclass(frozen=True)
+class _Evaluated:
+    globalns: dict[str, Any]  # Held, such that its id is not reused by other globals while the entry exists
+    snapshot: _Snapshot
+    value: Any
+
+
+@dataclass
+class AnnotationsCache:
+    """Process-wide cache of the annotation strings (e.g. with ``from __future__ import annotations``) evaluated in the
+    globals of their module, such that the functions of a module evaluate each distinct annotation once.
+
+    Entries are keyed by the identity of the globals and the string. They are invalidated whenever one of the global
+    names referenced by the annotation (e.g. ``Annotated``, ``hack_x`` in ``'Annotated[int, hack_x]'``) is rebound,
+    deleted or defined (shadowing a builtin).
+    """
+
+    maxsize: int = 4096
+    stats: CacheStats = field(default_factory=CacheStats)
+    _entries: dict[tuple[int, str], _Evaluated] = field(default_factory=dict, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def evaluate(self, annotation: str, globalns: dict[str, Any]) -> Any:
+        """Evaluate the annotation string in the globals, or return the value evaluated by a previous call.
+
+        :raises NameError: like :func:`typing.get_type_hints`, if the annotation references undefined names.
+        """
+        key = (id(globalns), annotation)
+        entry = self._entries.get(key)
+        if entry is not None and entry.globalns is globalns:
+            if _is_unchanged(entry.snapshot, globalns):
+                self.stats.hits += 1
+                return entry.value
+            self.stats.invalidations += 1
+        self.stats.misses += 1
+        code = compile(annotation, '<annotation>', 'eval')
+        value = eval(code, globalns)  # noqa: S307, WPS421  # Like typing.ForwardRef._evaluate
+        entry = _Evaluated(globalns, _snapshot(code.co_names, globalns), value)
+        with self._lock:
+            if len(self._entries) >= self.maxsize:
+                self._entries.clear()  # Annotations are evaluated at decoration time, mostly once per module
+            self._entries[key] = entry
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+        self.stats.reset()
+
+
+ANNOTATIONS_CACHE = AnnotationsCache()
+
+
+def get_cached_type_hints(func: Callable, *, include_extras: bool = False) -> dict[str, Any]:
+    """Like :func:`typing.get_type_hints`, but the annotation strings of functions are evaluated through
+    :data:`ANNOTATIONS_CACHE`.
+
+    The evaluated annotations are handed to :func:`typing.get_type_hints` on a copy of the function, which keeps its
+    semantics (e.g. ``Optional`` defaults before python 3.11, stripping ``Annotated`` without ``include_extras``).
+    """
+    unwrapped = func
+    while hasattr(unwrapped, '__wrapped__'):
+        unwrapped = unwrapped.__wrapped__
+    annotations = getattr(func, '__annotations__', None)
+    if not isinstance(func, types.FunctionType) or not annotations:
+        return get_type_hints(func, include_extras=include_extras)
+    globalns = getattr(unwrapped, '__globals__', {})
+    evaluated = {
+        name: ANNOTATIONS_CACHE.evaluate(value, globalns) if isinstance(value, str) else value
+        for name, value in annotations.items()
+    }
+    copy = types.FunctionType(func.__code__, globalns, func.__name__, func.__defaults__, func.__closure__)
+    copy.__kwdefaults__ = func.__kwdefaults__
+    copy.__annotations__ = evaluated
+    return get_type_hints(copy, include_extras=include_extras)
+
+
+def _snapshot(names: tuple[str, ...], globalns: dict[str, Any]) -> _Snapshot:
+    builtins_ns = _builtins_of(globalns)
+    return tuple((name, _lookup(name, globalns, builtins_ns)) for name in names)
+
+
+def _is_unchanged(snapshot: _Snapshot, globalns: dict[str, Any]) -> bool:
+    builtins_ns = _builtins_of(globalns)
+    return all(_lookup(name, globalns, builtins_ns) is value for name, value in snapshot)
+
+
+def _lookup(name: str, globalns: dict[str, Any], builtins_ns: dict[str, Any]) -> Any:
+    return globalns[name] if name in globalns else builtins_ns.get(name, _MISSING)
+
+
+def _builtins_of(globalns: dict[str, Any]) -> dict[str, Any]:
+    builtins_ns = globalns.get('__builtins__', builtins.__dict__)
+    if isinstance(builtins_ns, types.ModuleType):
+        return builtins_ns.__dict__
+    return builtins_ns  # type: ignore[no-any-return]
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Type
+
+from art_deco.core.specs.dynamic_arg_specs import DynamicArgSpec, DynamicArgSpecs
+from art_deco.core.specs.static_arg_specs import ArgKind, StaticArgSpec, StaticArgSpecs
+
+VAR_POSITIONAL_AUTO_NAME = '__art_deco_auto_name__{}'
+NO_INSTANCE: Any = object()
+
+
+@dataclass(frozen=True)
+class BindingPlan:
+    """Index tables derived once from the static specs, such that binding a call only has to execute them.
+
+    The tables follow the order in which Python binds the arguments of a call:
+
+    1. ``positional``: the positional slots (positional only, then positional or keyword parameters)
+    2. ``var_positional``: the slot that collects the extra positional values (e.g. ``*args``)
+    3. ``keyword_only``: parameters that can only be supplied by keyword
+    4. ``var_keyword``: the slot that collects the extra keyword values (e.g. ``**kwargs``)
+
+    Parameters that are not supplied by the caller are filled in with their default values.
+    """
+
+    static_specs: StaticArgSpecs
+    positional: tuple[StaticArgSpec, ...]
+    n_positional_only: int
+    keyword_only: tuple[StaticArgSpec, ...]
+    var_positional: StaticArgSpec | None
+    var_keyword: StaticArgSpec | None
+    by_name: dict[str, StaticArgSpec]
+
+    @classmethod
+    def from_static_specs(cls: Type[BindingPlan], static_specs: StaticArgSpecs) -> BindingPlan:
+        positional = tuple(arg for arg in static_specs.args if arg.positionable_and_non_var)
+        return cls(
+            static_specs=static_specs,
+            positional=positional,
+            n_positional_only=sum(arg.kind is ArgKind.POSITIONAL_ONLY for arg in positional),
+            keyword_only=tuple(arg for arg in static_specs.args if arg.kind is ArgKind.KEYWORD_ONLY),
+            var_positional=static_specs.var_positional,
+            var_keyword=static_specs.var_keyword,
+            by_name={arg.name: arg for arg in static_specs.args},
+        )
+
+    @property
+    def has_variable_args(self) -> bool:
+        return self.var_positional is not None or self.var_keyword is not None
+
+    def bind(self, args: tuple, kwargs: dict[str, Any], instance: Any = NO_INSTANCE) -> DynamicArgSpecs:
+        """Bind the static parameters to the values which each argument was called with.
+
+        :param instance: the object a method is bound to, if any. It is bound to the first positional parameter, as if
+            it was the first value of ``args``, without re-packing ``args``.
+        """
+        if instance is NO_INSTANCE:
+            bound_args = []
+        elif not self.positional:
+            # E.g. ``def method(*args)``, where the instance is the first variable positional value
+            return self.bind((instance, *args), kwargs)
+        else:
+            first = self.positional[0]
+            bound_args = [DynamicArgSpec(first.name, instance, False, first)]
+        if kwargs:
+            return self._bind_with_kwargs(bound_args, args, kwargs)
+        return self._bind_positionally(bound_args, args)
+
+    def _bind_positionally(self, dynamic_args: list[DynamicArgSpec], args: tuple) -> DynamicArgSpecs:
+        """Fast path for calls without keyword arguments: every positional slot is matched by index."""
+        n_bound = len(dynamic_args)
+        n_args, n_positional_only = n_bound + len(args), self.n_positional_only
+        dynamic_args.extend(
+            DynamicArgSpec(arg.name, value, False, arg) for arg, value in zip(self.positional[n_bound:], args)
+        )
+        if n_args < len(self.positional):
+            # Positional only arguments that rely on defaults must still be passed positionally
+            relying_on_defaults = self.positional[n_args:n_positional_only]
+            dynamic_args.extend(DynamicArgSpec(arg.name, arg.default_val, False, arg) for arg in relying_on_defaults)
+        elif n_args > len(self.positional):
+            dynamic_args.extend(self._bind_var_positional(args[len(self.positional) - n_bound :]))
+        dynamic_args.extend(
+            DynamicArgSpec(arg.name, arg.default_val, True, arg)
+            for arg in self.positional[max(n_args, n_positional_only) :] + self.keyword_only
+        )
+        return DynamicArgSpecs(dynamic_args)
+
+    def _bind_with_kwargs(
+        self,
+        dynamic_args: list[DynamicArgSpec],
+        args: tuple,
+        kwargs: dict[str, Any],
+    ) -> DynamicArgSpecs:
+        # 1. Positional arguments fill, in order, the positional slots that are not supplied by keyword
+        n_bound = len(dynamic_args)
+        named_positional_args = [arg for arg in self.positional[n_bound:] if arg.name not in kwargs]
+        dynamic_args.extend(
+            DynamicArgSpec(arg.name, value, False, arg) for arg, value in zip(named_positional_args, args)
+        )
+        bound_positionally = {arg.name for arg in dynamic_args}
+        args_using_defaults = [
+            arg
+            for arg in self.positional + self.keyword_only
+            if arg.name not in bound_positionally and arg.name not in kwargs
+        ]
+        dynamic_args.extend(
+            DynamicArgSpec(arg.name, arg.default_val, False, arg)
+            for arg in args_using_defaults
+            if arg.kind is ArgKind.POSITIONAL_ONLY
+        )
+        # 2. Variable positional arguments
+        if len(args) > len(named_positional_args):
+            dynamic_args.extend(self._bind_var_positional(args[len(named_positional_args) :]))
+        # 3. and 4. Keyword arguments, whether they are named in the signature or go in the variable keyword argument
+        for arg_name, arg_val in kwargs.items():
+            static_spec = self.by_name.get(arg_name, self.var_keyword)
+            assert static_spec is not None
+            dynamic_args.append(DynamicArgSpec(arg_name, arg_val, True, static_spec))
+        # 5. Defaults of arguments that are not positional only are passed as keyword arguments
+        dynamic_args.extend(
+            DynamicArgSpec(arg.name, arg.default_val, True, arg)
+            for arg in args_using_defaults
+            if arg.kind is not ArgKind.POSITIONAL_ONLY
+        )
+        return DynamicArgSpecs(dynamic_args)
+
+    def _bind_var_positional(self, values: tuple) -> list[DynamicArgSpec]:
+        """Bind the values to made-up names since we don't have individual names for them, all of them sharing the
+        same static "args" object."""
+        var_positional = self.var_positional
+        assert var_positional is not None
+        return [
+            DynamicArgSpec(VAR_POSITIONAL_AUTO_NAME.format(i), val, False, var_positional)
+            for i, val in enumerate(values)
+        ]
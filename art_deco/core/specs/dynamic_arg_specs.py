@@ -1,13 +1,15 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Generic, TypeVar
+from dataclasses import dataclass, field
+from typing import Generic, Sequence, TypeVar
 
 from art_deco.core.specs.static_arg_specs import ArgKind, StaticArgSpec
+from art_deco.utils.slots import slotted
 
 _T = TypeVar('_T')
 
 
+@slotted()
 @dataclass(frozen=False)
 class DynamicArgSpec(Generic[_T]):
     name: str
@@ -20,33 +22,66 @@ class DynamicArgSpec(Generic[_T]):
         return self.value is self.static.default_val
 
 
+@slotted()
 @dataclass(frozen=True)
 class DynamicVarArgSpec:
     combined_arg: DynamicArgSpec
-    components: list[DynamicArgSpec]
+    components: Sequence[DynamicArgSpec]
 
 
+@slotted()
 @dataclass(frozen=True)
 class DynamicArgSpecs:
+    """The arguments of a call, bound to the static specs.
+
+    Built once per call, so it only indexes its args (e.g. by name) on first access and shares empty indexes.
+    """
+
     args: list[DynamicArgSpec]
+    _by_name: dict[str, DynamicArgSpec] | None = field(init=False, repr=False, compare=False)
+    _var_positional: Sequence[DynamicArgSpec] = field(init=False, repr=False, compare=False)
+    _var_keyword: Sequence[DynamicArgSpec] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, '_by_name', None)  # noqa: WPS609  # frozen dataclass
+        object.__setattr__(self, '_var_positional', ())  # noqa: WPS609
+        object.__setattr__(self, '_var_keyword', ())  # noqa: WPS609
+        for arg in self.args:
+            kind = arg.static.kind
+            if kind is ArgKind.VAR_POSITIONAL:
+                self._add_var_arg('_var_positional', arg)
+            elif kind is ArgKind.VAR_KEYWORD:
+                self._add_var_arg('_var_keyword', arg)
 
     @property
     def args_by_name(self) -> dict[str, DynamicArgSpec]:
-        return {arg.name: arg for arg in self.args}
+        by_name = self._by_name
+        if by_name is None:
+            by_name = {arg.name: arg for arg in self.args}
+            object.__setattr__(self, '_by_name', by_name)  # noqa: WPS609  # frozen dataclass
+        return by_name
 
     @property
     def args_called_as_kw(self) -> list[str]:
         return [arg.name for arg in self.args if arg.called_as_kw]
 
+    @property
+    def var_positional_args(self) -> Sequence[DynamicArgSpec]:
+        """The components of the variable positional arg (e.g. ``*args``), in order."""
+        return self._var_positional
+
+    @property
+    def var_keyword_args(self) -> Sequence[DynamicArgSpec]:
+        """The components of the variable keyword arg (e.g. ``**kwargs``), in order."""
+        return self._var_keyword
+
     @property
     def var_args_spec(self) -> DynamicVarArgSpec | None:
-        args = [arg for arg in self.args if arg.static.kind is ArgKind.VAR_POSITIONAL]
+        args = self._var_positional
         if not args:
             return None
-        static_arg_names = list({arg.static.name for arg in args})
-        assert len(static_arg_names) == 1
         combined_spec = DynamicArgSpec(
-            name=static_arg_names[0],
+            name=args[0].static.name,
             value=tuple(arg.value for arg in args),
             called_as_kw=False,
             static=args[0].static,
@@ -55,15 +90,20 @@ class DynamicArgSpecs:
 
     @property
     def var_kwargs_spec(self) -> DynamicVarArgSpec | None:
-        args = [arg for arg in self.args if arg.static.kind is ArgKind.VAR_KEYWORD]
+        args = self._var_keyword
         if not args:
             return None
-        static_arg_names = list({arg.static.name for arg in args})
-        assert len(static_arg_names) == 1
         combined_spec = DynamicArgSpec(
-            name=static_arg_names[0],
+            name=args[0].static.name,
             value={arg.name: arg.value for arg in args},
             called_as_kw=True,
             static=args[0].static,
         )
         return DynamicVarArgSpec(combined_spec, args)
+
+    def _add_var_arg(self, index_name: str, arg: DynamicArgSpec) -> None:
+        index = getattr(self, index_name)
+        if not index:  # The shared empty index is only replaced for calls that have variable args
+            index = []
+            object.__setattr__(self, index_name, index)  # noqa: WPS609  # frozen dataclass
+        index.append(arg)
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import threading
+import weakref
+from functools import partial
+from inspect import Signature
+from typing import Any, Callable, Hashable, Sequence, TypeVar
+
+from art_deco.core.specs.static_arg_specs import StaticArgSpec, StaticArgSpecs
+
+_T = TypeVar('_T')
+
+_SPEC_TABLE: weakref.WeakValueDictionary[Hashable, StaticArgSpec] = weakref.WeakValueDictionary()
+_SPECS_TABLE: weakref.WeakValueDictionary[Hashable, StaticArgSpecs] = weakref.WeakValueDictionary()
+_ATOMS = frozenset((type(None), bool, int, str, bytes))
+_FLOATS = frozenset((float, complex))  # Compared by repr, since 0.0 == -0.0
+_IDENTITY = object()
+_lock = threading.RLock()  # Creating a value may intern others (e.g. hacks decorating functions)
+
+
+def intern_static_specs(args: Sequence[StaticArgSpec], sig: Signature) -> StaticArgSpecs:
+    """The static specs of the args, shared with the callables that have structurally identical specs (flyweights),
+    along with their binding plan, such that many callables with the same signature hold a single copy of them.
+
+    Specs are identical when their args, and the parameters of their signatures, have the same names, kinds,
+    annotations and defaults. Annotations and defaults are compared by exact type and value if they are immutable
+    atoms (or tuples of them), else by identity (see :func:`_value_key`), such that a callable never gets a default of
+    another one that is merely equal. The specs live as long as one of their callables does.
+    """
+    interned_args = [intern_weakly(_SPEC_TABLE, _spec_key(arg), _returning(arg)) for arg in args]
+    key = (tuple(map(id, interned_args)), _signature_key(sig))
+    return intern_weakly(_SPECS_TABLE, key, partial(StaticArgSpecs, interned_args, sig))
+
+
+def intern_weakly(table: weakref.WeakValueDictionary[Hashable, _T], key: Hashable, create: Callable[[], _T]) -> _T:
+    """The value of the key in the weak table, created (once, thread-safely) if there is none alive."""
+    interned = table.get(key)
+    if interned is None:
+        with _lock:
+            interned = table.get(key)
+            if interned is None:
+                table[key] = interned = create()
+    return interned
+
+
+def _returning(value: _T) -> Callable[[], _T]:
+    return lambda: value
+
+
+def _spec_key(arg: StaticArgSpec) -> Hashable:
+    return arg.name, arg.kind, _value_key(arg.annotation), _value_key(arg.default_val)
+
+
+def _signature_key(sig: Signature) -> Hashable:
+    params = tuple(
+        (param.name, param.kind, _value_key(param.annotation), _value_key(param.default))
+        for param in sig.parameters.values()
+    )
+    return params, _value_key(sig.return_annotation)
+
+
+def _value_key(value: Any) -> Hashable:
+    """Equal keys for values that are interchangeable: immutable atoms of the exact same type and value, or tuples and
+    frozensets of them, else the very same object (e.g. ``True`` is not ``1``, ``0.0`` is not ``-0.0``, timezone aware
+    datetimes equal across timezones are not interchangeable)."""
+    cls = value.__class__
+    if cls in _ATOMS:
+        return cls, value
+    if cls in _FLOATS:
+        return cls, repr(value)
+    if cls is tuple:
+        return cls, tuple(map(_value_key, value))
+    if cls is frozenset:
+        return cls, frozenset(map(_value_key, value))
+    return _IDENTITY, id(value)  # The spec holds the value, so its id is not reused while the spec is interned
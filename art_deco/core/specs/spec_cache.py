@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import inspect
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, Tuple
+from weakref import WeakKeyDictionary
+
+from art_deco.core.specs.static_arg_specs import StaticArgSpecs
+from art_deco.core.specs.static_inspector import ParseTypeHints, get_static_arg_specs
+from art_deco.utils.caching import CacheStats
+
+_EntryKey = Tuple[bool, Hashable]  # (is bound method, how to parse type hints)
+
+
+@dataclass(frozen=True)
+class _Fingerprint:
+    """What the static specs of a function are derived from, other than its module globals."""
+
+    code: Any
+    defaults: tuple | None
+    kwdefaults: dict[str, Any] | None
+    annotations: dict[str, Any]
+
+    @classmethod
+    def of(cls, func: Any) -> _Fingerprint:
+        return cls(func.__code__, func.__defaults__, func.__kwdefaults__, dict(func.__annotations__))
+
+    def matches(self, func: Any) -> bool:
+        return (
+            func.__code__ is self.code
+            and func.__defaults__ is self.defaults
+            and func.__kwdefaults__ is self.kwdefaults
+            and func.__annotations__ == self.annotations
+        )
+
+
+@dataclass(frozen=True)
+class _Entry:
+    fingerprint: _Fingerprint
+    static_specs: StaticArgSpecs
+
+
+@dataclass
+class StaticSpecsCache:
+    """Static specs of plain functions and methods, weakly keyed by the function.
+
+    An entry is invalidated when the ``__code__``, ``__annotations__``, ``__defaults__`` or ``__kwdefaults__`` of the
+    function change. Other callables (e.g. classes, callable objects, ``functools.partial``) are not cached.
+    """
+
+    stats: CacheStats = field(default_factory=CacheStats)
+    _entries: WeakKeyDictionary[Callable, Dict[_EntryKey, _Entry]] = field(
+        default_factory=WeakKeyDictionary, init=False, repr=False
+    )
+    _lock: Lock = field(default_factory=Lock, init=False, repr=False)
+
+    def get(self, func: Callable, *, parse_type_hints: ParseTypeHints) -> StaticArgSpecs:
+        target = func.__func__ if inspect.ismethod(func) else func  # type: ignore[attr-defined]
+        if not inspect.isfunction(target) or not isinstance(parse_type_hints, Hashable):
+            self.stats.misses += 1
+            return get_static_arg_specs(func, parse_type_hints=parse_type_hints)
+        key = (target is not func, parse_type_hints)
+        entry = self._entries.get(target, {}).get(key)
+        if entry is not None and entry.fingerprint.matches(target):
+            self.stats.hits += 1
+            return entry.static_specs
+        self.stats.misses += 1
+        if entry is not None:
+            self.stats.invalidations += 1
+        fingerprint = _Fingerprint.of(target)  # Before inspecting, so that a concurrent change invalidates the entry
+        static_specs = get_static_arg_specs(func, parse_type_hints=parse_type_hints)
+        with self._lock:
+            self._entries.setdefault(target, {})[key] = _Entry(fingerprint, static_specs)
+        return static_specs
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+        self.stats.reset()
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in list(self._entries.values()))
+
+
+STATIC_SPECS_CACHE = StaticSpecsCache()
+
+
+def get_cached_static_arg_specs(func: Callable, *, parse_type_hints: ParseTypeHints) -> StaticArgSpecs:
+    """Same as :func:`get_static_arg_specs` but inspects each function only once (see :class:`StaticSpecsCache`)."""
+    return STATIC_SPECS_CACHE.get(func, parse_type_hints=parse_type_hints)
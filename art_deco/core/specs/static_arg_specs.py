@@ -1,9 +1,14 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from inspect import Signature
-from typing import Any, Type
+from typing import TYPE_CHECKING, Any, Type, cast
+
+from art_deco.utils.slots import slotted
+
+if TYPE_CHECKING:
+    from art_deco.core.specs.binding_plan import BindingPlan  # pragma: no cover
 
 
 class Sentinels(Enum):
@@ -29,6 +34,7 @@ class ArgKind(Enum):
         return str(self)
 
 
+@slotted('__weakref__')  # Interned in weak tables, see art_deco.core.specs.interning
 @dataclass(frozen=True)
 class StaticArgSpec:
     name: str
@@ -53,47 +59,70 @@ class StaticArgSpec:
         return self.kind in {ArgKind.POSITIONAL_OR_KEYWORD, ArgKind.POSITIONAL_ONLY}
 
 
+@slotted('__weakref__')
 @dataclass(frozen=True)
 class StaticArgSpecs:
+    """The inspected parameters of a callable.
+
+    The derived views (e.g. ``args_by_name``) are computed once, when the specs are created, so ``args`` must not be
+    mutated afterwards.
+    """
+
     args: list[StaticArgSpec]
     sig: Signature  # This is to expose the internals, if anyone wants to use the built-in function result
+    _args_by_name: dict[str, StaticArgSpec] = field(init=False, repr=False, compare=False)
+    _positionable_and_non_var: dict[str, StaticArgSpec] = field(init=False, repr=False, compare=False)
+    _var_positional: StaticArgSpec | None = field(init=False, repr=False, compare=False)
+    _var_keyword: StaticArgSpec | None = field(init=False, repr=False, compare=False)
+    _variable_args: list[str] = field(init=False, repr=False, compare=False)
+    _binding_plan: BindingPlan | None = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        if len(self._variable_positional_args) not in {0, 1}:
+        variable_positional_args = [arg for arg in self.args if arg.kind is ArgKind.VAR_POSITIONAL]
+        variable_keyword_args = [arg for arg in self.args if arg.kind is ArgKind.VAR_KEYWORD]
+        if len(variable_positional_args) not in {0, 1}:
             raise AssertionError('Can take at most one variable positional param (e.g. *args)')
-        if len(self._variable_positional_args) not in {0, 1}:
+        if len(variable_keyword_args) not in {0, 1}:
             raise AssertionError('Can take at most one variable keyword-only param (e.g. **kwargs)')
+        derived_views = {
+            '_args_by_name': {arg.name: arg for arg in self.args},
+            '_positionable_and_non_var': {arg.name: arg for arg in self.args if arg.positionable_and_non_var},
+            '_var_positional': variable_positional_args[0] if variable_positional_args else None,
+            '_var_keyword': variable_keyword_args[0] if variable_keyword_args else None,
+            '_variable_args': [arg.name for arg in variable_positional_args + variable_keyword_args],
+            '_binding_plan': None,  # Built on first access
+        }
+        for name, view in derived_views.items():
+            object.__setattr__(self, name, view)  # noqa: WPS609  # frozen dataclass
 
     @property
     def positionable_and_non_var(self) -> dict[str, StaticArgSpec]:
         """Args that may be called positionally but not as part of a variable positional arg."""
-        return {arg.name: arg for arg in self.args if arg.positionable_and_non_var}
+        return self._positionable_and_non_var
 
     @property
     def var_positional(self) -> StaticArgSpec | None:
-        if not self._variable_positional_args:
-            return None
-        return self._variable_positional_args[0]
+        return self._var_positional
 
     @property
     def var_keyword(self) -> StaticArgSpec | None:
-        if not self._variable_keyword_args:
-            return None
-        return self._variable_keyword_args[0]
+        """Variable keyword arg (e.g. ``**kwargs``)."""
+        return self._var_keyword
 
     @property
     def variable_args(self) -> list[str]:
-        return [arg.name for arg in self._variable_positional_args + self._variable_keyword_args]
+        return self._variable_args
 
     @property
     def args_by_name(self) -> dict[str, StaticArgSpec]:
-        return {arg.name: arg for arg in self.args}
-
-    @property
-    def _variable_positional_args(self) -> list[StaticArgSpec]:
-        return [arg for arg in self.args if arg.kind is ArgKind.VAR_POSITIONAL]
+        return self._args_by_name
 
     @property
-    def _variable_keyword_args(self) -> list[StaticArgSpec]:
-        """Variable positional kwargs."""
-        return [arg for arg in self.args if arg.kind is ArgKind.VAR_KEYWORD]
+    def binding_plan(self) -> BindingPlan:
+        """The plan to bind calls to these specs, built on first access."""
+        if self._binding_plan is None:
+            # pylint: disable=import-outside-toplevel  # circular import
+            from art_deco.core.specs.binding_plan import BindingPlan  # noqa: WPS433
+
+            object.__setattr__(self, '_binding_plan', BindingPlan.from_static_specs(self))  # noqa: WPS609
+        return cast('BindingPlan', self._binding_plan)
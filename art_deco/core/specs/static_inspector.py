@@ -3,6 +3,7 @@ from __future__ import annotations
 import inspect
 from typing import Callable, Type, Union
 
+from art_deco.core.specs.interning import intern_static_specs
 from art_deco.core.specs.static_arg_specs import ArgKind, Sentinels, StaticArgSpec, StaticArgSpecs
 from art_deco.core.specs.type_hints_parsers import TypeHintsParser
 from art_deco.utils.inspection_utils import get_callable_arg_names
@@ -40,4 +41,4 @@ def get_static_arg_specs(func: Callable, *, parse_type_hints: ParseTypeHints) ->
         for param_name, param in inspected_signature.parameters.items()
         if param_name in arg_names
     ]
-    return StaticArgSpecs(arg_specs, inspected_signature)
+    return intern_static_specs(arg_specs, inspected_signature)
@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, Callable
 
-from typing_extensions import get_type_hints
+from art_deco.core.specs.annotation_cache import get_cached_type_hints
 
 
 @dataclass
@@ -11,10 +11,10 @@ class TypeHintsParser:
     func: Callable
 
     def parse(self) -> dict[str, Any]:
-        return get_type_hints(self.func)
+        return get_cached_type_hints(self.func)
 
 
 @dataclass
 class ExtrasTypeHintsParser(TypeHintsParser):
     def parse(self) -> dict[str, Any]:
-        return get_type_hints(self.func, include_extras=True)
+        return get_cached_type_hints(self.func, include_extras=True)
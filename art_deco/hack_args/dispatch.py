@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from functools import singledispatch
+from typing import Any, Callable, Mapping
+
+from art_deco.hack_args.marks import arg_hacker
+
+Converter = Callable[[Any], Any]
+
+
+def dispatch_arg_hacker(converters: Mapping[type, Converter]) -> Converter:
+    """A single arg hack (see :func:`~art_deco.hack_args.marks.arg_hacker`) converting each value with the converter
+    of its type, replacing ``isinstance`` chains:
+
+    .. code-block:: python
+
+        to_float = dispatch_arg_hacker({str: parse_float, int: float, float: identity})
+
+    The converter of a type is resolved like :func:`functools.singledispatch` does, along the MRO of the type (and
+    the abstract base classes it is registered with), such that ``bool`` values use the converter of ``int`` unless
+    there is one for ``bool``. Converting values of types without a converter raises TypeError, register one for
+    ``object`` to handle any value.
+
+    Resolutions are cached by exact type, so that converting a value costs a dict lookup and the converter call. The
+    cache is exposed as the ``dispatch_cache`` attribute of the hack. Since it is never invalidated, the converters
+    and the abstract base class registrations must not change after the first conversions. The ``specialize(cls)``
+    method of the hack returns the converter of a type, which adaptive wrappers call directly (see
+    :func:`~art_deco.core.arg_processors.adaptive.adaptive_wrapper`).
+    """
+    dispatcher = singledispatch(_no_converter)
+    for cls, converter in converters.items():
+        dispatcher.register(cls, converter)
+    dispatch_cache: dict[type, Converter] = {}
+
+    def dispatching_hack(value: Any) -> Any:
+        try:
+            converter = dispatch_cache[value.__class__]
+        except KeyError:  # Resolving the same type concurrently is harmless, both threads cache the same converter
+            converter = dispatch_cache[value.__class__] = dispatcher.dispatch(value.__class__)
+        return converter(value)
+
+    dispatching_hack.dispatch_cache = dispatch_cache  # type: ignore[attr-defined]
+    dispatching_hack.specialize = dispatcher.dispatch  # type: ignore[attr-defined]
+    return arg_hacker(dispatching_hack)
+
+
+def _no_converter(value: Any) -> Any:
+    raise TypeError(f'No converter for {value!r} of type {value.__class__.__qualname__}')
@@ -1,13 +1,21 @@
 from __future__ import annotations
 
-from typing import Callable, TypeVar
+import inspect
+from functools import wraps
+from typing import Any, Callable, Hashable, TypeVar
+
+from art_deco.utils.caching import LRUCache
 
 _F = TypeVar('_F', bound=Callable)
+_MISSING = object()
 
 
 class Marks:
     single_arg = '__art_deco__arg_hack_with_specs__'
     many_args = '__art_deco__args_hack__'
+    preprocess_default = '__art_deco__preprocess_default__'
+    asynchronous = '__art_deco__async_hack__'
+    process_pool = '__art_deco__process_pool_hack__'
 
 
 def arg_hacker(func: _F) -> _F:
@@ -15,6 +23,73 @@ def arg_hacker(func: _F) -> _F:
     return func
 
 
+def async_arg_hacker(func: _F) -> _F:
+    """Like :func:`arg_hacker`, for hacks returning awaitables (e.g. coroutine functions), which are awaited
+    concurrently with the other hacks of the call. They can only hack the arguments of coroutine functions."""
+    setattr(func, Marks.single_arg, False)
+    setattr(func, Marks.asynchronous, True)
+    return func
+
+
+def process_pool_hacker(func: _F) -> _F:
+    """Like :func:`arg_hacker`, for CPU heavy hacks that run in the process pool shared by all the decorated
+    functions (see :func:`~art_deco.utils.process_pool.submit_to_process_pool`). Sync functions wait for the result
+    while coroutine functions await it.
+
+    The hack and the values it processes, and returns, must be picklable (e.g. a module level function).
+    """
+    setattr(func, Marks.single_arg, False)
+    setattr(func, Marks.process_pool, True)
+    return func
+
+
+def memoized_arg_hacker(
+    maxsize: int | None = 128,
+    *,
+    maxbytes: int | None = None,
+    ttl: float | None = None,
+    key: Callable[[Any], Hashable] | None = None,
+) -> Callable[[_F], _F]:
+    """Like :func:`arg_hacker`, for deterministic hacks that are often called with the same values (e.g. enum names,
+    config keys), whose results are cached per hack in an :class:`~art_deco.utils.caching.LRUCache` bounded by
+    ``maxsize`` entries and/or ``maxbytes`` bytes, with an optional ``ttl`` in seconds.
+
+    Values are cached by type and value (``1`` and ``1.0`` are different keys), unless a ``key`` function maps them
+    to a hashable key (e.g. for lists). Unhashable values without a ``key`` function are always processed. The cache,
+    and its hit/miss/eviction counters, are exposed as the ``cache`` attribute of the hack.
+
+    The hack is shared by every call, so it must not return values that the decorated functions mutate.
+    """
+
+    def decorator(func: _F) -> _F:
+        if inspect.iscoroutinefunction(func) or getattr(func, Marks.asynchronous, False):
+            raise TypeError(f'{func} is asynchronous, its results (awaitables) can not be memoized')
+        if getattr(func, Marks.process_pool, False):
+            raise TypeError(f'{func} runs in the process pool, memoize it before marking it with process_pool_hacker')
+        if getattr(func, Marks.single_arg, False):
+            raise TypeError(f'{func} is called with the specs of the argument, its results can not be cached by value')
+        cache: LRUCache[Hashable, Any] = LRUCache(maxsize, maxbytes=maxbytes, ttl=ttl)
+        make_key = key
+
+        @wraps(func)
+        def memoized_hack(value: Any) -> Any:
+            try:
+                cache_key = (value.__class__, value) if make_key is None else make_key(value)
+                result = cache.get(cache_key, _MISSING)
+            except TypeError:  # Unhashable value
+                return func(value)
+            if result is _MISSING:
+                result = func(value)
+                cache.put(cache_key, result)
+            return result
+
+        memoized_hack.cache = cache  # type: ignore[attr-defined]
+        setattr(memoized_hack, Marks.single_arg, False)
+        return memoized_hack  # type: ignore[return-value]
+
+    return decorator
+
+
 def arg_hacker_with_specs(func: _F) -> _F:
     setattr(func, Marks.single_arg, True)
     return func
@@ -23,3 +98,13 @@ def arg_hacker_with_specs(func: _F) -> _F:
 def wide_validator(func: _F) -> _F:
     setattr(func, Marks.many_args, True)
     return func
+
+
+def preprocess_default(func: _F) -> _F:
+    """Mark a single arg hack whose result on the default value of the argument can be computed once, when the
+    processor is created, and reused by every call relying on the default (see ``hack_args(preprocess_defaults=...)``).
+
+    The hack must then be deterministic, since it is not called again for the default value.
+    """
+    setattr(func, Marks.preprocess_default, True)
+    return func
@@ -1,27 +1,41 @@
 from __future__ import annotations
 
+import asyncio
+import inspect
+import weakref
 from collections import defaultdict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from enum import Enum
 from functools import partial
-from typing import Any, Callable, Mapping, Type, TypeVar, Union, cast
+from typing import Any, Callable, Hashable, Mapping, Sequence, Type, TypeVar, Union, cast
 
 from typing_extensions import TypeGuard
 
 from art_deco.core.arg_processors.api import ArgName, ArgNames, Context, MultiArgValidateFunc
+from art_deco.core.arg_processors.async_decorators import async_dynamic_process_args, async_static_process_args
 from art_deco.core.arg_processors.dynamic_decorator import dynamic_process_args
+from art_deco.core.arg_processors.lazy import lazy_decorator
 from art_deco.core.arg_processors.static_decorator import static_process_args
 from art_deco.core.specs.dynamic_arg_specs import DynamicArgSpec
-from art_deco.core.specs.static_arg_specs import StaticArgSpecs
+from art_deco.core.specs.interning import intern_weakly
+from art_deco.core.specs.spec_cache import get_cached_static_arg_specs
+from art_deco.core.specs.static_arg_specs import ArgKind, StaticArgSpecs
 from art_deco.core.specs.static_inspector import ParseTypeHints, get_static_arg_specs
 from art_deco.core.specs.type_hints_parsers import ExtrasTypeHintsParser
-from art_deco.hack_args.marks import Marks
+from art_deco.hack_args.marks import Marks, arg_hacker, arg_hacker_with_specs, preprocess_default
+from art_deco.utils.process_pool import submit_to_process_pool
 from art_deco.utils.typing_utils import is_annotated
 
 _F = TypeVar('_F', bound=Callable)
 SingleArgHackFuncDirect = Callable[[Any], Any]  # The value is passed directly
 SingleArgHackFuncWithSpec = Callable[[StaticArgSpecs, DynamicArgSpec], Any]  # Pass static specs and dynamic spec
 SingleArgHackFunc = Union[SingleArgHackFuncWithSpec, SingleArgHackFuncDirect]
-ExplicitHacks = Mapping[Union[ArgName, ArgNames], Union[SingleArgHackFunc, MultiArgValidateFunc]]
+SingleArgHacks = Union[SingleArgHackFunc, Sequence[SingleArgHackFunc]]  # A hack or a chain of hacks, see fuse_hacks
+ExplicitHacks = Mapping[Union[ArgName, ArgNames], Union[SingleArgHacks, MultiArgValidateFunc]]
+
+_IMMUTABLE_ATOMS = frozenset((type(None), bool, int, float, complex, str, bytes))
+
+_PROCESSORS: weakref.WeakValueDictionary[Hashable, HackArgProcessor] = weakref.WeakValueDictionary()
 
 
 def hack_args(
@@ -29,26 +43,86 @@ def hack_args(
     *,
     parse_type_hints: ParseTypeHints = True,
     is_dynamic: bool = False,
+    codegen: bool = False,
+    preprocess_defaults: bool = False,
+    use_threads: bool = False,
+    lazy: bool = False,
+    adaptive: int = 0,
 ) -> Callable[[_F], _F]:
+    """Process the arguments of the decorated callable with the given hacks and the ones found in its ``Annotated``
+    type hints.
+
+    :param hacks: explicit hacks, by argument name (single arg hacks) or tuple of argument names (wide validators).
+        A list of single arg hacks is run in order, like several hacks annotated on the same argument (see
+        :func:`fuse_hacks`).
+    :param parse_type_hints: whether and how to parse the type hints into the static specs.
+    :param is_dynamic: create the processor when the callable is first called instead of when it is decorated.
+    :param codegen: see :func:`static_process_args`.
+    :param use_threads: see :func:`static_process_args`. Coroutine functions await their async hacks concurrently
+        instead.
+    :param preprocess_defaults: run every single arg hack on the default value of its argument once, when the
+        processor is created, instead of on every call relying on the default. Hacks can also opt in individually with
+        :func:`~art_deco.hack_args.marks.preprocess_default`. The processed default is shared by all calls, so it is only
+        kept if both the default and its processed value are of known immutable types (None, bool, numbers, str, bytes,
+        enum members, and tuples or frozensets of those). Other defaults, e.g. those processed into lists, dicts or
+        regular dataclasses, are still processed on every call, such that a call mutating them cannot affect the next.
+    :param lazy: in static mode, inspect the callable (signature, type hints) and create its processor when it is first
+        called instead of when it is decorated, to cut the import time of modules with many decorated functions. Errors
+        in the hacks are then raised by the first call (see :func:`lazy_decorator`).
+    :param adaptive: see :func:`static_process_args`.
+
+    The arguments of coroutine functions can also be hacked asynchronously, with hacks marked with
+    :func:`~art_deco.hack_args.marks.async_arg_hacker` and async wide validators, which are awaited concurrently (see
+    :func:`~art_deco.core.arg_processors.async_decorators.async_static_process_args`).
+    """
+    if is_dynamic and codegen:
+        raise ValueError('Code generated wrappers (codegen=True) are only available in static mode (is_dynamic=False)')
+    if is_dynamic and use_threads:
+        raise ValueError(
+            'Processing with threads (use_threads=True) is only available in static mode (is_dynamic=False)'
+        )
+    if is_dynamic and adaptive:
+        raise ValueError('Adaptive wrappers (adaptive=...) are only available in static mode (is_dynamic=False)')
+    if is_dynamic and lazy:
+        raise ValueError('The dynamic mode (is_dynamic=True) already creates the processor lazily, on the first call')
     split_hacks = _SplitHacks.from_explicit_hacks(hacks)
 
     if is_dynamic:
 
         def decorator(func: _F) -> _F:
-            return dynamic_process_args(  # pylint: disable=no-value-for-parameter  # false positive due to wrapt
-                partial(dynamic_processor_factory, wrapped=func, split_hacks=split_hacks),
+            process_args = async_dynamic_process_args if inspect.iscoroutinefunction(func) else dynamic_process_args
+            return process_args(  # pylint: disable=no-value-for-parameter  # false positive due to wrapt
+                partial(
+                    dynamic_processor_factory,
+                    wrapped=func,
+                    split_hacks=split_hacks,
+                    preprocess_defaults=preprocess_defaults,
+                ),
                 parse_type_hints=parse_type_hints,
+                cache_key=_reuse_for_all_calls,
             )(func)
 
     else:
 
         def decorator(func: _F) -> _F:  # noqa: WPS440
             extras_static_specs = get_static_arg_specs(func, parse_type_hints=ExtrasTypeHintsParser)
+            is_async = inspect.iscoroutinefunction(func)
+            factory = partial(
+                static_processor_factory,
+                extras_static_specs=extras_static_specs,
+                split_hacks=split_hacks,
+                preprocess_defaults=preprocess_defaults,
+                is_async=is_async,
+            )
+            if is_async:
+                return async_static_process_args(factory, parse_type_hints=parse_type_hints)(func)
             return static_process_args(
-                partial(static_processor_factory, extras_static_specs=extras_static_specs, split_hacks=split_hacks),
-                parse_type_hints=parse_type_hints,
+                factory, parse_type_hints=parse_type_hints, codegen=codegen, use_threads=use_threads, adaptive=adaptive
             )(func)
 
+        if lazy:
+            return lazy_decorator(decorator)
+
     return decorator
 
 
@@ -65,7 +139,10 @@ class _SplitHacks:
         multi_arg_hacks: dict[ArgNames, MultiArgValidateFunc] = {}
         for key, value in hacks.items():
             if isinstance(key, str):
-                single_arg_hacks[key] = cast(SingleArgHackFunc, value)
+                if isinstance(value, (list, tuple)):
+                    single_arg_hacks[key] = fuse_hacks(cast(Sequence[SingleArgHackFunc], value))
+                else:
+                    single_arg_hacks[key] = cast(SingleArgHackFunc, value)
             else:
                 multi_arg_hacks[key] = cast(MultiArgValidateFunc, value)
         return cls(single_arg_hacks, multi_arg_hacks)
@@ -75,19 +152,52 @@ def static_processor_factory(
     static_specs: StaticArgSpecs,
     extras_static_specs: StaticArgSpecs,
     split_hacks: _SplitHacks,
+    preprocess_defaults: bool = False,
+    is_async: bool = False,
 ) -> HackArgProcessor:
     single_hacks, multi_checks = collect_hacks(extras_static_specs, split_hacks)
-    return HackArgProcessor(static_specs, single_hacks, multi_checks)
+    if not is_async:
+        _check_no_async_hacks(single_hacks, multi_checks)
+    # Callables with identical specs and hacks share their processor, like their (interned) specs
+    key = (
+        id(static_specs),
+        tuple((name, id(func)) for name, func in single_hacks.items()),
+        tuple((names, id(func)) for names, func in multi_checks.items()),
+        preprocess_defaults,
+        is_async,
+    )
+    return intern_weakly(
+        _PROCESSORS,
+        key,
+        partial(HackArgProcessor, static_specs, single_hacks, multi_checks, preprocess_defaults, is_async),
+    )
 
 
 def dynamic_processor_factory(
     context: Context,
     split_hacks: _SplitHacks,
     wrapped: _F,
+    preprocess_defaults: bool = False,
 ) -> HackArgProcessor:
-    extras_static_specs = get_static_arg_specs(wrapped, parse_type_hints=ExtrasTypeHintsParser)
+    extras_static_specs = get_cached_static_arg_specs(wrapped, parse_type_hints=ExtrasTypeHintsParser)
     single_hacks, multi_checks = collect_hacks(extras_static_specs, split_hacks)
-    return HackArgProcessor(context.static_args, single_hacks, multi_checks)
+    is_async = inspect.iscoroutinefunction(wrapped)
+    if not is_async:
+        _check_no_async_hacks(single_hacks, multi_checks)
+    return HackArgProcessor(context.static_args, single_hacks, multi_checks, preprocess_defaults, is_async)
+
+
+def _check_no_async_hacks(
+    single_hacks: Mapping[ArgName, SingleArgHackFunc],
+    multi_checks: Mapping[ArgNames, MultiArgValidateFunc],
+) -> None:
+    async_hacks = [func for func in (*single_hacks.values(), *multi_checks.values()) if is_async_hack(func)]
+    if async_hacks:
+        raise TypeError(f'Async hacks {async_hacks} can only hack the arguments of coroutine functions (async def)')
+
+
+def _reuse_for_all_calls(_: Context) -> None:
+    """The dynamic processor only depends on the static specs, which are already part of the processor cache key."""
 
 
 def collect_hacks(  # noqa: WPS231
@@ -101,9 +211,10 @@ def collect_hacks(  # noqa: WPS231
             continue
         hint = arg.annotation
         if is_annotated(hint) and hasattr(hint, '__metadata__'):  # noqa: WPS421
+            chain = [ann_arg for ann_arg in hint.__metadata__ if is_hack_arg_func(ann_arg)]
+            if chain:
+                annotated_single_hacks[arg.name] = fuse_hacks(chain)
             for ann_arg in hint.__metadata__:
-                if is_hack_arg_func(ann_arg):
-                    annotated_single_hacks[arg.name] = ann_arg  # noqa: WPS220
                 if is_hack_args_func(ann_arg):
                     annotated_multi_hacks[ann_arg].append(arg.name)  # noqa: WPS220
     annotated_multi_hacks_by_args = {tuple(value): key for key, value in annotated_multi_hacks.items()}
@@ -117,9 +228,53 @@ class HackArgProcessor:
     static_specs: StaticArgSpecs
     single_hacks: Mapping[ArgName, SingleArgHackFunc]
     multi_checks: Mapping[ArgNames, MultiArgValidateFunc]
+    preprocess_defaults: bool = False
+    is_async: bool = False  # Whether the hacks offloaded to the process pool should return awaitables
+    preprocessed_defaults: dict[ArgName, Any] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Process once the defaults of the arguments whose hack is preprocessed (see ``hack_args``)."""
+        self.preprocessed_defaults = {}
+        for name, func in self.single_hacks.items():
+            arg = self.static_specs.args_by_name.get(name)
+            if arg is None or not arg.has_default or not _is_immutable(arg.default_val) or is_async_hack(func):
+                continue  # The awaitable returned by an async hack could only be awaited once
+            if self.preprocess_defaults or is_preprocessed_default_hack(func):
+                default_spec = DynamicArgSpec(name, arg.default_val, arg.kind is not ArgKind.POSITIONAL_ONLY, arg)
+                processed = self._run_hack(func, default_spec, wait=True)
+                if _is_immutable(processed):  # Otherwise, a call mutating it would leak its changes to the next calls
+                    self.preprocessed_defaults[name] = processed
 
     def process_arg(self, arg: DynamicArgSpec, _: Context) -> Any:
-        func = self.single_hacks[arg.name]
+        if arg.name in self.preprocessed_defaults and arg.is_default:
+            return self.preprocessed_defaults[arg.name]
+        return self._run_hack(self.single_hacks[arg.name], arg)
+
+    def should_process_arg(self, arg: str) -> bool:
+        return arg in self.single_hacks
+
+    def get_wide_checks(self) -> Mapping[ArgNames, MultiArgValidateFunc]:
+        return self.multi_checks
+
+    def get_inline_hacks(self) -> Mapping[ArgName, SingleArgHackFuncDirect]:
+        """Hacks marked with ``arg_hacker`` only need the value of the argument, so they can be called inline."""
+        inline_hacks: dict[ArgName, SingleArgHackFuncDirect] = {}
+        for name, func in self.single_hacks.items():
+            if not is_hack_arg_without_specs(func) or is_async_hack(func) or is_process_pool_hack(func):
+                continue
+            if name in self.preprocessed_defaults:
+                func = _with_preprocessed_default(  # noqa: WPS440
+                    func, self.static_specs.args_by_name[name].default_val, self.preprocessed_defaults[name]
+                )
+            inline_hacks[name] = func
+        return inline_hacks
+
+    def _run_hack(self, func: SingleArgHackFunc, arg: DynamicArgSpec, wait: bool = False) -> Any:
+        if is_process_pool_hack(func):
+            future = submit_to_process_pool(cast(SingleArgHackFuncDirect, func), arg.value)
+            if self.is_async and not wait:
+                return asyncio.wrap_future(future)
+            return future.result()
         if is_hack_arg_without_specs(func):
             return func(arg.value)
         if is_hack_arg_with_specs(func):
@@ -128,11 +283,89 @@ class HackArgProcessor:
             f'Need to mark hack function {func} for arg {arg} with a mark from the art_deco.hack_args.marks module'
         )
 
-    def should_process_arg(self, arg: str) -> bool:
-        return arg in self.single_hacks
 
-    def get_wide_checks(self) -> Mapping[ArgNames, MultiArgValidateFunc]:
-        return self.multi_checks
+def fuse_hacks(chain: Sequence[SingleArgHackFunc]) -> SingleArgHackFunc:
+    """Compose a chain of single arg hacks, which run in order, each one on the value returned by the previous one,
+    into a single hack, such that a chain of N hacks costs N calls.
+
+    The fused hack is marked like :func:`~art_deco.hack_args.marks.arg_hacker`, and can then be called inline, unless
+    one of the hacks needs the specs (:func:`~art_deco.hack_args.marks.arg_hacker_with_specs`). Those hacks get the
+    dynamic spec of the argument, or, once an earlier hack changed the value, a copy of it holding the value processed
+    so far, which is allocated once per call and updated for the next hacks. The fused hack preprocesses the default
+    value if all the hacks of the chain do.
+    """
+    if len(chain) == 1:
+        return chain[0]
+    offloaded = [func for func in chain if is_async_hack(func) or is_process_pool_hack(func)]
+    if offloaded:
+        raise TypeError(f'Async and process pool hacks {offloaded} return futures, they cannot be chained')
+    hacks = tuple(chain)
+    # The hacks needing the specs, each preceded by the direct hacks running before it (fused), then the last ones
+    segments: list[tuple[SingleArgHackFuncDirect | None, SingleArgHackFuncWithSpec]] = []
+    direct: list[SingleArgHackFuncDirect] = []
+    for func in hacks:
+        if is_hack_arg_without_specs(func):
+            direct.append(func)
+        else:
+            segments.append((_fuse_direct_hacks(direct), cast(SingleArgHackFuncWithSpec, func)))
+            direct = []
+    if not segments:
+        fused_hack: SingleArgHackFunc = arg_hacker(_compile_chain(direct))
+    else:
+        stages, tail = tuple(segments), _fuse_direct_hacks(direct)
+
+        def fused_with_specs(static_specs: StaticArgSpecs, spec: DynamicArgSpec) -> Any:
+            value = spec.value
+            staged = spec  # The spec of the call is not modified, the copy is allocated once and reused
+            for direct_hacks, hack in stages:
+                if direct_hacks is not None:
+                    value = direct_hacks(value)
+                if value is not staged.value:
+                    if staged is spec:
+                        staged = DynamicArgSpec(spec.name, value, spec.called_as_kw, spec.static)
+                    else:
+                        staged.value = value
+                value = hack(static_specs, staged)
+            return value if tail is None else tail(value)
+
+        fused_hack = arg_hacker_with_specs(fused_with_specs)
+    if all(is_preprocessed_default_hack(func) for func in hacks):
+        preprocess_default(fused_hack)
+    return fused_hack
+
+
+def _fuse_direct_hacks(hacks: Sequence[SingleArgHackFuncDirect]) -> SingleArgHackFuncDirect | None:
+    if len(hacks) <= 1:
+        return hacks[0] if hacks else None
+    return _compile_chain(hacks)
+
+
+def _compile_chain(hacks: Sequence[SingleArgHackFuncDirect]) -> SingleArgHackFuncDirect:
+    """Generate (like :mod:`art_deco.core.arg_processors.codegen`) the nested calls of the hacks, without a loop."""
+    namespace = {f'__art_deco_hack_{i}__': hack for i, hack in enumerate(hacks)}
+    call = 'value'
+    for name in namespace:
+        call = f'{name}({call})'
+    exec(f'def fused(value):\n    return {call}', namespace)  # noqa: S102  # pylint: disable=exec-used
+    return namespace['fused']  # type: ignore[return-value]
+
+
+def _with_preprocessed_default(func: SingleArgHackFuncDirect, default: Any, processed: Any) -> SingleArgHackFuncDirect:
+    def hack_or_preprocessed_default(value: Any) -> Any:
+        return processed if value is default else func(value)
+
+    return hack_or_preprocessed_default
+
+
+def _is_immutable(value: Any) -> bool:
+    """Whether the value is of a known immutable type, checked recursively for tuples and frozensets. Hashable values
+    are not necessarily immutable (e.g. classes with ``__hash__``), so they are not trusted. Enum members are shared
+    singletons anyway."""
+    if value.__class__ in _IMMUTABLE_ATOMS or isinstance(value, Enum):
+        return True
+    if value.__class__ in {tuple, frozenset}:
+        return all(_is_immutable(item) for item in value)
+    return False
 
 
 def is_hack_arg_func(func: Any) -> bool:
@@ -156,3 +389,15 @@ def is_hack_arg_without_specs(func: Any) -> TypeGuard[SingleArgHackFuncDirect]:
 def is_hack_arg_with_specs(func: Any) -> TypeGuard[SingleArgHackFuncWithSpec]:
     mark = Marks.single_arg
     return hasattr(func, mark) and getattr(func, mark)  # noqa: WPS421
+
+
+def is_preprocessed_default_hack(func: Any) -> bool:
+    return getattr(func, Marks.preprocess_default, False)  # type: ignore[no-any-return]
+
+
+def is_async_hack(func: Any) -> bool:
+    return getattr(func, Marks.asynchronous, False) or inspect.iscoroutinefunction(func)  # type: ignore[no-any-return]
+
+
+def is_process_pool_hack(func: Any) -> bool:
+    return getattr(func, Marks.process_pool, False)  # type: ignore[no-any-return]
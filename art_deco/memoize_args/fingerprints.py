@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import hashlib
+from typing import AbstractSet, Any, Callable, Hashable, Tuple, cast
+
+from art_deco.core.specs.dynamic_arg_specs import DynamicArgSpecs
+
+_Fingerprint = Tuple[Hashable, ...]
+_UNHASHABLE = object()  # Leads the fingerprints of unhashable values, such that they never equal the tuples of callers
+
+
+def fingerprint(value: Any, typed: bool = False) -> Hashable:
+    """A hashable key for the value, equal for equal values.
+
+    Hashable values are their own key (with their type if ``typed``, such that ``1`` and ``1.0`` have different keys).
+    Unhashable values are fingerprinted by content:
+
+    - values exposing a contiguous buffer (``bytearray``, ``memoryview``, ``array.array``, NumPy arrays, ...) by a
+      digest of the buffer, which is hashed in place, without copying it, along with its format and shape
+    - lists, tuples, dicts and sets by the keys of their items
+
+    :raises TypeError: if the value is unhashable and cannot be fingerprinted by content.
+    """
+    try:
+        hash(value)
+    except (TypeError, ValueError):  # E.g. writable memoryviews raise ValueError
+        return _fingerprint_unhashable(value, typed)
+    return (value.__class__, value) if typed else cast(Hashable, value)
+
+
+def call_key(
+    dynamic_specs: DynamicArgSpecs,
+    fingerprint_arg: Callable[[Any], Hashable] = fingerprint,
+    ignore: AbstractSet[str] = frozenset(),
+) -> frozenset[tuple[str, Hashable]]:
+    """The canonical key of a bound call, equal for the calls with equal args whether they are passed positionally, by
+    keyword or left to their defaults, made of the names of the args with the fingerprints of their values.
+
+    :raises TypeError: if an arg cannot be fingerprinted.
+    """
+    # Names are unique within a call (made-up for variable positional args), so the order of binding is irrelevant
+    return frozenset((arg.name, fingerprint_arg(arg.value)) for arg in dynamic_specs.args if arg.name not in ignore)
+
+
+def _fingerprint_unhashable(value: Any, typed: bool) -> _Fingerprint:
+    if isinstance(value, (list, tuple)):
+        return (_UNHASHABLE, value.__class__, *(fingerprint(item, typed) for item in value))
+    if isinstance(value, dict):
+        items = frozenset((fingerprint(key, typed), fingerprint(item, typed)) for key, item in value.items())
+        return _UNHASHABLE, value.__class__, items
+    if isinstance(value, (set, frozenset)):
+        return _UNHASHABLE, value.__class__, frozenset(fingerprint(item, typed) for item in value)
+    try:
+        view = memoryview(value)
+    except (TypeError, ValueError):  # E.g. NumPy arrays of objects have no buffer
+        raise TypeError(f'Cannot fingerprint unhashable values of type {value.__class__}') from None
+    with view:
+        return _UNHASHABLE, value.__class__, view.format, view.shape, _digest(view)
+
+
+def _digest(view: memoryview) -> bytes:
+    if not view.c_contiguous:  # hashlib only reads contiguous buffers
+        return hashlib.blake2b(view.tobytes()).digest()
+    return hashlib.blake2b(view).digest()
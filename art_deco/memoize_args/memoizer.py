@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import inspect
+from functools import partial, wraps
+from typing import Any, Callable, Collection, Hashable, TypeVar, cast, overload
+
+from typing_extensions import Protocol
+
+from art_deco.core.specs.static_inspector import get_static_arg_specs
+from art_deco.memoize_args.fingerprints import call_key, fingerprint
+from art_deco.utils.caching import CacheStats, LRUCache
+
+_F = TypeVar('_F', bound=Callable)
+_MISSING = object()
+
+FingerprintFunc = Callable[[Any], Hashable]
+
+
+class ResultCache(Protocol):
+    """Where :func:`memoize_args` stores results, e.g. :class:`~art_deco.utils.caching.LRUCache` (the default) or
+    :class:`~art_deco.memoize_args.shared_cache.SharedMemoryCache`."""
+
+    stats: CacheStats
+
+    @overload
+    def get(self, key: Any) -> Any:
+        ...
+
+    @overload
+    def get(self, key: Any, default: Any) -> Any:
+        ...
+
+    def put(self, key: Any, value: Any) -> None:
+        ...
+
+
+def memoize_args(
+    maxsize: int | None = 128,
+    *,
+    maxbytes: int | None = None,
+    ttl: float | None = None,
+    typed: bool = False,
+    ignore: Collection[str] = (),
+    fingerprint_arg: FingerprintFunc | None = None,
+    cache: ResultCache | None = None,
+) -> Callable[[_F], _F]:
+    """Cache the results of the decorated callable by the canonical form of its calls.
+
+    Unlike :func:`functools.lru_cache`, the calls are bound to the signature of the callable first, such that the same
+    arguments hit the same entry whether they are passed positionally, by keyword or left to their defaults (e.g.
+    ``f(1, y=2)``, ``f(x=1, y=2)`` and ``f(1)``, if the default of ``y`` is ``2``).
+
+    :param maxsize: the maximum number of cached results, see :class:`~art_deco.utils.caching.LRUCache`.
+    :param maxbytes: the maximum size of the cached results, in bytes.
+    :param ttl: the number of seconds after which a cached result expires.
+    :param typed: whether arguments of different types are cached separately (e.g. ``1`` and ``1.0``).
+    :param ignore: the names of the arguments that are left out of the key (e.g. loggers, connections).
+    :param fingerprint_arg: maps an argument to a hashable key, defaults to :func:`fingerprint`, which fingerprints
+        unhashable arguments (lists, dicts, buffers such as NumPy arrays...) by content. Calls with arguments that
+        cannot be fingerprinted (it raises a ``TypeError``) are not cached.
+    :param cache: where to store the results instead of an :class:`~art_deco.utils.caching.LRUCache` created from
+        ``maxsize``, ``maxbytes`` and ``ttl``, e.g. a :class:`~art_deco.memoize_args.shared_cache.SharedMemoryCache`
+        shared by the processes of the host. It must only be used by the decorated callable.
+
+    The cache, and its statistics, are exposed as the ``cache`` attribute of the decorated callable. Coroutine functions
+    cache the results they return, not their coroutines. Exceptions are not cached.
+    """
+    make_key = fingerprint_arg or partial(fingerprint, typed=typed)
+    ignored = frozenset(ignore)
+
+    def decorator(wrapped: _F) -> _F:
+        binding_plan = get_static_arg_specs(wrapped, parse_type_hints=False).binding_plan
+        results: ResultCache
+        if cache is None:
+            results = LRUCache[Hashable, Any](maxsize, maxbytes=maxbytes, ttl=ttl)
+        else:
+            results = cache
+
+        def key_of(args: tuple[Any, ...], kwargs: dict[str, Any]) -> frozenset | None:
+            # Plain function wrappers: methods get their instance in args, like the wrapped function
+            try:
+                dynamic_specs = binding_plan.bind(args, kwargs)
+            except (AssertionError, AttributeError):  # The call does not match the signature, see the error of Python
+                return None
+            try:
+                return call_key(dynamic_specs, make_key, ignored)
+            except TypeError:  # Cannot be fingerprinted
+                return None
+
+        if inspect.iscoroutinefunction(wrapped):
+
+            @wraps(wrapped)
+            async def async_memoized(*args: Any, **kwargs: Any) -> Any:
+                key = key_of(args, kwargs)
+                if key is None:
+                    return await wrapped(*args, **kwargs)
+                result = results.get(key, _MISSING)
+                if result is _MISSING:
+                    result = await wrapped(*args, **kwargs)
+                    results.put(key, result)
+                return result
+
+            memoized: Any = async_memoized
+        else:
+
+            @wraps(wrapped)
+            def sync_memoized(*args: Any, **kwargs: Any) -> Any:
+                key = key_of(args, kwargs)
+                if key is None:
+                    return wrapped(*args, **kwargs)
+                result = results.get(key, _MISSING)
+                if result is _MISSING:
+                    result = wrapped(*args, **kwargs)
+                    results.put(key, result)
+                return result
+
+            memoized = sync_memoized
+
+        memoized.cache = results  # On the wrapper, unlike the attributes of wrapt wrappers, which go to the wrapped
+        return cast(_F, memoized)
+
+    return decorator
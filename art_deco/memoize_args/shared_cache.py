@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+import pickle  # noqa: S403  # The table is only shared by the processes of the same user (see _open_private)
+import stat
+import struct
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Hashable
+
+from art_deco.utils.caching import CacheStats
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover  # Windows
+    fcntl = None  # type: ignore[assignment]  # noqa: WPS440
+
+# Slot layout: sequence number (odd while the slot is written), key digest, write time (ns), payload length, payload
+_SLOT_HEADER = struct.Struct('<Q16sQI4x')
+_SEQUENCE = struct.Struct('<Q')
+_MAX_READ_ATTEMPTS = 8
+_SHARED_MEMORY_DIR = Path('/dev/shm')
+
+
+class SharedMemoryCache:
+    """Cache of pickled results stored in a memory mapped hash table, such that every process of the host that opens the
+    same table shares its hits (e.g. the workers of a web server), see ``memoize_args(cache=...)``.
+
+    The table has ``n_slots`` slots of ``slot_size`` bytes, grouped in buckets of ``ways`` slots. A key, digested in a
+    stable way across processes, maps to a bucket, and its result replaces the oldest slot of the bucket. Results that
+    do not fit in a slot, and keys or results that cannot be pickled, are not cached.
+
+    Writes lock one of ``n_stripes`` stripes of buckets, with a thread lock and a lock on the byte range of the stripe
+    in the file (shared by the processes). Reads take no lock: each slot is a seqlock, whose sequence number is odd
+    while the slot is written, so readers retry, or miss, if the slot changed while they were reading it.
+
+    Results are unpickled, so the file of the table must be owned by the current user and writable by them only,
+    otherwise a PermissionError is raised (e.g. if another user created it first, or it is a symlink).
+
+    Every process should open the table with the same ``n_slots``, ``slot_size`` and ``ways``, and each memoized
+    callable should have its own table (i.e. ``name``). ``stats`` only count the operations of the current process.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        n_slots: int = 4096,
+        slot_size: int = 1024,
+        ways: int = 4,
+        n_stripes: int = 64,
+        ttl: float | None = None,
+        directory: str | Path | None = None,
+    ) -> None:
+        if fcntl is None:  # pragma: no cover
+            raise OSError('The shared memory cache needs fcntl locks, which are only available on Unix')
+        if slot_size <= _SLOT_HEADER.size:
+            raise ValueError(f'Slots must be larger than their {_SLOT_HEADER.size} bytes header, got {slot_size}')
+        if n_slots <= 0 or n_slots % ways:
+            raise ValueError(f'The number of slots must be a positive multiple of ways={ways}, got {n_slots}')
+        if directory is None:
+            directory = _SHARED_MEMORY_DIR if _SHARED_MEMORY_DIR.is_dir() else tempfile.gettempdir()
+        self.path = Path(directory) / f'art_deco_cache_{name}'
+        self.n_slots = n_slots
+        self.slot_size = slot_size
+        self.ways = ways
+        self.n_buckets = n_slots // ways
+        self.n_stripes = min(n_stripes, self.n_buckets)
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self._thread_locks = [threading.Lock() for _ in range(self.n_stripes)]
+        self._fd = _open_private(self.path)
+        size = n_slots * slot_size
+        current_size = os.fstat(self._fd).st_size
+        if current_size not in {0, size}:
+            os.close(self._fd)
+            raise ValueError(f'{self.path} holds a table of {current_size} bytes, not {n_slots} x {slot_size} bytes')
+        if current_size == 0:
+            os.ftruncate(self._fd, size)  # Idempotent if processes race to create the table, the new slots are zeros
+        self._map = mmap.mmap(self._fd, size)
+        self._view = memoryview(self._map)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        try:
+            digest = stable_digest(key)
+        except (TypeError, pickle.PicklingError, AttributeError):
+            self.stats.misses += 1
+            return default
+        for offset in self._bucket_offsets(digest):
+            payload = self._read(offset, digest)
+            if payload is not None:
+                self.stats.hits += 1
+                return pickle.loads(payload)  # noqa: S301
+        self.stats.misses += 1
+        return default
+
+    def put(self, key: Hashable, value: Any) -> None:
+        try:
+            digest = stable_digest(key)
+            payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except (TypeError, pickle.PicklingError, AttributeError):
+            return
+        if _SLOT_HEADER.size + len(payload) > self.slot_size:
+            return
+        bucket = int.from_bytes(digest[:8], 'little') % self.n_buckets
+        stripe = bucket % self.n_stripes
+        with self._thread_locks[stripe]:  # fcntl locks are per process, threads need their own
+            fcntl.lockf(self._fd, fcntl.LOCK_EX, 1, stripe)  # Locks the byte ``stripe``, as a stripe id, not its data
+            try:
+                self._write(self._pick_slot(bucket, digest), digest, payload)
+            finally:
+                fcntl.lockf(self._fd, fcntl.LOCK_UN, 1, stripe)
+
+    def clear(self) -> None:
+        """Empty the table, for every process."""
+        for stripe, lock in enumerate(self._thread_locks):
+            with lock:
+                fcntl.lockf(self._fd, fcntl.LOCK_EX, 1, stripe)
+                try:
+                    for bucket in range(stripe, self.n_buckets, self.n_stripes):
+                        for offset in self._offsets(bucket):
+                            sequence = _SEQUENCE.unpack_from(self._map, offset)[0]
+                            _SLOT_HEADER.pack_into(self._map, offset, (sequence | 1) + 1, bytes(16), 0, 0)
+                finally:
+                    fcntl.lockf(self._fd, fcntl.LOCK_UN, 1, stripe)
+
+    def close(self) -> None:
+        self._view.release()
+        self._map.close()
+        os.close(self._fd)
+
+    def unlink(self) -> None:
+        """Delete the table, processes that opened it keep their mapping."""
+        self.path.unlink()
+
+    def _bucket_offsets(self, digest: bytes) -> range:
+        return self._offsets(int.from_bytes(digest[:8], 'little') % self.n_buckets)
+
+    def _offsets(self, bucket: int) -> range:
+        start = bucket * self.ways * self.slot_size
+        return range(start, start + self.ways * self.slot_size, self.slot_size)
+
+    def _read(self, offset: int, digest: bytes) -> bytes | None:
+        for _ in range(_MAX_READ_ATTEMPTS):
+            sequence, slot_digest, written_at, length = _SLOT_HEADER.unpack_from(self._map, offset)
+            if sequence & 1:  # Being written
+                continue
+            if slot_digest != digest:
+                return None
+            start = offset + _SLOT_HEADER.size
+            payload = bytes(self._view[start : start + length])
+            if _SEQUENCE.unpack_from(self._map, offset)[0] != sequence:  # Written meanwhile
+                continue
+            if self.ttl is not None and time.time_ns() - written_at > self.ttl * 1e9:
+                self.stats.expirations += 1
+                return None
+            return payload
+        return None
+
+    def _pick_slot(self, bucket: int, digest: bytes) -> int:
+        """The slot of the key, else an empty slot, else the oldest slot of the bucket (which is evicted)."""
+        oldest_offset, oldest_time = -1, float('inf')
+        for offset in self._offsets(bucket):
+            _, slot_digest, written_at, _ = _SLOT_HEADER.unpack_from(self._map, offset)  # noqa: WPS236
+            if slot_digest == digest or not written_at:
+                return offset
+            if written_at < oldest_time:
+                oldest_offset, oldest_time = offset, written_at
+        self.stats.evictions += 1
+        return oldest_offset
+
+    def _write(self, offset: int, digest: bytes, payload: bytes) -> None:
+        # Writers hold the lock of the stripe, an odd sequence number is left by a writer that died while writing
+        sequence = (_SEQUENCE.unpack_from(self._map, offset)[0] | 1) + 1
+        _SEQUENCE.pack_into(self._map, offset, sequence - 1)  # Odd: readers retry
+        start = offset + _SLOT_HEADER.size
+        self._view[start : start + len(payload)] = payload
+        _SLOT_HEADER.pack_into(self._map, offset, sequence - 1, digest, time.time_ns(), len(payload))
+        _SEQUENCE.pack_into(self._map, offset, sequence)  # Even: stable
+
+
+def _open_private(path: Path) -> int:
+    """Open (or create) the file of a table, making sure that only the current user can write it, since anyone who can
+    write the file can make the processes reading the table unpickle (i.e. execute) arbitrary code."""
+    try:
+        fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_NOFOLLOW, 0o600)
+    except OSError as error:
+        if os.path.islink(path):
+            raise PermissionError(f'{path} is a symlink, refusing to open the table through it') from error
+        raise
+    file_stat = os.fstat(fd)
+    is_private = stat.S_ISREG(file_stat.st_mode) and not file_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+    if file_stat.st_uid != os.getuid() or not is_private:
+        os.close(fd)
+        raise PermissionError(f'{path} must be a regular file owned, and only writable, by the current user')
+    return fd
+
+
+def stable_digest(key: Hashable) -> bytes:
+    """A 16 bytes digest of the key, equal in every process for equal keys, unlike ``hash``, which is randomized per
+    process for strings. Sets, whose iteration order depends on hashes, are sorted by the digests of their items.
+
+    :raises TypeError: if the key, or one of its items, cannot be pickled.
+    """
+    return hashlib.blake2b(_canonical_bytes(key), digest_size=16).digest()
+
+
+def _canonical_bytes(key: Any) -> bytes:
+    if isinstance(key, (frozenset, set)):
+        return b'S' + b''.join(sorted(stable_digest(item) for item in key))
+    if type(key) is tuple:  # noqa: WPS516  # Named tuples and other subclasses are pickled with their type
+        return b'T' + b''.join(stable_digest(item) for item in key)
+    return b'P' + pickle.dumps(key, protocol=4)
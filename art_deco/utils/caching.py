@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import sys
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable, Generic, Hashable, Tuple, TypeVar, cast, overload
+
+_K = TypeVar('_K', bound=Hashable)
+_V = TypeVar('_V')
+_D = TypeVar('_D')
+
+_Entry = Tuple[Any, float, int]  # value, expiry time (inf without TTL), size in bytes (0 without maxbytes)
+
+
+@dataclass
+class CacheStats:
+    """Counters of a cache. Under concurrency, they are updated without locking, so they may be slightly off."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    expirations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def reset(self) -> None:
+        self.hits = self.misses = self.evictions = self.invalidations = self.expirations = 0  # noqa: WPS429
+
+
+class LRUCache(Generic[_K, _V]):
+    """Thread-safe mapping that holds at most ``maxsize`` entries, and/or at most ``maxbytes`` bytes of values (as
+    measured by ``sizeof``), evicting the least recently used entries first.
+
+    With a ``ttl`` (in seconds), entries also expire that long after they were put, expired entries count as misses.
+    """
+
+    def __init__(
+        self,
+        maxsize: int | None = None,
+        *,
+        maxbytes: int | None = None,
+        ttl: float | None = None,
+        sizeof: Callable[[Any], int] = sys.getsizeof,
+        timer: Callable[[], float] = monotonic,
+    ) -> None:
+        if maxsize is None and maxbytes is None:
+            raise ValueError('The cache must be bounded, by maxsize and/or maxbytes')
+        for name, bound in (('maximum size', maxsize), ('maximum bytes', maxbytes), ('TTL', ttl)):
+            if bound is not None and bound <= 0:
+                raise ValueError(f'The {name} of the cache must be positive, got {bound}')
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.ttl = ttl
+        self.sizeof = sizeof
+        self.timer = timer
+        self.stats = CacheStats()
+        self.nbytes = 0
+        self._entries: OrderedDict[_K, _Entry] = OrderedDict()
+        self._lock = Lock()
+
+    @overload
+    def get(self, key: _K) -> _V | None:
+        ...
+
+    @overload
+    def get(self, key: _K, default: _D) -> _V | _D:
+        ...
+
+    def get(self, key: _K, default: Any = None) -> Any:
+        with self._lock:
+            try:
+                value, expires_at, _ = self._entries[key]
+            except KeyError:
+                self.stats.misses += 1
+                return default
+            if expires_at <= self.timer():
+                self._pop(key)
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return default
+            self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return value
+
+    def put(self, key: _K, value: _V) -> None:
+        expires_at = float('inf') if self.ttl is None else self.timer() + self.ttl
+        nbytes = 0 if self.maxbytes is None else self.sizeof(value)
+        if self.maxbytes is not None and nbytes > self.maxbytes:
+            return  # It would evict every other entry, and itself
+        with self._lock:
+            if key in self._entries:
+                self._pop(key)
+            self._entries[key] = (value, expires_at, nbytes)
+            self.nbytes += nbytes
+            while self._is_full():
+                self._pop(next(iter(self._entries)))  # The least recently used
+                self.stats.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def _is_full(self) -> bool:
+        return (self.maxsize is not None and len(self._entries) > self.maxsize) or (
+            self.maxbytes is not None and self.nbytes > self.maxbytes
+        )
+
+    def _pop(self, key: _K) -> None:
+        self.nbytes -= self._entries.pop(key)[2]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        entry = self._entries.get(cast(_K, key))  # Any object can be looked up, the annotation only reflects the keys
+        return entry is not None and entry[1] > self.timer()
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import pickle  # noqa: S403  # Only values of the current process are pickled, to ship them to its own workers
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Sequence
+
+try:
+    from multiprocessing import resource_tracker, shared_memory
+except ImportError:  # pragma: no cover  # python 3.7
+    shared_memory = None  # type: ignore[assignment]  # noqa: WPS440
+
+OUT_OF_BAND_PROTOCOL = 5
+SUPPORTS_OUT_OF_BAND = pickle.HIGHEST_PROTOCOL >= OUT_OF_BAND_PROTOCOL and shared_memory is not None
+
+_shared_pool: ProcessPoolExecutor | None = None
+_shared_pool_lock = threading.Lock()
+
+
+def get_shared_process_pool() -> ProcessPoolExecutor:
+    """The process pool shared by every hack offloaded to processes, created on first use with a worker per CPU."""
+    global _shared_pool  # noqa: WPS420  # pylint: disable=global-statement
+    if _shared_pool is None:
+        with _shared_pool_lock:
+            if _shared_pool is None:
+                _shared_pool = ProcessPoolExecutor()  # noqa: WPS442
+    return _shared_pool
+
+
+def submit_to_process_pool(func: Callable[[Any], Any], value: Any) -> Future:
+    """Call ``func(value)`` in the shared process pool, ``func`` must be picklable (e.g. a module level function).
+
+    The value is pickled with protocol 5, whose out-of-band buffers (e.g. the data of NumPy arrays) are copied once,
+    to shared memory, instead of being serialized within the pickled value and copied through the pipe to the worker.
+    Values without out-of-band buffers (e.g. bytes, str, plain Python objects) are pickled in-band, as usual.
+    """
+    pool = get_shared_process_pool()
+    if not SUPPORTS_OUT_OF_BAND:  # pragma: no cover  # python 3.7
+        return pool.submit(func, value)
+    buffers: list[pickle.PickleBuffer] = []
+    payload = pickle.dumps(value, protocol=OUT_OF_BAND_PROTOCOL, buffer_callback=buffers.append)
+    if not buffers:
+        return pool.submit(_call_with_pickled_value, func, payload)
+    sizes = [buffer.raw().nbytes for buffer in buffers]
+    memory = shared_memory.SharedMemory(create=True, size=max(1, sum(sizes)))
+    try:
+        offset = 0
+        for buffer, size in zip(buffers, sizes):
+            memory.buf[offset : offset + size] = buffer.raw()
+            offset += size
+        future = pool.submit(_call_with_shared_buffers, func, payload, memory.name, sizes)
+    except BaseException:  # E.g. the pool is shut down, no callback would release the segment
+        _release(memory)
+        raise
+    future.add_done_callback(lambda _: _release(memory))
+    return _chain_loads(future)
+
+
+def _call_with_pickled_value(func: Callable[[Any], Any], payload: bytes) -> Any:
+    return func(pickle.loads(payload))  # noqa: S301
+
+
+def _call_with_shared_buffers(func: Callable[[Any], Any], payload: bytes, name: str, sizes: Sequence[int]) -> bytes:
+    """Runs in the worker: rebuild the value around the shared out-of-band buffers, then call ``func``.
+
+    The result is pickled (in-band) before the shared memory is closed, since it may reference the shared buffers.
+    """
+    memory = shared_memory.SharedMemory(name=name)
+    # The caller owns, and unlinks, the segment. The tracker registered it under the private name, which keeps the
+    # leading slash of POSIX names that the public ``name`` strips
+    resource_tracker.unregister(memory._name, 'shared_memory')  # type: ignore[attr-defined]  # noqa: WPS437
+    try:
+        views, offset = [], 0
+        for size in sizes:
+            views.append(memory.buf[offset : offset + size])
+            offset += size
+        value = pickle.loads(payload, buffers=views)  # noqa: S301
+        result = pickle.dumps(func(value), protocol=OUT_OF_BAND_PROTOCOL)
+        del value, views  # noqa: WPS420
+        return result
+    finally:
+        try:
+            memory.close()
+        except BufferError:  # The hack kept a reference to the shared buffers, leave them mapped in this worker
+            pass
+
+
+def _release(memory: Any) -> None:
+    memory.close()
+    memory.unlink()
+
+
+def _chain_loads(future: Future) -> Future:
+    """Future of the unpickled result of ``future``."""
+    loaded: Future = Future()
+
+    def set_loaded(done: Future) -> None:
+        error = done.exception()
+        if error is not None:
+            loaded.set_exception(error)
+        else:
+            loaded.set_result(pickle.loads(done.result()))  # noqa: S301
+
+    future.add_done_callback(set_loaded)
+    return loaded
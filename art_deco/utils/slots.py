@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from dataclasses import MISSING, fields, is_dataclass
+from typing import Any, Callable, Type, TypeVar, cast
+
+_T = TypeVar('_T')
+
+
+def slotted(*extra_slots: str) -> Callable[[Type[_T]], Type[_T]]:
+    """Recreate a dataclass with ``__slots__`` for its fields (and ``extra_slots``), like ``dataclass(slots=True)``
+    does in Python 3.10+.
+
+    Non-init fields must not have defaults, since dataclasses rely on class attributes for those, and must be set in
+    ``__post_init__`` instead (with ``object.__setattr__`` for frozen dataclasses, as usual).
+    """
+
+    def decorator(cls: Type[_T]) -> Type[_T]:
+        assert is_dataclass(cls), f'{cls} must be a dataclass, apply @slotted on top of @dataclass'
+        field_names = tuple(field.name for field in fields(cls))
+        non_init_defaults = [field.name for field in fields(cls) if not field.init and field.default is not MISSING]
+        assert not non_init_defaults, f'Set non-init fields in __post_init__: {non_init_defaults}'
+        cls_dict = dict(cls.__dict__)
+        cls_dict['__slots__'] = field_names + extra_slots
+        for name in (*field_names, '__dict__', '__weakref__'):
+            cls_dict.pop(name, None)  # The default values are already captured by the generated __init__
+        cls_dict['__getstate__'] = _getstate
+        cls_dict['__setstate__'] = _setstate
+        metaclass: type = type(cls)
+        new_cls = metaclass(cls.__name__, cls.__bases__, cls_dict)
+        new_cls.__qualname__ = cls.__qualname__
+        return cast(Type[_T], new_cls)
+
+    return decorator
+
+
+def _getstate(self: Any) -> list[Any]:
+    return [getattr(self, field.name) for field in fields(self)]
+
+
+def _setstate(self: Any, state: list[Any]) -> None:
+    for field, value in zip(fields(self), state):
+        object.__setattr__(self, field.name, value)  # noqa: WPS609  # Works for frozen dataclasses too
@@ -7,16 +7,16 @@ from typing_extensions import Annotated
 T = TypeVar('T')
 S = TypeVar('S')
 
+try:
+    from typing import Annotated as TypingAnnotated  # type: ignore[attr-defined] # noqa: WPS433
+except ImportError:
+
+    class TypingAnnotated(Generic[T, S]):  # type:ignore[no-redef] # noqa: WPS431, WPS440
+        """Placeholder."""
 
-def is_annotated(hint: Any) -> bool:  # Use TypeGuard
-    # pylint: disable=import-outside-toplevel
-    extensions_annotated_type = type(Annotated[Any, 'art_deco'])
-    try:
-        from typing import Annotated as TypingAnnotated  # type: ignore[attr-defined] # noqa: WPS433
-    except ImportError:
 
-        class TypingAnnotated(Generic[T, S]):  # type:ignore[no-redef] # noqa: WPS431, WPS440
-            """Placeholder."""
+_ANNOTATED_TYPES = (type(Annotated[Any, 'art_deco']), type(TypingAnnotated[Any, 'art_deco']))
 
-    std_annotated_type = type(TypingAnnotated[Any, 'art_deco'])
-    return isinstance(hint, (extensions_annotated_type, std_annotated_type))
+
+def is_annotated(hint: Any) -> bool:  # Use TypeGuard
+    return isinstance(hint, _ANNOTATED_TYPES)
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import os
+import pickle  # noqa: S403
+from typing import Any
+
+from art_deco.hack_args.marks import process_pool_hacker
+
+
+class Blob:
+    """Data exported as a pickle protocol 5 out-of-band buffer, like a NumPy array."""
+
+    def __init__(self, data: bytearray) -> None:
+        self.data = data
+
+    def __reduce_ex__(self, protocol: Any) -> Any:  # type: ignore[override]
+        if protocol >= 5:
+            return type(self), (pickle.PickleBuffer(self.data),)
+        return type(self), (bytearray(self.data),)
+
+
+def blob_size(blob: Blob) -> int:
+    return len(blob.data)
+
+
+def blob_info(blob: Blob) -> tuple[int, bool]:
+    """The size of the blob, and whether it was rebuilt around a read-only (i.e. shared) buffer."""
+    data = blob.data
+    is_shared = isinstance(data, memoryview)
+    return len(data), is_shared
+
+
+def worker_pid(_: Any) -> int:
+    return os.getpid()
+
+
+@process_pool_hacker
+def pool_double(x: int) -> int:
+    return x * 2
+
+
+@process_pool_hacker
+def pool_fail(x: int) -> int:
+    raise ValueError(f'Bad {x}')
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from typing import Any, Callable
+
+
+def make_wide_func(n_params: int, *, n_defaults: int = 0, var_args: bool = False) -> Callable[..., Any]:
+    """Build a function with ``n_params`` positional-or-keyword parameters named ``p0``, ``p1``, ...
+
+    The last ``n_defaults`` parameters default to their index, and ``*args, **kwargs`` are appended if ``var_args``.
+    """
+    params = [f'p{i}' if i < n_params - n_defaults else f'p{i}={i}' for i in range(n_params)]
+    if var_args:
+        params.extend(['*args', '**kwargs'])
+    namespace: dict[str, Any] = {}
+    signature = ''.join(f'    {param},\n' for param in params)  # One parameter per line, for wide signatures
+    source = f'def wide_func(\n{signature}):\n    return locals()'
+    exec(source, namespace)  # noqa: S102  # pylint: disable=exec-used
+    return namespace['wide_func']  # type: ignore[no-any-return]
@@ -0,0 +1,77 @@
+"""Converting values to nested annotations with the converters compiled by ``coerce_args`` versus a naive coercion
+that walks the annotation with ``typing.get_origin``/``get_args`` on every call.
+
+Run from the repo root with ``python -m benchmarks.bench_coerce_args``.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from benchmarks.timing import print_table, time_per_call
+from typing_extensions import get_args, get_origin
+
+from art_deco.coerce_args.coercer import coerce_args
+from art_deco.coerce_args.converters import compile_converter
+
+CASES = (
+    ('int', int, '1'),
+    ('Optional[int]', Optional[int], '1'),
+    ('List[Optional[int]], 100 items', List[Optional[int]], [str(i) for i in range(100)]),
+    ('Dict[str, List[float]], 10x10 items', Dict[str, List[float]], {str(i): ['1.5'] * 10 for i in range(10)}),
+    ('Tuple[int, str, float]', Tuple[int, str, float], ['1', 2, '3']),
+)
+
+
+def naive_coerce(value: Any, annotation: Any) -> Any:  # noqa: WPS212, WPS231
+    origin, args = get_origin(annotation), get_args(annotation)
+    if annotation is Any:
+        return value
+    if origin is Union:
+        if value is None and type(None) in args:
+            return None
+        for arg in args:
+            try:
+                return naive_coerce(value, arg)
+            except (TypeError, ValueError):
+                continue
+        raise ValueError(f'Cannot coerce {value!r} to {annotation}')
+    if origin is list:
+        return [naive_coerce(item, args[0]) for item in value]
+    if origin is tuple:
+        return tuple(naive_coerce(item, arg) for item, arg in zip(value, args))
+    if origin is dict:
+        return {naive_coerce(key, args[0]): naive_coerce(item, args[1]) for key, item in value.items()}
+    if annotation is type(None):
+        return None
+    return value if isinstance(value, annotation) else annotation(value)
+
+
+def ingest(user_id: int, scores: List[Optional[int]], weights: Dict[str, List[float]]) -> int:
+    return user_id
+
+
+def main() -> None:
+    rows = []
+    for name, annotation, value in CASES:
+        converter = compile_converter(annotation)
+        assert converter(value) == naive_coerce(value, annotation)
+        timings = [
+            time_per_call(lambda: naive_coerce(value, annotation)),  # noqa: WPS441
+            time_per_call(lambda: converter(value)),  # noqa: WPS441
+        ]
+        rows.append((name, *(f'{timing * 1e6:.2f} us' for timing in timings)))
+    print_table(('annotation', 'naive walk', 'compiled'), rows)
+
+    print()  # noqa: WPS421
+    decorated = coerce_args()(ingest)
+    compiled = coerce_args(codegen=True)(ingest)
+    args = ('7', CASES[2][2], CASES[3][2])
+    rows = [
+        (f'coerce_args{options}', f'{time_per_call(lambda: func(*args)) * 1e6:.2f} us')  # noqa: WPS441
+        for options, func in (('()', decorated), ('(codegen=True)', compiled))
+    ]
+    print_table(('call of a function with 3 coerced args', 'per call'), rows)
+
+
+if __name__ == '__main__':
+    main()
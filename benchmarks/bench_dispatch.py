@@ -0,0 +1,65 @@
+"""Per-call cost of a coercion hack branching on ``isinstance`` chains versus a hack built by
+``dispatch_arg_hacker``, which resolves the converter once per type, for values matching the first and the last
+branch of the chain.
+
+Run from the repo root with ``python -m benchmarks.bench_dispatch``.
+"""
+from __future__ import annotations
+
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any
+
+from benchmarks.timing import print_table, time_per_call
+
+from art_deco.hack_args.dispatch import dispatch_arg_hacker
+from art_deco.hack_args.marks import arg_hacker
+
+
+def identity(value: Any) -> Any:
+    return value
+
+
+def to_date(value: datetime) -> date:
+    return value.date()
+
+
+@arg_hacker
+def isinstance_chain(value: Any) -> Any:  # noqa: WPS212
+    if isinstance(value, str):
+        return date.fromisoformat(value)
+    if isinstance(value, (int, float)):
+        return date.fromordinal(int(value))
+    if isinstance(value, Decimal):
+        return date.fromordinal(int(value))
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    raise TypeError(f'Unexpected {value!r}')
+
+
+dispatched = dispatch_arg_hacker(
+    {
+        str: date.fromisoformat,
+        int: date.fromordinal,
+        float: lambda value: date.fromordinal(int(value)),
+        Decimal: lambda value: date.fromordinal(int(value)),
+        datetime: to_date,
+        date: identity,
+    }
+)
+
+
+def main() -> None:
+    rows = []
+    for name, value in (('str (first branch)', '2024-01-02'), ('date (last branch)', date(2024, 1, 2))):
+        assert isinstance_chain(value) == dispatched(value) == date(2024, 1, 2)
+        hacks = (isinstance_chain, dispatched)
+        timings = [time_per_call(lambda: hack(value), number=100_000) for hack in hacks]  # noqa: WPS441
+        rows.append((name, *(f'{timing * 1e9:.0f} ns' for timing in timings)))
+    print_table(('per call', 'isinstance chain', 'dispatch_arg_hacker'), rows)
+
+
+if __name__ == '__main__':
+    main()
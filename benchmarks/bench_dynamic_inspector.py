@@ -0,0 +1,39 @@
+"""Scaling benchmark for binding call arguments to static specs (``get_dynamic_arg_specs``).
+
+Run from the repo root with ``python -m benchmarks.bench_dynamic_inspector``. The binder is linear when the cost per
+parameter stays roughly flat as the number of parameters grows.
+"""
+from __future__ import annotations
+
+from benchmarks.timing import print_table, time_per_call
+
+from art_deco.core.specs.dynamic_inspector import get_dynamic_arg_specs
+from art_deco.core.specs.static_inspector import get_static_arg_specs
+from art_deco_test_examples.functions.wide_funcs import make_wide_func
+
+N_PARAMS = (10, 30, 100, 300, 1000)
+
+
+def main() -> None:
+    rows = []
+    for n_params in N_PARAMS:
+        static_specs = get_static_arg_specs(make_wide_func(n_params), parse_type_hints=False)
+        args = tuple(range(n_params))
+        kwargs = {f'p{i}': i for i in range(n_params)}
+        number = max(10, 20_000 // n_params)
+        positional = time_per_call(lambda: get_dynamic_arg_specs(static_specs, args, {}), number=number)
+        keyword = time_per_call(lambda: get_dynamic_arg_specs(static_specs, (), kwargs), number=number)
+        rows.append(
+            (
+                n_params,
+                f'{positional * 1e6:.1f}',
+                f'{positional / n_params * 1e9:.0f}',
+                f'{keyword * 1e6:.1f}',
+                f'{keyword / n_params * 1e9:.0f}',
+            )
+        )
+    print_table(('params', 'positional us', 'ns/param', 'keyword us', 'ns/param'), rows)
+
+
+if __name__ == '__main__':
+    main()
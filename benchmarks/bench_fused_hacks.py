@@ -0,0 +1,53 @@
+"""Per-call cost of a chain of 3 hacks on one argument, fused from ``Annotated`` metadata into a single pipeline, versus
+the same hacks applied by 3 stacked ``hack_args`` decorators, each one binding the call and rebuilding it.
+
+Run from the repo root with ``python -m benchmarks.bench_fused_hacks``.
+"""
+from __future__ import annotations
+
+from benchmarks.timing import print_table, time_per_call
+from typing_extensions import Annotated
+
+from art_deco.hack_args.marks import arg_hacker
+from art_deco.hack_args.processor import hack_args
+
+
+@arg_hacker
+def strip(value: str) -> str:
+    return value.strip()
+
+
+@arg_hacker
+def lower(value: str) -> str:
+    return value.lower()
+
+
+@arg_hacker
+def check_not_empty(value: str) -> str:
+    assert value, 'Empty value'
+    return value
+
+
+def get(key: str, default: int = 0) -> str:
+    return key
+
+
+def main() -> None:
+    rows = []
+    for codegen in (False, True):
+        stacked = get
+        for hack in (check_not_empty, lower, strip):
+            stacked = hack_args({'key': hack}, codegen=codegen)(stacked)
+
+        @hack_args(codegen=codegen)
+        def fused(key: Annotated[str, strip, lower, check_not_empty], default: int = 0) -> str:
+            return key
+
+        assert stacked(' Key ') == fused(' Key ') == 'key'
+        timings = [time_per_call(lambda: func(' Key '), number=20_000) for func in (stacked, fused)]  # noqa: WPS441
+        rows.append((f'codegen={codegen}', *(f'{timing * 1e6:.2f} us' for timing in timings)))
+    print_table(('per call', '3 stacked hack_args', 'fused chain'), rows)
+
+
+if __name__ == '__main__':
+    main()
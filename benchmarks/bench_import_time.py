@@ -0,0 +1,69 @@
+"""Import time of a synthetic module of thousands of functions decorated with ``hack_args``, eagerly and lazily
+(``lazy=True``), then the time of calling each of them once, which is when the lazy ones are inspected.
+
+Run from the repo root with ``python -m benchmarks.bench_import_time``.
+"""
+from __future__ import annotations
+
+import importlib
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.timing import print_table
+
+N_FUNCS = 3000
+
+HEADER = '''
+from __future__ import annotations
+
+from typing import Optional
+
+from typing_extensions import Annotated
+
+from art_deco.hack_args.marks import arg_hacker
+from art_deco.hack_args.processor import hack_args
+
+
+@arg_hacker
+def to_int(value: object) -> int:
+    return int(value)  # type: ignore[call-overload]
+
+'''
+
+FUNC = '''
+
+@hack_args(lazy={lazy})
+def func_{i}(x: Annotated[int, to_int], y: Optional[str] = None, *, z: Annotated[int, to_int] = 0) -> int:
+    return x + z
+'''
+
+
+def write_module(directory: Path, name: str, lazy: bool) -> None:
+    source = HEADER + ''.join(FUNC.format(i=i, lazy=lazy) for i in range(N_FUNCS))
+    (directory / f'{name}.py').write_text(source, encoding='utf-8')
+
+
+def main() -> None:
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        sys.path.insert(0, directory)
+        for lazy in (False, True):
+            name = f'synthetic_hacked_module_lazy_{lazy}'.lower()
+            write_module(Path(directory), name, lazy)
+            importlib.invalidate_caches()
+            start = time.perf_counter()
+            module = importlib.import_module(name)
+            import_time = time.perf_counter() - start
+            start = time.perf_counter()
+            for i in range(N_FUNCS):
+                getattr(module, f'func_{i}')('1', z='2')
+            first_calls_time = time.perf_counter() - start
+            rows.append((f'lazy={lazy}', f'{import_time * 1e3:.0f} ms', f'{first_calls_time * 1e3:.0f} ms'))
+        sys.path.remove(directory)
+    print_table((f'{N_FUNCS} functions', 'import', 'first calls'), rows)
+
+
+if __name__ == '__main__':
+    main()
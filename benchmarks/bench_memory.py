@@ -0,0 +1,60 @@
+"""Memory held per decorated function, for 100k generated accessors with identical signatures, measured with
+tracemalloc (Python allocations) and as the growth of the resident set size (RSS) of the process.
+
+Run from the repo root with ``python -m benchmarks.bench_memory``.
+"""
+from __future__ import annotations
+
+import gc
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+
+from benchmarks.timing import print_table
+from typing_extensions import Annotated
+
+from art_deco.hack_args.marks import arg_hacker
+from art_deco.hack_args.processor import hack_args
+
+N_FUNCS = 100_000
+
+
+@arg_hacker
+def strip(value: str) -> str:
+    return value.strip()
+
+
+def make_accessor() -> Callable[..., Any]:
+    def accessor(record: dict, key: Annotated[str, strip], default: Any = None) -> Any:
+        return record.get(key, default)
+
+    return accessor
+
+
+def rss_bytes() -> int:
+    pages = int(Path('/proc/self/statm').read_text(encoding='utf-8').split()[1])
+    return pages * 4096
+
+
+def main() -> None:
+    rows = []
+    for name, decorate in (
+        ('undecorated', lambda func: func),
+        ('hack_args', hack_args()),
+        ('hack_args(lazy=True), not called', hack_args(lazy=True)),
+    ):
+        gc.collect()
+        rss_before = rss_bytes()
+        tracemalloc.start()
+        accessors = [decorate(make_accessor()) for _ in range(N_FUNCS)]
+        traced, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        rss = rss_bytes() - rss_before
+        assert accessors[-1]({'a': 1}, 'a') == 1
+        rows.append((name, f'{traced / N_FUNCS:.0f} B', f'{rss / N_FUNCS:.0f} B'))
+        del accessors  # noqa: WPS420
+    print_table(('per function', 'tracemalloc', 'RSS'), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""Per-stage microbenchmarks of the processing engine: bind, per-arg pass, rebuild and wide checks.
+
+Run from the repo root with ``python -m benchmarks.bench_processing``. Each stage is a single pass over the arguments,
+so its cost per argument should stay flat as the number of arguments grows.
+"""
+from __future__ import annotations
+
+from typing import Any, Mapping
+
+from benchmarks.timing import print_table, time_per_call
+
+from art_deco.core.arg_processors.api import ArgNames, Context, MultiArgValidateFunc
+from art_deco.core.arg_processors.processing import process_named_args, rebuild_call, run_wide_checks
+from art_deco.core.specs.binding_plan import BindingPlan
+from art_deco.core.specs.dynamic_arg_specs import DynamicArgSpec
+from art_deco.core.specs.static_inspector import get_static_arg_specs
+from art_deco_test_examples.functions.wide_funcs import make_wide_func
+
+N_PARAMS = (10, 100, 1000)
+
+
+class IdentityProcessor:
+    def __init__(self, n_params: int) -> None:
+        names = tuple(f'p{i}' for i in range(n_params))
+        self.wide_checks = {names[i : i + 2]: _check for i in range(0, n_params, 2)}  # noqa: WPS221
+
+    def should_process_arg(self, _: str) -> bool:
+        return True
+
+    def process_arg(self, arg: DynamicArgSpec, _: Context) -> Any:
+        return arg.value
+
+    def get_wide_checks(self) -> Mapping[ArgNames, MultiArgValidateFunc]:
+        return self.wide_checks
+
+
+def _check(_: Context, *values: Any) -> None:
+    """Does nothing."""
+
+
+def main() -> None:
+    rows = []
+    for n_params in N_PARAMS:
+        static_specs = get_static_arg_specs(make_wide_func(n_params), parse_type_hints=False)
+        plan = BindingPlan.from_static_specs(static_specs)
+        processor = IdentityProcessor(n_params)
+        args = tuple(range(n_params))
+        context = Context(static_specs, plan.bind(args, {}))
+        number = max(10, 20_000 // n_params)
+        timings = [
+            time_per_call(lambda: plan.bind(args, {}), number=number),
+            time_per_call(lambda: process_named_args(processor, context, processor.should_process_arg), number=number),
+            time_per_call(lambda: rebuild_call(context.dynamic_args), number=number),
+            time_per_call(lambda: run_wide_checks(processor, context), number=number),
+        ]
+        rows.append((n_params, *(f'{timing / n_params * 1e9:.0f}' for timing in timings)))
+    print_table(('params', 'bind ns/arg', 'per-arg pass ns/arg', 'rebuild ns/arg', 'wide checks ns/arg'), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""Throughput of worker processes calling the same expensive memoized function, with a cache per process
+(``LRUCache``) and with a cache shared by the processes of the host (``SharedMemoryCache``).
+
+With a cache per process, every process computes every result once, while with the shared cache each result is
+computed about once for all the processes.
+
+Run from the repo root with ``python -m benchmarks.bench_shared_cache``.
+"""
+from __future__ import annotations
+
+import hashlib
+import random
+import time
+from multiprocessing import Pool
+from typing import Callable
+
+from benchmarks.timing import print_table
+
+from art_deco.memoize_args.memoizer import memoize_args
+from art_deco.memoize_args.shared_cache import SharedMemoryCache
+
+N_PROCESSES = 8
+N_KEYS = 200
+CALLS_PER_PROCESS = 2000
+
+SHARED_CACHE = SharedMemoryCache('bench_shared_cache', n_slots=4096, slot_size=256)
+
+
+def expensive(ticker: str, window: int = 20) -> str:
+    digest = ticker.encode()
+    for _ in range(2000):  # About 1 ms
+        digest = hashlib.sha256(digest).digest()
+    return digest.hex()[:window]
+
+
+per_process = memoize_args(maxsize=N_KEYS)(expensive)
+shared = memoize_args(cache=SHARED_CACHE)(expensive)
+
+
+def run_worker(name: str) -> int:
+    func: Callable[..., str] = globals()[name]
+    keys = random.Random(0).choices([f'TICKER{i}' for i in range(N_KEYS)], k=CALLS_PER_PROCESS)
+    for key in keys:
+        func(key, window=20)
+    return func.cache.stats.hits  # type: ignore[attr-defined]
+
+
+def main() -> None:
+    rows = []
+    for name in ('per_process', 'shared'):
+        SHARED_CACHE.clear()
+        with Pool(N_PROCESSES) as pool:
+            start = time.perf_counter()
+            hits = sum(pool.map(run_worker, [name] * N_PROCESSES))
+            duration = time.perf_counter() - start
+        n_calls = N_PROCESSES * CALLS_PER_PROCESS
+        rows.append((name, f'{n_calls / duration:,.0f}', f'{hits / n_calls:.1%}', f'{n_calls - hits}'))
+    SHARED_CACHE.unlink()
+    print_table(('cache', 'calls/s', 'hit rate', 'computed'), rows)
+
+
+if __name__ == '__main__':
+    main()
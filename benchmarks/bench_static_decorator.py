@@ -0,0 +1,59 @@
+"""Per-call overhead of ``hack_args`` (static mode) compared to calling the undecorated function.
+
+The adaptive wrapper is specialized for the shape of the calls of its warm-up, ``(1, 2)``, such that ``(1, y=2)`` calls
+miss its guard and take the generic path.
+
+Run from the repo root with ``python -m benchmarks.bench_static_decorator``.
+"""
+from __future__ import annotations
+
+from typing import Any, Callable
+
+from benchmarks.timing import print_table, time_per_call
+from typing_extensions import Annotated
+
+from art_deco.core.specs.binding_plan import BindingPlan
+from art_deco.core.specs.dynamic_inspector import get_dynamic_arg_specs
+from art_deco.core.specs.static_inspector import get_static_arg_specs
+from art_deco.hack_args.marks import arg_hacker
+from art_deco.hack_args.processor import hack_args
+
+
+@arg_hacker
+def validate(value: Any) -> Any:
+    return value
+
+
+def plain(x: int, y: int, z: int = 3) -> int:
+    return x + y + z
+
+
+def annotated(x: Annotated[int, validate], y: Annotated[int, validate], z: int = 3) -> int:
+    return x + y + z
+
+
+def _micros(func: Callable[[], Any]) -> str:
+    return f'{time_per_call(func, number=20_000) * 1e6:.2f}'
+
+
+def _bench_calls(rows: list[tuple[str, str]], name: str, func: Callable[..., Any]) -> None:
+    rows.append((f'{name}(1, 2)', _micros(lambda: func(1, 2))))
+    rows.append((f'{name}(1, y=2)', _micros(lambda: func(1, y=2))))
+
+
+def main() -> None:
+    rows: list[tuple[str, str]] = []
+    static_specs = get_static_arg_specs(plain, parse_type_hints=True)
+    plan = BindingPlan.from_static_specs(static_specs)
+    rows.append(('bind: get_dynamic_arg_specs', _micros(lambda: get_dynamic_arg_specs(static_specs, (1, 2), {}))))
+    rows.append(('bind: BindingPlan.bind', _micros(lambda: plan.bind((1, 2), {}))))
+    _bench_calls(rows, 'plain', plain)
+    _bench_calls(rows, 'hack_args(passthrough)', hack_args()(plain))
+    _bench_calls(rows, 'hack_args', hack_args()(annotated))
+    _bench_calls(rows, 'hack_args(codegen)', hack_args(codegen=True)(annotated))
+    _bench_calls(rows, 'hack_args(adaptive)', hack_args(adaptive=100)(annotated))
+    print_table(('call', 'us/call'), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""Per-call time of ``hack_args`` with and without threads (``use_threads=True``), for hacks that release the GIL
+(hashing large payloads, waiting for I/O) and for cheap hacks, which should run inline and not regress.
+
+Hashing only runs faster with threads on machines with several cores, while waiting for I/O does on a single core.
+
+Run from the repo root with ``python -m benchmarks.bench_threaded_hacks``.
+"""
+from __future__ import annotations
+
+import hashlib
+import time
+from typing import Any, Callable
+
+from benchmarks.timing import print_table, time_per_call
+from typing_extensions import Annotated
+
+from art_deco.hack_args.marks import arg_hacker
+from art_deco.hack_args.processor import hack_args
+
+PAYLOAD = bytes(range(256)) * 4096 * 4  # 4 MiB, hashlib releases the GIL for payloads above 2 KiB
+
+
+@arg_hacker
+def digest(value: bytes) -> str:
+    return hashlib.sha256(value).hexdigest()
+
+
+@arg_hacker
+def read(path: str) -> str:
+    time.sleep(0.002)  # Stands for a file read, which releases the GIL while waiting for the disk
+    return path
+
+
+@arg_hacker
+def validate(value: Any) -> Any:
+    return value
+
+
+def hashed(
+    a: Annotated[bytes, digest], b: Annotated[bytes, digest], c: Annotated[bytes, digest], d: Annotated[bytes, digest]
+) -> str:
+    return a + b + c + d
+
+
+def io_bound(a: Annotated[str, read], b: Annotated[str, read], c: Annotated[str, read], d: Annotated[str, read]) -> str:
+    return a + b + c + d
+
+
+def cheap(a: Annotated[int, validate], b: Annotated[int, validate], c: Annotated[int, validate]) -> int:
+    return a + b + c
+
+
+def _row(name: str, func: Callable[[], Any], number: int, unit: float, unit_name: str) -> tuple[str, str]:
+    return name, f'{time_per_call(func, number=number) / unit:.2f} {unit_name}'
+
+
+def main() -> None:
+    rows = []
+    for use_threads in (False, True):
+        func = hack_args(use_threads=use_threads)(hashed)
+        rows.append(_row(f'4 x sha256(4 MiB), use_threads={use_threads}', lambda: func(*[PAYLOAD] * 4), 5, 1e-3, 'ms'))
+    for use_threads in (False, True):  # noqa: WPS440
+        func = hack_args(use_threads=use_threads)(io_bound)  # noqa: WPS440
+        rows.append(_row(f'4 x read(2 ms), use_threads={use_threads}', lambda: func(*'abcd'), 20, 1e-3, 'ms'))
+    for use_threads in (False, True):  # noqa: WPS440
+        func = hack_args(use_threads=use_threads)(cheap)  # noqa: WPS440
+        rows.append(_row(f'3 x cheap hack, use_threads={use_threads}', lambda: func(1, 2, 3), 20_000, 1e-6, 'us'))
+    print_table(('call', 'time/call'), rows)
+
+
+if __name__ == '__main__':
+    main()
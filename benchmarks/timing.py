@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+import timeit
+from typing import Any, Callable, Sequence
+
+
+def time_per_call(func: Callable[[], Any], *, number: int = 1000, repeat: int = 5) -> float:
+    """Best-of-``repeat`` wall time, in seconds, of a single call to ``func``."""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def print_table(headers: Sequence[str], rows: Sequence[Sequence[Any]]) -> None:
+    widths = [max(len(str(cell)) for cell in column) for column in zip(headers, *rows)]
+    for row in [headers, *rows]:
+        print('  '.join(str(cell).rjust(width) for cell, width in zip(row, widths)))  # noqa: WPS421
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import asyncio
+from asyncio import run
+from typing import Any
+from unittest.mock import patch
+
+from pytest import raises
+
+from art_deco.coalesce_args.coalescer import coalesce_args
+
+
+def test_coalesce_compatible_calls() -> None:
+    batches: list[tuple[list[int], str]] = []
+
+    @coalesce_args('x', max_batch_size=3)
+    async def double(x: list[int], db: str = 'main') -> list[int]:
+        batches.append((x, db))
+        return [value * 2 for value in x]
+
+    async def calls() -> list[int]:
+        return await asyncio.gather(  # type: ignore[return-value]
+            double(1),
+            double(x=2, db='main'),
+            double(3, 'other'),
+            double(db='main', x=1),  # Shares the result of the first call
+            double(4),
+            double(5),  # The first batch of main is full
+        )
+
+    assert run(calls()) == [2, 4, 6, 2, 8, 10]
+    assert sorted(batches) == [([1, 2, 4], 'main'), ([3], 'other'), ([5], 'main')]
+
+
+def test_errors_are_fanned_out() -> None:
+    @coalesce_args('x')
+    async def fail(x: list[int], log: Any = None) -> list[int]:
+        if len(x) > 1:
+            return x[:1]
+        raise KeyError(x[0])
+
+    async def calls() -> list[Any]:
+        results: list[Any] = await asyncio.gather(fail(1), fail(2), fail(3, log=[]), return_exceptions=True)
+        return results
+
+    first, second, alone = run(calls())
+    assert isinstance(first, ValueError) and first is second  # 1 result for 2 values
+    assert isinstance(alone, KeyError)  # Unhashable args are batched alone
+
+
+def test_invalid_calls() -> None:
+    @coalesce_args('x')
+    async def batch(x: list[int], db: str) -> list[int]:
+        return x
+
+    async def calls() -> list[Any]:
+        results: list[Any] = await asyncio.gather(batch(1, 'main'), batch(2, 'main'), return_exceptions=True)
+        return results
+
+    async def call(*args: Any) -> list[int]:
+        result: list[int] = await batch(*args)
+        return result
+
+    with raises(TypeError, match=r"missing required arguments: \['db'\]"):
+        run(call(1))
+    with raises(TypeError, match=r"missing required arguments: \['x', 'db'\]"):
+        run(call())
+    # Errors raised when calling the batch function, before awaiting it, are fanned out to the callers
+    with patch('art_deco.coalesce_args.coalescer.rebuild_call', side_effect=RuntimeError('Cannot rebuild')):
+        first, second = run(asyncio.wait_for(calls(), timeout=1))
+    assert isinstance(first, RuntimeError) and first is second
+
+
+def test_invalid_batch_functions() -> None:
+    async def batch(x: list[int], *args: int) -> list[int]:
+        return x
+
+    def sync_batch(x: list[int]) -> list[int]:
+        return x
+
+    with raises(ValueError, match='no named parameter'):
+        coalesce_args('args')(batch)
+    with raises(TypeError, match='coroutine function'):
+        coalesce_args('x')(sync_batch)  # type: ignore[arg-type]
+    with raises(ValueError, match='positive'):
+        coalesce_args('x', max_batch_size=0)
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from asyncio import run
+from concurrent.futures import ThreadPoolExecutor
+
+from pytest import raises
+
+from art_deco.coalesce_args.singleflight import singleflight
+
+
+def test_threads_wait_for_the_leader() -> None:
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    @singleflight()
+    def load(key: str, version: int = 1) -> str:
+        calls.append(key)
+        started.set()
+        release.wait(5)
+        if key == 'bad':
+            raise KeyError(key)
+        return key * version
+
+    with ThreadPoolExecutor(4) as executor:
+        leader = executor.submit(load, 'a')
+        started.wait(5)
+        followers = [executor.submit(load, 'a', 1), executor.submit(load, key='a', version=1)]
+        while load.stats.calls < 3:  # type: ignore[attr-defined]
+            threading.Event().wait(0.001)
+        release.set()
+        assert [future.result() for future in (leader, *followers)] == ['a'] * 3
+    assert calls == ['a']
+    assert (load.stats.calls, load.stats.collapsed) == (3, 2)  # type: ignore[attr-defined]
+    assert load('a') == 'a'  # Not memoized
+    with raises(KeyError):
+        load('bad')
+    assert calls == ['a', 'a', 'bad']
+
+
+def test_coroutines_wait_for_the_leader() -> None:
+    calls = []
+
+    @singleflight(ignore=['log'])
+    async def load(key: str, log: list | None = None) -> str:
+        calls.append(key)
+        await asyncio.sleep(0.01)
+        if key == 'bad':
+            raise KeyError(key)
+        return key
+
+    async def concurrent_calls() -> tuple[str | BaseException, ...]:
+        return await asyncio.gather(
+            load('a'), load(key='a', log=[]), load('b'), load('bad'), load('bad'), return_exceptions=True
+        )
+
+    first, second, other, error, same_error = run(concurrent_calls())
+    assert (first, second, other) == ('a', 'a', 'b')
+    assert isinstance(error, KeyError) and error is same_error
+    assert calls == ['a', 'b', 'bad']
+    assert load.stats.collapse_rate == 0.4  # type: ignore[attr-defined]
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+
+from pytest import mark, raises
+from typing_extensions import Literal
+
+from art_deco.coerce_args.coercer import coerce_args
+
+
+def coerced(
+    x: int,
+    y: Optional[List[float]] = None,
+    *args: Tuple[int, str],
+    z: Literal['a', 'b'] = 'a',
+    untyped=0,  # noqa: ANN001
+    **kwargs: bool,
+) -> tuple:
+    return x, y, args, z, untyped, kwargs
+
+
+@mark.parametrize('options', [{}, {'codegen': True}, {'adaptive': 1}])
+def test_coerce_args(options: Dict[str, Any]) -> None:
+    func = coerce_args(**options)(coerced)
+    for _ in range(2):  # Adaptive wrappers are specialized after the first call
+        assert func('1', ('2',), ['3', 4], z='b', untyped='0', flag='no') == (  # type: ignore[arg-type]
+            1,
+            [2.0],
+            ((3, '4'),),
+            'b',
+            '0',
+            {'flag': False},
+        )
+        assert func(1) == (1, None, (), 'a', 0, {})  # Defaults are kept
+    with raises(ValueError):
+        func('1', z='c')  # type: ignore[arg-type]
+
+
+def test_coerce_args_methods_and_ignore() -> None:
+    class Example:
+        @coerce_args(ignore=['y'])
+        def method(self, x: int, y: int) -> Tuple[int, int]:
+            return x, y
+
+        @staticmethod
+        @coerce_args()
+        async def coroutine(x: int) -> int:
+            return x
+
+    assert Example().method('1', '2') == (1, '2')  # type: ignore[arg-type]
+
+    assert asyncio.run(Example.coroutine('3')) == 3  # type: ignore[arg-type]
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import sys
+from collections import Counter, defaultdict, deque
+from decimal import Decimal
+from enum import Enum
+from typing import (
+    Any,
+    Callable,
+    Counter as CounterType,
+    DefaultDict,
+    Deque,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Mapping,
+    NewType,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
+
+from pytest import mark, raises
+from typing_extensions import Annotated, Literal
+
+from art_deco.coerce_args.converters import CONVERTERS_CACHE, compile_converter, identity
+
+UserId = NewType('UserId', int)
+
+
+class Color(Enum):
+    RED = 'red'
+    BLUE = 'blue'
+
+
+@mark.parametrize(
+    ('annotation', 'value', 'expected'),
+    [
+        (int, '1', 1),
+        (int, 2.0, 2),  # Integral numbers are converted
+        (float, 1, 1.0),
+        (Decimal, '1.5', Decimal('1.5')),
+        (bool, ' Yes', True),
+        (bool, 'off', False),
+        (bool, 0, False),
+        (Color, 'red', Color.RED),
+        (Color, 'BLUE', Color.BLUE),  # By name
+        (UserId, '3', 3),
+        (Annotated[int, 'metadata'], '1', 1),
+        (None, None, None),
+        (Optional[int], None, None),
+        (Optional[int], '1', 1),
+        (Union[int, str], 'a', 'a'),  # Values which have one of the types are kept
+        (Union[float, str], 1, 1.0),  # Others are converted to the first type accepting them
+        (Union[int, List[int]], ['1'], [1]),
+        (Literal[1, 2], '2', 2),
+        (Literal['a', 1], 'a', 'a'),
+        (List[int], ('1', 2), [1, 2]),
+        (Sequence[float], ['1'], [1.0]),
+        (Set[int], ['1', '1'], {1}),
+        (FrozenSet[str], [1], frozenset({'1'})),
+        (Deque[int], ['1'], deque([1])),
+        (Tuple[int, ...], ['1', '2'], (1, 2)),
+        (Tuple[int, str], ['1', 2], (1, '2')),
+        (Tuple[()], [], ()),
+        (Dict[str, List[float]], {'a': ['1']}, {'a': [1.0]}),
+        (Dict[int, Any], [('1', 'a')], {1: 'a'}),
+        (Mapping[str, Optional[int]], [('a', None)], {'a': None}),
+        (Dict[str, Any], [('a', 1)], {'a': 1}),
+        (List[Any], (1,), [1]),
+    ],
+)
+def test_compile_converter(annotation: Any, value: Any, expected: Any) -> None:
+    converted = compile_converter(annotation)(value)
+    assert converted == expected
+    assert type(converted) is type(expected)  # pylint: disable=unidiomatic-typecheck
+
+
+@mark.skipif(sys.version_info < (3, 10), reason='PEP 604 unions and builtin generics')
+def test_compile_builtin_generics() -> None:
+    assert compile_converter(eval('list[int] | None'))(['1']) == [1]  # noqa: S307  # pylint: disable=eval-used
+    assert compile_converter(eval('dict[str, int]'))({'a': '1'}) == {'a': 1}  # noqa: S307  # pylint: disable=eval-used
+
+
+@mark.parametrize('annotation', [Any, object, Optional[Any], Callable[[int], int], Type[int], Iterator[int], 'int'])
+def test_unenforceable_annotations(annotation: Any) -> None:
+    assert compile_converter(annotation) is identity
+
+
+@mark.parametrize(
+    ('value', 'expected'),
+    [
+        (['1', 1, '2'], Counter({1: 2, 2: 1})),
+        ({'1': 2, 1: 1}, Counter({1: 3})),
+        (Counter({'1': 2}), Counter({1: 2})),
+    ],
+)
+def test_counters_convert_their_keys_only(value: Any, expected: Counter[int]) -> None:
+    converted = compile_converter(CounterType[int])(value)
+    assert converted == expected
+    assert type(converted) is Counter
+    counter = Counter('ab')
+    assert compile_converter(CounterType[Any])(counter) is counter
+
+
+def test_default_dicts_keep_their_default_factory() -> None:
+    converter = compile_converter(DefaultDict[str, int])
+    converted = converter(defaultdict(list, {1: '2'}))
+    assert type(converted) is defaultdict
+    assert converted == {'1': 2}
+    assert converted.default_factory is list
+    converted = converter({1: '2'})
+    assert type(converted) is defaultdict
+    assert converted == {'1': 2}
+    assert converted.default_factory is None
+    assert compile_converter(DefaultDict[Any, Any])([('a', 1)]) == {'a': 1}
+    default_dict: DefaultDict[str, int] = defaultdict(int)
+    assert compile_converter(DefaultDict[Any, Any])(default_dict) is default_dict
+
+
+def test_values_of_the_annotated_type_are_kept() -> None:
+    values = [1, 2]
+    assert compile_converter(List[Any])(values) is values
+    mapping = {'a': 1}
+    assert compile_converter(Dict[Any, Any])(mapping) is mapping
+    assert compile_converter(Optional[Color])(Color.RED) is Color.RED
+
+
+@mark.parametrize(
+    ('annotation', 'value'),
+    [
+        (List[int], [1, 2]),
+        (Set[str], {'a', 'b'}),
+        (Deque[List[int]], deque([[1]])),
+        (Tuple[int, str], (1, 'a')),
+        (Dict[str, List[float]], {'a': [1.0]}),
+        (CounterType[int], Counter([1, 1])),
+        (DefaultDict[str, int], defaultdict(int, {'a': 1})),
+    ],
+)
+def test_containers_of_the_annotated_type_are_kept(annotation: Any, value: Any) -> None:
+    # The callee gets the object of the caller, and can mutate it, when none of its items needs to be converted
+    assert compile_converter(annotation)(value) is value
+
+
+def test_containers_with_items_to_convert_are_copied() -> None:
+    values = [1, '2']
+    assert compile_converter(List[int])(values) == [1, 2]
+    assert values == [1, '2']
+    mapping = {'a': 1}
+    assert compile_converter(Dict[str, float])(mapping) == {'a': 1.0}
+    assert mapping == {'a': 1}
+
+
+@mark.parametrize(
+    ('annotation', 'value', 'error'),
+    [
+        (int, 'a', ValueError),
+        (int, 1.9, ValueError),  # Not truncated
+        (int, Decimal('-0.5'), ValueError),
+        (Optional[int], 2.5, ValueError),
+        (bool, 'maybe', ValueError),
+        (Color, 'green', ValueError),
+        (None, 1, TypeError),
+        (Optional[int], 'a', ValueError),
+        (Literal[1, 2], 3, ValueError),
+        (List[int], '12', TypeError),  # Strings are not split into characters
+        (Tuple[int, int], [1], ValueError),
+    ],
+)
+def test_conversion_errors(annotation: Any, value: Any, error: type[Exception]) -> None:
+    with raises(error):
+        compile_converter(annotation)(value)
+
+
+def test_converters_are_cached_by_annotation() -> None:
+    assert compile_converter(List[Optional[int]]) is compile_converter(List[Optional[int]])
+    assert (List[Optional[int]], repr(List[Optional[int]])) in CONVERTERS_CACHE
+    # Equal unions, which coerce in a different order
+    assert type(compile_converter(Union[int, float])('1')) is int  # pylint: disable=unidiomatic-typecheck
+    assert type(compile_converter(Union[float, int])('1')) is float  # pylint: disable=unidiomatic-typecheck
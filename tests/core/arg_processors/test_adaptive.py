@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import sys
+from types import FunctionType
+from typing import Any, Callable
+
+from pytest import mark, raises
+from typing_extensions import Annotated
+
+from art_deco.hack_args.dispatch import dispatch_arg_hacker
+from art_deco.hack_args.marks import arg_hacker, preprocess_default
+from art_deco.hack_args.processor import hack_args
+from tests.core.arg_processors.test_codegen import CALLS, all_args, double, reverse, upper_keys, validate_x_y
+
+to_int = dispatch_arg_hacker({str: int, int: lambda value: value})
+
+
+@preprocess_default
+@arg_hacker
+def exclaim(value: str) -> str:
+    return f'{value}!'
+
+
+def _warm_up(func: Callable, n_calls: int, *args: Any, **kwargs: Any) -> Any:
+    return [func(*args, **kwargs) for _ in range(n_calls)][-1]
+
+
+@mark.parametrize('hacks', [{'x': double, 'y': double, 'z': double}, {'args': reverse, 'kwargs': upper_keys}])
+@mark.parametrize(('args', 'kwargs'), CALLS)
+def test_adaptive_same_results_as_generic(hacks: dict, args: tuple, kwargs: dict[str, Any]) -> None:
+    adaptive = hack_args(hacks, adaptive=3)(all_args)  # type: ignore[arg-type]
+    generic = hack_args(hacks)(all_args)  # type: ignore[arg-type]
+    assert type(adaptive) is FunctionType  # pylint: disable=unidiomatic-typecheck  # wrapt proxies fake __class__
+    expected = generic(*args, **kwargs)
+    assert _warm_up(adaptive, 3, *args, **kwargs) == expected
+    assert adaptive(*args, **kwargs) == expected  # After the warm-up
+    stats = adaptive.adaptive_stats  # type: ignore[attr-defined]
+    assert sum(stats.shapes.values()) == 3
+    if 'args' not in hacks or len(args) <= 2 and set(kwargs) <= {'x', 'y', 'z', 't'}:
+        assert stats.specialized == (tuple(map(type, args)), tuple((key, type(val)) for key, val in kwargs.items()))
+    else:
+        assert stats.specialized is None  # Variable args are not processed inline
+
+
+def test_adaptive_guard() -> None:
+    @hack_args(adaptive=3)
+    def func(x: Annotated[Any, to_int], y: Any = 3, *, z: Annotated[Any, double] = 'z') -> tuple:
+        return x, y, z
+
+    assert func('1', y=2) == (1, 2, 'zz')
+    assert func('1', z=2) == (1, 3, 4)
+    assert func('1', z=2) == (1, 3, 4)
+    stats = func.adaptive_stats  # type: ignore[attr-defined]
+    assert stats.shapes == {((str,), (('y', int),)): 1, ((str,), (('z', int),)): 2}
+    assert stats.specialized == ((str,), (('z', int),))
+
+    to_int.dispatch_cache.clear()  # type: ignore[attr-defined]
+    assert func('2', z=3) == (2, 3, 6)
+    assert not to_int.dispatch_cache  # type: ignore[attr-defined]  # The fast path calls the converter of str directly
+    assert stats.misses == 0
+    for args, kwargs, expected in (
+        ((2,), {'z': 3}, (2, 3, 6)),  # Another type
+        (('2',), {'y': 3}, (2, 3, 'zz')),  # Other keywords
+        (('2', 4), {'z': 3}, (2, 4, 6)),  # Another number of positional values
+    ):
+        assert func(*args, **kwargs) == expected
+    assert stats.misses == 3
+    assert sum(stats.shapes.values()) == 3  # Calls are only recorded during the warm-up
+
+
+@mark.skipif(sys.version_info[:2] < (3, 8), reason='Positional only arguments are supported in python 3.8+')
+def test_adaptive_defaults_and_methods() -> None:
+    namespace: dict[str, Any] = {}
+    source = "def method(self, a: int, b: str = 'b', /, c: str = 'c') -> tuple:\n    return self, a, b, c"
+    exec(source, namespace)  # noqa: S102  # pylint: disable=exec-used  # positional only syntax is python 3.8+
+
+    class Example:
+        method = hack_args({'a': double, 'b': exclaim, 'c': exclaim}, adaptive=1)(namespace['method'])
+
+    example = Example()
+    for _ in range(3):
+        assert example.method(1) == (example, 2, 'b!', 'c!')
+    assert Example.method.adaptive_stats.specialized == ((Example, int), ())  # type: ignore[attr-defined]
+
+
+def test_adaptive_fallbacks() -> None:
+    def func(x: int, y: int) -> int:
+        return x + y
+
+    with_wide_checks = hack_args({('x', 'y'): validate_x_y}, adaptive=1)(func)
+    assert type(with_wide_checks) is not FunctionType  # pylint: disable=unidiomatic-typecheck
+
+    adaptive = hack_args({'x': double}, adaptive=1)(func)
+    with raises(TypeError):
+        adaptive(1)  # type: ignore[call-arg]
+    assert adaptive.adaptive_stats.specialized is None  # type: ignore[attr-defined]  # The dominant call is invalid
+    assert adaptive(1, 2) == 4
+
+    with raises(ValueError, match='Adaptive wrappers'):
+        hack_args(adaptive=1, codegen=True)(func)
+    with raises(ValueError, match='static mode'):
+        hack_args(adaptive=1, is_dynamic=True)
+    with raises(ValueError, match='must be positive'):
+        hack_args(adaptive=-1)(func)
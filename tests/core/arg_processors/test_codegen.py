@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import inspect
+from types import FunctionType
+from typing import Any, Callable, Type
+
+from pytest import mark, raises
+from typing_extensions import Annotated
+
+from art_deco.core.arg_processors.api import Context
+from art_deco.core.specs.dynamic_arg_specs import DynamicArgSpec
+from art_deco.core.specs.static_arg_specs import StaticArgSpecs
+from art_deco.hack_args.marks import arg_hacker, arg_hacker_with_specs, wide_validator
+from art_deco.hack_args.processor import hack_args
+from art_deco_test_examples.functions.async_funcs import async_func
+
+
+@arg_hacker
+def double(x: Any) -> Any:
+    return x * 2
+
+
+@arg_hacker
+def reverse(values: tuple) -> tuple:
+    return tuple(reversed(values))
+
+
+@arg_hacker
+def upper_keys(values: dict[str, Any]) -> dict[str, Any]:
+    return {key: str(value).upper() for key, value in values.items()}
+
+
+@arg_hacker_with_specs
+def with_specs(_: StaticArgSpecs, spec: DynamicArgSpec) -> Any:
+    return spec.value
+
+
+@wide_validator
+def validate_x_y(_: Context, x: Any, y: Any) -> None:
+    assert x != y
+
+
+def all_args(x: Any, y: Any = 3, *args: Any, z: Any, t: Any = 't', **kwargs: Any) -> tuple:
+    return x, y, args, z, t, kwargs
+
+
+CALLS = [  # noqa: WPS407
+    ((1,), {'z': 2}),
+    ((1, 2), {'z': 3, 't': 4}),
+    ((1, 2, 3, 4), {'z': 5, 'a': 'a', 'b': 'b'}),
+    ((), {'x': 1, 'y': 2, 'z': 3, 'a': 'a'}),
+]
+
+
+def _is_compiled(func: Callable) -> bool:
+    return type(func) is FunctionType  # pylint: disable=unidiomatic-typecheck  # wrapt proxies fake __class__
+
+
+@mark.parametrize(('args', 'kwargs'), CALLS)
+def test_codegen_same_results_as_generic(args: tuple, kwargs: dict[str, Any]) -> None:
+    hacks = {'x': double, 'y': double, 'args': reverse, 'z': double, 'kwargs': upper_keys}
+    compiled = hack_args(hacks, codegen=True)(all_args)  # type: ignore[arg-type]
+    generic = hack_args(hacks)(all_args)  # type: ignore[arg-type]
+    assert _is_compiled(compiled)
+    assert not _is_compiled(generic)
+    assert compiled(*args, **kwargs) == generic(*args, **kwargs)
+
+
+def test_codegen_annotated_and_methods() -> None:
+    class Example:
+        @hack_args(codegen=True)
+        def method(self, x: Annotated[int, double], *, y: Annotated[int, double] = 5) -> tuple[Any, int, int]:
+            return self, x, y
+
+        @staticmethod
+        @hack_args(codegen=True)
+        def static(x: Annotated[int, double]) -> int:
+            return x
+
+        @classmethod
+        @hack_args(codegen=True)
+        def cls_method(cls: Type, x: Annotated[int, double]) -> tuple[Type, int]:
+            return cls, x
+
+    example = Example()
+    assert example.method(1) == (example, 2, 10)
+    assert example.method(x=1, y=2) == (example, 2, 4)
+    assert Example.static(3) == 6
+    assert Example.cls_method(4) == (Example, 8)
+
+
+def test_codegen_preserves_func_properties() -> None:
+    @hack_args({'x': double}, codegen=True)
+    def some_function(x: int, y: int = 1) -> int:
+        """Test docstring."""
+        return x + y
+
+    assert some_function.__doc__ == 'Test docstring.'
+    assert some_function.__name__ == 'some_function'
+    assert list(inspect.signature(some_function).parameters) == ['x', 'y']
+    with raises(TypeError):
+        some_function()  # type: ignore[call-arg]  # pylint: disable=no-value-for-parameter
+
+
+def test_codegen_falls_back() -> None:
+    assert not _is_compiled(hack_args({'x': with_specs}, codegen=True)(all_args))
+    assert not _is_compiled(hack_args({'x': double, ('x', 'y'): validate_x_y}, codegen=True)(all_args))
+    assert not _is_compiled(hack_args({'x': double}, codegen=True)(async_func))
+    with raises(ValueError, match='static mode'):
+        hack_args(codegen=True, is_dynamic=True)
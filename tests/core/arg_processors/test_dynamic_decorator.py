@@ -4,7 +4,7 @@ from typing import Any, Mapping
 from unittest.mock import call, patch
 
 from art_deco.core.arg_processors.api import ArgNames, Context, MultiArgValidateFunc
-from art_deco.core.arg_processors.dynamic_decorator import dynamic_process_args
+from art_deco.core.arg_processors.dynamic_decorator import call_shape, call_shape_and_types, dynamic_process_args
 from art_deco.core.specs.dynamic_arg_specs import DynamicArgSpec
 
 
@@ -47,3 +47,37 @@ def test_number_of_calls() -> None:
         assert processor.return_value.should_process_arg.call_args_list == [call('x'), call('y')] * 3  # noqa: WPS435
         assert processor.return_value.process_arg.call_count == n_calls * 2  # Each call we are processing each arg
         assert processor.return_value.get_wide_checks.call_count == n_calls  # Called once for each call
+
+
+def test_reuse_processors_by_call_shape() -> None:
+    with patch('tests.core.arg_processors.test_dynamic_decorator.StringProcessor') as processor:
+
+        @dynamic_process_args(processor, cache_key=call_shape)
+        def some_func(x: str, y: str = '') -> str:
+            return x + y
+
+        for _ in range(3):
+            some_func('1', '2')
+            some_func('1', y='2')
+            some_func('1')  # Same shape as the previous call, since defaults are bound as keywords
+
+        assert processor.call_count == 2  # One processor for each distinct call shape
+        # Each processor is asked once whether to process each argument
+        assert processor.return_value.should_process_arg.call_args_list == [call('x'), call('y')] * 2  # noqa: WPS435
+        assert processor.return_value.process_arg.call_count == 9 * 2
+        assert processor.return_value.get_wide_checks.call_count == 9
+
+
+def test_reused_processors_are_bounded() -> None:
+    with patch('tests.core.arg_processors.test_dynamic_decorator.StringProcessor') as processor:
+
+        @dynamic_process_args(processor, cache_key=call_shape_and_types, max_cached_processors=2)
+        def some_func(x: Any) -> Any:
+            return x
+
+        for value in [1, 'a', 1.0, 1, 'a', 1.0]:
+            some_func(value)
+        assert processor.call_count == 6  # The least recently used processor was evicted every time
+        for _ in range(3):
+            some_func(1.0)
+        assert processor.call_count == 6
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from typing import Any, Mapping
+from unittest.mock import PropertyMock, patch
+
+from art_deco.core.arg_processors.api import ArgNames, Context, MultiArgValidateFunc
+from art_deco.core.arg_processors.processing import process, rebuild_call, run_wide_checks
+from art_deco.core.specs.dynamic_arg_specs import DynamicArgSpec, DynamicArgSpecs
+from art_deco.core.specs.dynamic_inspector import get_dynamic_arg_specs
+from art_deco.core.specs.static_inspector import get_static_arg_specs
+from art_deco_test_examples.functions.var_arg_and_kwonly_funcs import func_with_var_args_and_kwargs
+
+
+class UpperProcessor:
+    def __init__(self, checks: Mapping[ArgNames, MultiArgValidateFunc]) -> None:
+        self.checks = checks
+
+    def should_process_arg(self, arg: str) -> bool:
+        return arg in {'z', 'args', 'kwargs'}
+
+    def process_arg(self, arg: DynamicArgSpec, _: Context) -> Any:
+        if arg.name == 'args':
+            return tuple(-value for value in arg.value)
+        if arg.name == 'kwargs':
+            return {key: -value for key, value in arg.value.items()}
+        return arg.value.upper()
+
+    def get_wide_checks(self) -> Mapping[ArgNames, MultiArgValidateFunc]:
+        return self.checks
+
+
+def _context(args: tuple, kwargs: dict[str, Any]) -> Context:
+    static_specs = get_static_arg_specs(func_with_var_args_and_kwargs, parse_type_hints=True)
+    return Context(static_specs, get_dynamic_arg_specs(static_specs, args, kwargs))
+
+
+def test_process() -> None:
+    checked: list[tuple] = []
+    processor = UpperProcessor({('z', 'a'): lambda _, *values: checked.append(values)})
+    context = _context((1, [2], 'z', 't', 5, 6), {'some_keyword': 7, 'a': 8})
+    result = process(processor, context, processor.should_process_arg)
+    assert result is not None
+    new_args, new_kwargs = result
+    assert new_args == [1, [2], 'Z', 't', -5, -6]
+    assert new_kwargs == {'some_keyword': 7, 'a': -8}
+    assert checked == [('Z', -8)]
+
+
+class IdentityProcessor(UpperProcessor):
+    def process_arg(self, arg: DynamicArgSpec, _: Context) -> Any:
+        return arg.value
+
+
+def test_process_without_changes() -> None:
+    checked: list[tuple] = []
+    processor = IdentityProcessor({('z', 'a'): lambda _, *values: checked.append(values)})
+    context = _context((1, [2], 'z', 't', 5, 6), {'some_keyword': 7, 'a': 8})
+    with patch('art_deco.core.arg_processors.processing.rebuild_call') as rebuild:
+        assert process(processor, context, processor.should_process_arg) is None
+    rebuild.assert_not_called()
+    assert checked == [('z', 8)]
+
+
+def test_variable_args_are_only_combined_when_processed() -> None:
+    processor = UpperProcessor({})
+    context = _context((1, [2], 'z', 't', 5, 6), {'some_keyword': 7, 'a': 8})
+    with patch.object(DynamicArgSpecs, 'var_args_spec', new_callable=PropertyMock) as var_args_spec:
+        with patch.object(DynamicArgSpecs, 'var_kwargs_spec', new_callable=PropertyMock) as var_kwargs_spec:
+            process(processor, context, lambda name: name == 'z')
+    var_args_spec.assert_not_called()
+    var_kwargs_spec.assert_not_called()
+
+
+def test_rebuild_call_and_wide_checks() -> None:
+    context = _context((1, [2]), {'z': 'z', 'some_keyword': 7})
+    assert rebuild_call(context.dynamic_args) == ([1, [2]], {'z': 'z', 'some_keyword': 7, 't': None})
+    assert rebuild_call(context.dynamic_args, n_bound_args=1) == ([[2]], {'z': 'z', 'some_keyword': 7, 't': None})
+
+    checked: list[tuple] = []
+    run_wide_checks(UpperProcessor({('t', 'x'): lambda _, *values: checked.append(values)}), context)
+    assert checked == [(None, 1)]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import tracemalloc
 from typing import Any, Mapping, Type, cast
 from unittest.mock import call, patch
 
@@ -97,3 +98,30 @@ def test_number_of_calls() -> None:
         assert processor.return_value.should_process_arg.call_args_list == [call('x'), call('y')]
         assert processor.return_value.process_arg.call_count == 6  # Each call we are processing each arg
         assert processor.return_value.get_wide_checks.call_count == 3  # Called once for each call
+
+
+def test_per_call_allocations() -> None:
+    @static_process_args(SimpleCastingProcessor)
+    def coercion(x: int, y: float, z: int = 3) -> float:
+        return x + y + z
+
+    for _ in range(10):  # Warm up any lazily built state, e.g. the binding plan
+        coercion(1, 2)
+    tracemalloc.start()
+    try:
+        coercion(1, 2)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert peak < 2048  # Mostly the dynamic specs of the call, which are slotted
+
+
+def test_passthrough_without_args_to_process() -> None:
+    @static_process_args(SimpleCastingProcessor)
+    def no_hints(x, y=2):  # type: ignore[no-untyped-def]
+        return x, y
+
+    with patch('art_deco.core.specs.binding_plan.BindingPlan.bind') as bind:
+        assert no_hints('1') == ('1', 2)
+        assert no_hints('1', y='2') == ('1', '2')
+    bind.assert_not_called()
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Mapping
+
+from pytest import raises
+
+from art_deco.core.arg_processors.api import ArgNames, Context, MultiArgValidateFunc
+from art_deco.core.arg_processors.static_decorator import static_process_args
+from art_deco.core.arg_processors.threaded_processing import ThreadedProcessing
+from art_deco.core.specs.dynamic_arg_specs import DynamicArgSpec
+from art_deco.core.specs.dynamic_inspector import get_dynamic_arg_specs
+from art_deco.core.specs.static_arg_specs import StaticArgSpecs
+from art_deco.core.specs.static_inspector import get_static_arg_specs
+from art_deco_test_examples.functions.var_arg_and_kwonly_funcs import func_with_var_args_and_kwargs
+
+
+class SleepyProcessor:
+    """Sleeps ``delays[name]`` seconds (releasing the GIL) before processing an arg, and fails for negative delays."""
+
+    def __init__(self, delays: Mapping[str, float], checks: Mapping[ArgNames, MultiArgValidateFunc]) -> None:
+        self.delays = delays
+        self.checks = checks
+        self.threads: set[str] = set()
+
+    def should_process_arg(self, arg: str) -> bool:
+        return arg in self.delays
+
+    def process_arg(self, arg: DynamicArgSpec, _: Context) -> Any:
+        delay = self.delays[arg.name]
+        if delay:
+            time.sleep(abs(delay))
+        self.threads.add(threading.current_thread().name)
+        if delay < 0:
+            raise ValueError(arg.name)
+        if isinstance(arg.value, tuple):
+            return tuple(-value for value in arg.value)
+        if isinstance(arg.value, dict):
+            return {key: -value for key, value in arg.value.items()}
+        return f'{arg.name}{arg.value}'
+
+    def get_wide_checks(self) -> Mapping[ArgNames, MultiArgValidateFunc]:
+        return self.checks
+
+
+def _always_threaded(**kwargs: Any) -> ThreadedProcessing:
+    threaded = ThreadedProcessing(**kwargs)
+    threaded.cost = threaded.inline_cost_threshold  # As if the hacks were measured to be expensive
+    return threaded
+
+
+def _context(args: tuple, kwargs: dict[str, Any]) -> Context:
+    static_specs = get_static_arg_specs(func_with_var_args_and_kwargs, parse_type_hints=True)
+    return Context(static_specs, get_dynamic_arg_specs(static_specs, args, kwargs))
+
+
+def test_threaded_process() -> None:
+    checked: list[tuple] = []
+    processor = SleepyProcessor(
+        {'x': 0.05, 'y': 0.05, 'z': 0.05, 'args': 0, 'kwargs': 0},
+        {('x', 'z'): lambda _, *values: checked.append(values)},
+    )
+    threaded = _always_threaded()
+    context = _context((1, [2], 'z', 't', 5, 6), {'some_keyword': 7, 'a': 8})
+    start = time.perf_counter()
+    new_call = threaded.process(processor, context, processor.should_process_arg)
+    assert time.perf_counter() - start < 0.12  # The hacks of x, y and z run concurrently
+    assert new_call == (['x1', 'y[2]', 'zz', 't', -5, -6], {'some_keyword': 7, 'a': -8})
+    assert checked == [('x1', 'zz')]
+    assert all(name.startswith('art_deco') for name in processor.threads)
+
+
+def test_cheap_hacks_run_inline() -> None:
+    processor = SleepyProcessor({'x': 0.001, 'y': 0.001, 'z': 0.001}, {})
+    threaded = ThreadedProcessing(inline_cost_threshold=0.1)
+    for _ in range(3):
+        threaded.process(processor, _context((1, [2], 'z'), {}), processor.should_process_arg)
+    assert processor.threads == {threading.current_thread().name}
+    assert 0 < threaded.cost < 0.1
+
+
+def test_expensive_hacks_run_in_threads() -> None:
+    processor = SleepyProcessor({'x': 0.002, 'y': 0.002}, {})
+    threaded = ThreadedProcessing()
+    threaded.process(processor, _context((1, [2], 'z'), {}), processor.should_process_arg)
+    assert processor.threads == {threading.current_thread().name}  # The first call measures the cost of the hacks
+    threaded.process(processor, _context((1, [2], 'z'), {}), processor.should_process_arg)
+    assert len(processor.threads) > 1
+
+
+def test_first_error_in_args_order() -> None:
+    processor = SleepyProcessor({'x': -0.05, 'y': 0, 'z': -0.01}, {})
+    with raises(ValueError, match='x'):
+        _always_threaded().process(processor, _context((1, [2], 'z'), {}), processor.should_process_arg)
+
+
+def test_hacks_in_workers_run_inline() -> None:
+    executor = ThreadPoolExecutor(max_workers=1)  # A worker waiting for another worker would deadlock
+    inner = static_process_args(lambda _: SleepyProcessor({'a': 0, 'b': 0}, {}), use_threads=True)(lambda a, b: (a, b))
+
+    class NestedProcessor(SleepyProcessor):
+        def process_arg(self, arg: DynamicArgSpec, context: Context) -> Any:
+            return inner(arg.value, arg.value)
+
+    processor = NestedProcessor({'x': 0, 'y': 0}, {})
+    threaded = _always_threaded(executor_factory=lambda: executor)
+    try:
+        new_call = threaded.process(processor, _context((1, 2, 'z'), {}), processor.should_process_arg)
+    finally:
+        executor.shutdown()
+    assert new_call is not None
+    assert new_call[0][:2] == [('a1', 'b1'), ('a2', 'b2')]
+
+
+def test_static_process_args_with_threads() -> None:
+    def factory(_: StaticArgSpecs) -> SleepyProcessor:
+        return SleepyProcessor({'x': 0, 'y': 0}, {})
+
+    @static_process_args(factory, use_threads=True)
+    def func(x: Any, y: Any = 'y') -> tuple:
+        return x, y
+
+    assert func(1) == ('x1', 'yy')
+    with raises(ValueError, match='threads'):
+        static_process_args(factory, use_threads=True, codegen=True)
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from typing import Any, Optional
+
+from typing_extensions import Annotated, get_type_hints
+
+from art_deco.core.specs.annotation_cache import AnnotationsCache, get_cached_type_hints
+
+MODULE_SOURCE = '''
+from __future__ import annotations
+
+from typing import List
+
+from typing_extensions import Annotated
+
+
+def hack(value):
+    return value
+
+
+def first(x: Annotated[List[int], hack], y: int = None) -> int:
+    return x
+
+
+def second(x: Annotated[List[int], hack], *, z: 'Element') -> int:
+    return x
+
+
+class Element:
+    pass
+'''
+
+
+def _module_globals() -> dict[str, Any]:
+    globalns: dict[str, Any] = {'__name__': 'synthetic'}
+    exec(MODULE_SOURCE, globalns)  # noqa: S102  # pylint: disable=exec-used
+    return globalns
+
+
+def test_same_hints_as_get_type_hints() -> None:
+    globalns = _module_globals()
+    for func in (globalns['first'], globalns['second']):
+        for include_extras in (False, True):
+            expected = get_type_hints(func, include_extras=include_extras)
+            assert get_cached_type_hints(func, include_extras=include_extras) == expected
+    hints = get_cached_type_hints(globalns['first'])
+    assert hints['y'] == Optional[int] or hints['y'] is int  # Optional defaults before python 3.11
+
+
+def test_annotations_are_evaluated_once_per_module() -> None:
+    cache = AnnotationsCache()
+    globalns = _module_globals()
+    annotation = globalns['first'].__annotations__['x']
+    assert annotation == globalns['second'].__annotations__['x'] == 'Annotated[List[int], hack]'
+    value = cache.evaluate(annotation, globalns)
+    assert cache.evaluate(annotation, globalns) is value
+    assert cache.evaluate(annotation, _module_globals()) is not value  # Other module
+    assert (cache.stats.hits, cache.stats.misses) == (1, 2)
+
+
+def test_invalidation() -> None:
+    cache = AnnotationsCache()
+    globalns = _module_globals()
+    hack = globalns['hack']
+    assert cache.evaluate('Annotated[int, hack]', globalns) == Annotated[int, hack]
+    globalns['hack'] = len
+    assert cache.evaluate('Annotated[int, hack]', globalns) == Annotated[int, len]
+    assert cache.evaluate('int', globalns) is int
+    globalns['int'] = float  # Shadows the builtin
+    assert cache.evaluate('int', globalns) is float
+    assert (cache.stats.hits, cache.stats.invalidations) == (0, 2)
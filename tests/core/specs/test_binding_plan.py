@@ -0,0 +1,76 @@
+import sys
+from typing import Any, Callable, Dict, Tuple
+
+from pytest import mark
+
+from art_deco.core.specs.binding_plan import BindingPlan
+from art_deco.core.specs.static_inspector import get_static_arg_specs
+from art_deco.utils.dynamic_args import dynamic_specs_to_dict
+from art_deco_test_examples.functions.var_arg_and_kwonly_funcs import func_with_kwonly, func_with_var_args_and_kwargs
+
+
+def _make_func(source: str) -> Callable[..., Any]:
+    namespace: Dict[str, Any] = {}
+    exec(source, namespace)  # noqa: S102  # pylint: disable=exec-used  # positional only syntax is python 3.8+
+    return namespace['func']  # type: ignore[no-any-return]
+
+
+def test_binding_plan_tables() -> None:
+    plan = BindingPlan.from_static_specs(get_static_arg_specs(func_with_var_args_and_kwargs, parse_type_hints=True))
+    assert [arg.name for arg in plan.positional] == ['x', 'y', 'z', 't']
+    assert [arg.name for arg in plan.keyword_only] == ['some_keyword']
+    assert plan.n_positional_only == 0
+    assert plan.var_positional is not None and plan.var_positional.name == 'args'
+    assert plan.var_keyword is not None and plan.var_keyword.name == 'kwargs'
+    assert plan.has_variable_args
+
+    no_var_args_plan = BindingPlan.from_static_specs(get_static_arg_specs(func_with_kwonly, parse_type_hints=True))
+    assert not no_var_args_plan.has_variable_args
+
+
+def test_bind_with_kwonly() -> None:
+    plan = BindingPlan.from_static_specs(get_static_arg_specs(func_with_kwonly, parse_type_hints=True))
+    assert dynamic_specs_to_dict(plan.bind((1, 2), {'z': 3})) == [
+        {'name': 'x', 'value': 1, 'called_as_kw': False},
+        {'name': 'y', 'value': 2, 'called_as_kw': False},
+        {'name': 'z', 'value': 3, 'called_as_kw': True},
+    ]
+    assert dynamic_specs_to_dict(plan.bind((), {'z': 3, 'y': 2, 'x': 1})) == [
+        {'name': 'z', 'value': 3, 'called_as_kw': True},
+        {'name': 'y', 'value': 2, 'called_as_kw': True},
+        {'name': 'x', 'value': 1, 'called_as_kw': True},
+    ]
+
+
+@mark.skipif(sys.version_info[:2] < (3, 8), reason='Positional only arguments are supported in python 3.8+')
+@mark.parametrize('kwargs', [{}, {'c': 3}])
+def test_bind_positional_only_defaults(kwargs: Dict[str, Any]) -> None:
+    func = _make_func('def func(a, b=2, /, c=3, *, d=4):\n    pass')
+    plan = BindingPlan.from_static_specs(get_static_arg_specs(func, parse_type_hints=True))
+    assert plan.n_positional_only == 2
+
+    res = dynamic_specs_to_dict(plan.bind((1,), kwargs))
+    assert res[:2] == [
+        {'name': 'a', 'value': 1, 'called_as_kw': False},
+        {'name': 'b', 'value': 2, 'called_as_kw': False},  # Positional only defaults are still positional
+    ]
+    assert res[2:] == [
+        {'name': 'c', 'value': 3, 'called_as_kw': True},
+        {'name': 'd', 'value': 4, 'called_as_kw': True},
+    ]
+
+
+@mark.parametrize(
+    ('args', 'kwargs'),
+    [((1,), {}), ((1, [2], 'z', 't', 5), {}), ((1,), {'z': 'z', 'a': 8}), ((), {'y': [2], 'z': 'z'}), ((), {})],
+)
+def test_bind_instance(args: tuple, kwargs: Dict[str, Any]) -> None:
+    funcs: Tuple[Callable[..., Any], ...] = (
+        func_with_var_args_and_kwargs,
+        _make_func('def func(*args, **kwargs):\n    pass'),
+    )
+    for func in funcs:
+        plan = BindingPlan.from_static_specs(get_static_arg_specs(func, parse_type_hints=True))
+        assert dynamic_specs_to_dict(plan.bind(args, kwargs, 'instance')) == dynamic_specs_to_dict(
+            plan.bind(('instance', *args), kwargs)
+        )
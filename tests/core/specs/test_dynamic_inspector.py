@@ -3,6 +3,7 @@ from art_deco.core.specs.static_inspector import get_static_arg_specs
 from art_deco.utils.dynamic_args import dynamic_specs_to_dict
 from art_deco_test_examples.functions.simple_funcs import simple_func
 from art_deco_test_examples.functions.var_arg_and_kwonly_funcs import func_with_var_args_and_kwargs
+from art_deco_test_examples.functions.wide_funcs import make_wide_func
 from art_deco_test_examples.methods.normal_methods import ExampleClass
 
 
@@ -66,3 +67,34 @@ def test_get_dynamic_arg_specs_methods() -> None:
     static_args_static = get_static_arg_specs(ExampleClass.func_with_var_args_and_kwargs_static, parse_type_hints=True)
     res3 = get_dynamic_arg_specs(static_args_static, args=(1, [2], '', 3), kwargs={'some_keyword': 1, 'other_kw': 2})
     assert dynamic_specs_to_dict(res3) == dynamic_specs_to_dict(res1)
+
+
+def test_get_dynamic_arg_specs_wide_signatures() -> None:
+    n_params, n_defaults = 300, 100
+    static_args = get_static_arg_specs(make_wide_func(n_params, n_defaults=n_defaults), parse_type_hints=True)
+
+    positional = get_dynamic_arg_specs(static_args, args=tuple(range(n_params)), kwargs={})
+    assert dynamic_specs_to_dict(positional) == [
+        {'name': f'p{i}', 'value': i, 'called_as_kw': False} for i in range(n_params)
+    ]
+
+    keyword = get_dynamic_arg_specs(static_args, args=(), kwargs={f'p{i}': -i for i in reversed(range(n_params))})
+    assert dynamic_specs_to_dict(keyword) == [
+        {'name': f'p{i}', 'value': -i, 'called_as_kw': True} for i in reversed(range(n_params))
+    ]
+
+    n_required = n_params - n_defaults
+    mixed = get_dynamic_arg_specs(static_args, args=tuple(range(n_required - 1)), kwargs={f'p{n_required - 1}': 'kw'})
+    assert dynamic_specs_to_dict(mixed) == [
+        *({'name': f'p{i}', 'value': i, 'called_as_kw': False} for i in range(n_required - 1)),
+        {'name': f'p{n_required - 1}', 'value': 'kw', 'called_as_kw': True},
+        *({'name': f'p{i}', 'value': i, 'called_as_kw': True} for i in range(n_required, n_params)),
+    ]
+
+
+def test_get_dynamic_arg_specs_wide_var_args() -> None:
+    static_args = get_static_arg_specs(make_wide_func(50, var_args=True), parse_type_hints=True)
+    res = get_dynamic_arg_specs(static_args, args=tuple(range(52)), kwargs={'extra': 1})
+    assert [arg.name for arg in res.args[-3:]] == ['__art_deco_auto_name__0', '__art_deco_auto_name__1', 'extra']
+    assert res.args_by_name['__art_deco_auto_name__1'].static is static_args.var_positional
+    assert res.args_by_name['extra'].static is static_args.var_keyword
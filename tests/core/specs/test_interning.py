@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import gc
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable
+
+from pytest import mark
+from typing_extensions import Annotated
+
+from art_deco.core.specs.interning import _SPECS_TABLE
+from art_deco.core.specs.static_inspector import get_static_arg_specs
+from art_deco.core.specs.type_hints_parsers import ExtrasTypeHintsParser
+from art_deco.hack_args.marks import arg_hacker
+from art_deco.hack_args.processor import hack_args
+
+
+def _make_func(default: Any = 1) -> Callable:
+    def func(x: Annotated[int, 'meta'], y: Any = default) -> int:
+        return x
+
+    return func
+
+
+def test_identical_specs_are_shared() -> None:
+    specs = get_static_arg_specs(_make_func(), parse_type_hints=ExtrasTypeHintsParser)
+    other_specs = get_static_arg_specs(_make_func(), parse_type_hints=ExtrasTypeHintsParser)
+    assert specs is other_specs
+    assert specs.binding_plan is other_specs.binding_plan
+    assert get_static_arg_specs(_make_func(), parse_type_hints=True) is not specs  # Annotated is stripped
+    assert get_static_arg_specs(_make_func(True), parse_type_hints=True).args[1].default_val is True  # Not 1
+    different_specs = get_static_arg_specs(_make_func(2), parse_type_hints=ExtrasTypeHintsParser)
+    assert different_specs is not specs
+    assert different_specs.args[0] is specs.args[0]  # Identical args are shared too
+
+
+def test_mutable_defaults_are_never_shared() -> None:
+    specs = get_static_arg_specs(_make_func([]), parse_type_hints=True)
+    other_specs = get_static_arg_specs(_make_func([]), parse_type_hints=True)
+    assert specs.args[1].default_val is not other_specs.args[1].default_val
+    assert specs.args[0] is other_specs.args[0]
+
+
+def test_interned_specs_are_released() -> None:
+    gc.collect()
+    size = len(_SPECS_TABLE)
+    specs = get_static_arg_specs(_make_func('released'), parse_type_hints=True)
+    assert len(_SPECS_TABLE) == size + 1
+    del specs  # noqa: WPS420
+    gc.collect()
+    assert len(_SPECS_TABLE) == size
+
+
+@arg_hacker
+def double(value: int) -> int:
+    return value * 2
+
+
+def _make_hacked_func(default: Any) -> Callable:
+    @hack_args()
+    def func(x: Annotated[int, double], y: Any = default) -> tuple[int, Any]:
+        return x, y
+
+    return func
+
+
+@mark.parametrize(
+    ('default', 'equal_default'),
+    [
+        ((1,), (True,)),
+        ((0.0, 'a'), (-0.0, 'a')),
+        (datetime(2024, 1, 1, tzinfo=timezone.utc), datetime(2024, 1, 1, 1, tzinfo=timezone(timedelta(hours=1)))),
+    ],
+)
+def test_equal_defaults_are_not_shared(default: Any, equal_default: Any) -> None:
+    assert default == equal_default
+    func, other_func = _make_hacked_func(default), _make_hacked_func(equal_default)
+    assert func(1)[1] is default
+    assert other_func(1)[1] is equal_default
+    specs = get_static_arg_specs(_make_func(default), parse_type_hints=True)
+    assert specs is not get_static_arg_specs(_make_func(equal_default), parse_type_hints=True)
+    assert specs is get_static_arg_specs(_make_func(default), parse_type_hints=True)
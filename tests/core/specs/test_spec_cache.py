@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import gc
+from typing import Any
+
+from typing_extensions import Annotated
+
+from art_deco.core.arg_processors.dynamic_decorator import dynamic_process_args
+from art_deco.core.specs.spec_cache import STATIC_SPECS_CACHE, StaticSpecsCache
+from art_deco.core.specs.static_inspector import get_static_arg_specs
+from art_deco.core.specs.type_hints_parsers import ExtrasTypeHintsParser, TypeHintsParser
+from art_deco.hack_args.marks import arg_hacker
+from art_deco.hack_args.processor import hack_args
+from art_deco_test_examples.methods.normal_methods import ExampleClass
+
+
+def test_hits_and_misses() -> None:
+    def func(x: int, y: Annotated[int, 'meta'] = 1) -> int:
+        return x + y
+
+    cache = StaticSpecsCache()
+    specs = cache.get(func, parse_type_hints=True)
+    assert specs == get_static_arg_specs(func, parse_type_hints=True)
+    assert cache.get(func, parse_type_hints=True) is specs
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+    extras_specs = cache.get(func, parse_type_hints=ExtrasTypeHintsParser)  # Different parsers are cached separately
+    assert extras_specs.args_by_name['y'].annotation == Annotated[int, 'meta']
+    assert (cache.stats.hits, cache.stats.misses) == (1, 2)
+    assert len(cache) == 2
+
+    cache.get(func, parse_type_hints=TypeHintsParser(func))  # Unhashable parsers are not cached
+    assert (cache.stats.hits, cache.stats.misses) == (1, 3)
+    assert cache.stats.hit_rate == 0.25
+
+
+def test_invalidation() -> None:
+    def func(x: int, y: int = 1, *, z: int = 2) -> int:
+        return x + y + z
+
+    def other(x: str) -> str:
+        return x
+
+    cache = StaticSpecsCache()
+    assert cache.get(func, parse_type_hints=True).args_by_name['y'].default_val == 1
+    func.__defaults__ = (10,)
+    assert cache.get(func, parse_type_hints=True).args_by_name['y'].default_val == 10
+    func.__kwdefaults__ = {'z': 20}
+    assert cache.get(func, parse_type_hints=True).args_by_name['z'].default_val == 20
+    func.__annotations__['x'] = 'float'
+    assert cache.get(func, parse_type_hints=True).args_by_name['x'].annotation is float
+    func.__code__ = other.__code__
+    func.__defaults__ = None
+    func.__kwdefaults__ = None  # type: ignore[assignment]
+    assert list(cache.get(func, parse_type_hints=True).args_by_name) == ['x']
+    assert cache.stats.invalidations == 4
+    assert cache.stats.hits == 0
+
+
+def test_weak_keys_and_methods() -> None:
+    cache = StaticSpecsCache()
+
+    def func(x: int) -> int:
+        return x
+
+    cache.get(func, parse_type_hints=True)
+    assert len(cache) == 1
+    del func  # noqa: WPS420
+    gc.collect()
+    assert not len(cache)  # pylint: disable=use-implicit-booleaness-not-len
+
+    example = ExampleClass()
+    bound = cache.get(example.func_with_var_args_and_kwargs_normal, parse_type_hints=True)
+    assert cache.get(ExampleClass().func_with_var_args_and_kwargs_normal, parse_type_hints=True) is bound
+    unbound = cache.get(ExampleClass.func_with_var_args_and_kwargs_normal, parse_type_hints=True)
+    assert 'self' in unbound.args_by_name and 'self' not in bound.args_by_name
+    assert (cache.stats.hits, cache.stats.misses) == (1, 3)
+
+
+@arg_hacker
+def hack_x(x: Any) -> str:
+    return f'hacked{x}'
+
+
+def test_dynamic_mode_inspects_once() -> None:
+    @hack_args(is_dynamic=True)
+    def func(x: Annotated[str, hack_x]) -> str:
+        return x
+
+    STATIC_SPECS_CACHE.clear()
+    for _ in range(5):
+        assert func(1) == 'hacked1'  # type: ignore[arg-type]
+    # The specs are inspected once with the default parser and once with the extras parser (by the processor factory,
+    # which is only called for the first call since hack_args reuses its dynamic processors)
+    assert STATIC_SPECS_CACHE.stats.misses == 2
+    assert STATIC_SPECS_CACHE.stats.hits == 4
+
+    class Processor:
+        def __init__(self, _: Any) -> None:
+            """Does not use the context."""
+
+        def should_process_arg(self, _: str) -> bool:
+            return False
+
+        def process_arg(self, *_: Any) -> Any:
+            """Never called."""
+
+        def get_wide_checks(self) -> dict:
+            return {}
+
+    @dynamic_process_args(Processor)
+    def other(y: int) -> int:
+        return y
+
+    other(1)
+    other(2)
+    assert (STATIC_SPECS_CACHE.stats.hits, STATIC_SPECS_CACHE.stats.misses) == (5, 3)
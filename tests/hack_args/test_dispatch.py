@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from decimal import Decimal
+from typing import Any
+
+from pytest import mark, raises
+from typing_extensions import Annotated
+
+from art_deco.hack_args.dispatch import dispatch_arg_hacker
+from art_deco.hack_args.marks import arg_hacker
+from art_deco.hack_args.processor import hack_args, is_hack_arg_without_specs
+
+to_float = dispatch_arg_hacker({str: lambda value: float(value.strip()), int: float, float: lambda value: value})
+describe = dispatch_arg_hacker({object: lambda _: 'object', int: lambda _: 'int', Sequence: lambda _: 'sequence'})
+
+
+@arg_hacker
+def halve(value: float) -> float:
+    return value / 2
+
+
+def test_dispatch_arg_hacker() -> None:
+    assert is_hack_arg_without_specs(to_float)
+    assert to_float(' 1.5 ') == 1.5
+    assert to_float(2) == 2.0
+    assert isinstance(to_float(2), float)
+    assert to_float(True) == 1.0  # Resolved along the MRO of bool, to the converter of int
+    assert set(to_float.dispatch_cache) == {str, int, bool}  # type: ignore[attr-defined]
+    with raises(TypeError, match='No converter for .* of type Decimal'):
+        to_float(Decimal(1))
+
+    assert describe(1) == 'int'
+    assert describe((1,)) == 'sequence'  # Abstract base classes are resolved like with functools.singledispatch
+    assert describe({}) == 'object'
+
+
+@mark.parametrize(('is_dynamic', 'codegen'), [(False, False), (False, True), (True, False)])
+def test_dispatch_hacks_in_chains(is_dynamic: bool, codegen: bool) -> None:
+    @hack_args({'y': to_float}, is_dynamic=is_dynamic, codegen=codegen)
+    def add(x: Annotated[Any, to_float, halve], y: Any = '1') -> float:
+        total: float = x + y
+        return total
+
+    assert add(' 3 ') == 2.5
+    assert add(1, 2) == 2.5
@@ -1,10 +1,12 @@
 # flake8: noqa
 from __future__ import annotations
 
+import asyncio
 import inspect
 import sys
 from asyncio import run
-from typing import Type
+from typing import Any, Type
+from unittest.mock import Mock, patch
 
 from pytest import mark, raises
 from typing_extensions import Annotated
@@ -12,9 +14,24 @@ from typing_extensions import Annotated
 from art_deco.core.arg_processors.api import Context
 from art_deco.core.specs.dynamic_arg_specs import DynamicArgSpec
 from art_deco.core.specs.static_arg_specs import StaticArgSpecs
-from art_deco.hack_args.marks import arg_hacker, arg_hacker_with_specs, wide_validator
-from art_deco.hack_args.processor import hack_args
+from art_deco.core.specs.static_inspector import get_static_arg_specs
+from art_deco.hack_args.marks import (
+    arg_hacker,
+    arg_hacker_with_specs,
+    async_arg_hacker,
+    memoized_arg_hacker,
+    preprocess_default,
+    wide_validator,
+)
+from art_deco.hack_args.processor import (
+    fuse_hacks,
+    hack_args,
+    is_hack_arg_with_specs,
+    is_hack_arg_without_specs,
+    is_preprocessed_default_hack,
+)
 from art_deco_test_examples.functions.async_funcs import async_func
+from art_deco_test_examples.functions.process_pool_funcs import pool_double, pool_fail
 
 
 @arg_hacker
@@ -243,3 +260,280 @@ def test_func_no_args() -> None:
         return
 
     assert no_args() is None
+
+
+@mark.parametrize(('is_dynamic', 'codegen'), [(False, False), (False, True), (True, False)])
+def test_preprocess_defaults(is_dynamic: bool, codegen: bool) -> None:
+    marked = Mock(side_effect=lambda value: f'marked{value}')
+    unmarked = Mock(side_effect=lambda value: f'unmarked{value}')
+    unhashable = Mock(side_effect=lambda value: [*value, 'hacked'])
+
+    @hack_args(
+        {'x': preprocess_default(arg_hacker(marked)), 'y': arg_hacker(unmarked)}, is_dynamic=is_dynamic, codegen=codegen
+    )
+    def func(x: str = 'x', y: str = 'y') -> str:
+        return f'{x};{y}'
+
+    @hack_args({'z': arg_hacker(unhashable)}, is_dynamic=is_dynamic, codegen=codegen, preprocess_defaults=True)
+    def mutable(z: list = []) -> list:  # noqa: B006  # pylint: disable=dangerous-default-value
+        return z
+
+    for _ in range(3):
+        assert func() == 'markedx;unmarkedy'
+    assert func('a', y='b') == 'markeda;unmarkedb'
+    assert marked.call_count == 2  # Once for the default, once for 'a'
+    assert unmarked.call_count == 4
+
+    assert mutable() == ['hacked']
+    assert mutable() == ['hacked']
+    assert unhashable.call_count == 2
+
+
+@preprocess_default
+@arg_hacker
+def split(value: str) -> list[str]:
+    return value.split(',')
+
+
+@mark.parametrize(('is_dynamic', 'codegen'), [(False, False), (False, True), (True, False)])
+def test_mutable_preprocessed_defaults_are_not_shared(is_dynamic: bool, codegen: bool) -> None:
+    @hack_args(is_dynamic=is_dynamic, codegen=codegen)
+    def append(x: Annotated[str, split] = 'a,b') -> Any:
+        x.append('z')  # type: ignore[attr-defined]
+        return x
+
+    @hack_args({'x': preprocess_default(arg_hacker(Mock(side_effect=tuple)))}, is_dynamic=is_dynamic, codegen=codegen)
+    def frozen(x: str = 'ab') -> Any:
+        return x
+
+    for _ in range(3):
+        assert append() == ['a', 'b', 'z']
+    assert frozen() is frozen()  # Tuples of strings are immutable, they are preprocessed once
+
+
+@mark.parametrize('is_dynamic', [False, True])
+def test_preprocess_defaults_with_specs(is_dynamic: bool) -> None:
+    @hack_args({'y': hack_y}, is_dynamic=is_dynamic, preprocess_defaults=True)
+    def add(x: float, y: int = 3) -> float:
+        return x + y
+
+    assert add(1) == 21
+    assert add(1, 2) == 21  # hack_y only looks at the default value
+
+
+@async_arg_hacker
+async def async_hack_x(x: float | str) -> float:
+    await asyncio.sleep(0.05)
+    return hack_x(x)
+
+
+@wide_validator
+async def async_validate_x_z(_: Context, x: float, z: float) -> None:
+    await asyncio.sleep(0.05)
+    assert x + z < 10**5
+
+
+@mark.parametrize('is_dynamic', [False, True])
+def test_async_hacks(is_dynamic: bool) -> None:
+    class ExampleAsync:
+        @hack_args({'x': async_hack_x, 'z': async_hack_x, ('x', 'z'): async_validate_x_z}, is_dynamic=is_dynamic)
+        async def add_method(self, x: int, y: Annotated[int, hack_x] = 1, *, z: float = 5) -> float:
+            return x + y + z
+
+    async def timed_calls() -> float:
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        assert await ExampleAsync().add_method('a', 'b', z='c') == 30  # type: ignore[arg-type]
+        assert await ExampleAsync().add_method(1, z=10) == 12
+        return loop.time() - start
+
+    # Each call awaits the hacks of x and z concurrently, then the wide validator: twice the delay of a hack per call
+    assert run(timed_calls()) < 0.3
+    with raises(AssertionError):
+        run(ExampleAsync().add_method(10**5))
+
+
+@mark.parametrize('is_dynamic', [False, True])
+def test_async_hacks_need_coroutine_functions(is_dynamic: bool) -> None:
+    with raises(TypeError, match='coroutine functions'):  # When the processor is created
+
+        @hack_args({'x': async_hack_x}, is_dynamic=is_dynamic)
+        def add(x: float, y: int = 3) -> float:
+            return x + y
+
+        add(1)
+
+
+def test_hack_args_with_threads() -> None:
+    @hack_args({'x': hack_x, 'y': hack_y, ('x', 'z'): validate_x_z}, use_threads=True)
+    def add(x: float, y: int = 3, z: Annotated[int, hack_z] = 4) -> float:
+        return x + y + z
+
+    assert add('a', 2, 3) == 60  # type: ignore[arg-type]  # mypy correctly identifies the problem
+    assert add(1) == 51
+    with raises(ValueError, match='static mode'):
+        hack_args(use_threads=True, is_dynamic=True)
+
+
+def test_process_pool_hacks() -> None:
+    @hack_args({'x': pool_double})
+    def add(x: int, y: Annotated[int, pool_double] = 3) -> int:
+        return x + y
+
+    @hack_args({'x': pool_double, 'y': pool_double})
+    async def async_add(x: int, y: int = 3) -> int:
+        return x + y
+
+    assert add(1) == 8
+    assert run(async_add(1, y=2)) == 6
+    with raises(ValueError, match='Bad 1'):
+        hack_args({'x': pool_fail})(lambda x: x)(1)
+
+
+def test_memoized_hacks() -> None:
+    calls: list[Any] = []
+
+    @memoized_arg_hacker(maxsize=2)
+    def memoized_hack_x(x: Any) -> float:
+        calls.append(x)
+        return hack_x(x)
+
+    @memoized_arg_hacker(key=tuple)
+    def total(values: list[int]) -> int:
+        calls.append(values)
+        return sum(values)
+
+    @hack_args({'x': memoized_hack_x, 'y': memoized_hack_x, 'z': total}, codegen=True)
+    def add(x: float, y: float = 3, z: Any = ()) -> Any:
+        return x + y + z
+
+    assert add('a', 'a', [1, 2]) == 23  # type: ignore[arg-type]
+    assert add('a', 1, [1, 2]) == 14  # type: ignore[arg-type]
+    assert add(1.0, 1, [1]) == 3  # 1.0 and 1 are cached separately
+    assert calls == ['a', [1, 2], 1, 1.0, [1]]
+    stats = memoized_hack_x.cache.stats  # type: ignore[attr-defined]
+    assert (stats.hits, stats.misses, stats.evictions) == (3, 3, 1)
+    assert memoized_hack_x([1]) == [1]  # Unhashable values are always processed
+    assert calls[-1] == [1]
+    with raises(TypeError, match='asynchronous'):
+        memoized_arg_hacker()(async_hack_x)
+    with raises(TypeError, match='specs of the argument'):
+        memoized_arg_hacker()(arg_hacker_with_specs(lambda spec: spec.value))
+
+
+def test_lazy_hack_args() -> None:
+    with patch('art_deco.hack_args.processor.get_static_arg_specs', wraps=get_static_arg_specs) as inspect_func:
+
+        class Example:
+            @hack_args({'x': hack_x, 'y': hack_y, ('x', 'z'): validate_x_z}, lazy=True)
+            def add_method(self, x: float, y: int = 3, z: Annotated[int, hack_z] = 4) -> float:
+                return x + y + z
+
+            @classmethod
+            @hack_args({'x': hack_x}, lazy=True)
+            def add_cls(cls: Type, x: float, y: int = 3) -> float:
+                return x + y
+
+            @staticmethod
+            @hack_args({'x': async_hack_x}, lazy=True)
+            async def add_async(x: float, y: int = 3) -> float:
+                return x + y
+
+        @hack_args({'x': async_hack_x}, lazy=True)
+        def invalid(x: float) -> float:
+            return x
+
+        assert not inspect_func.called
+        assert Example().add_method('a', 2, 3) == 60  # type: ignore[arg-type]
+        assert Example().add_method(1) == 51
+        assert inspect_func.call_count == 1  # Once, on the first call
+        assert Example.add_cls('a') == 13  # type: ignore[arg-type]
+        assert inspect.iscoroutinefunction(Example.add_async)
+        assert run(Example().add_async('a')) == 13  # type: ignore[arg-type]
+        for _ in range(2):
+            with raises(TypeError, match='coroutine functions'):
+                invalid(1)
+    with raises(ValueError, match='lazily'):
+        hack_args(is_dynamic=True, lazy=True)
+
+
+def test_identical_functions_share_their_processor() -> None:
+    preprocessed = []
+
+    @preprocess_default
+    @arg_hacker
+    def hack_default(value: str) -> str:
+        preprocessed.append(value)
+        return value.upper()
+
+    def make_func() -> Any:
+        @hack_args({'x': hack_default})
+        def func(x: str = 'a') -> str:
+            return x
+
+        return func
+
+    funcs = [make_func() for _ in range(3)]
+    assert [func() for func in funcs] == ['A'] * 3
+    assert preprocessed == ['a']  # Once, by the shared processor
+
+
+@arg_hacker
+def double(value: float) -> float:
+    return value * 2
+
+
+@arg_hacker_with_specs
+def add_default(_: StaticArgSpecs, spec: DynamicArgSpec[float]) -> float:
+    default: float = spec.static.default_val
+    return spec.value + default
+
+
+@mark.parametrize(('is_dynamic', 'codegen'), [(False, False), (False, True), (True, False)])
+def test_fused_hack_chains(is_dynamic: bool, codegen: bool) -> None:
+    @hack_args({'t': [double, double, add_default]}, is_dynamic=is_dynamic, codegen=codegen)
+    def add(
+        x: Annotated[float, hack_x, double],
+        y: Annotated[int, double, 'not a hack', add_default] = 3,
+        z: Annotated[Annotated[int, double], double] = 1,
+        t: Annotated[int, hack_x] = 1,  # The explicit chain replaces the annotated one
+    ) -> float:
+        return x + y + z + t
+
+    assert add('a') == 20 + 9 + 4 + 5  # type: ignore[arg-type]  # mypy correctly identifies the problem
+    assert add(1, 2, 3, 4) == 2 + 7 + 12 + 17
+
+
+def test_fuse_hacks() -> None:
+    assert fuse_hacks([double]) is double
+    assert is_hack_arg_without_specs(fuse_hacks([hack_x, double]))
+    assert is_hack_arg_with_specs(fuse_hacks([double, add_default]))
+
+    with_specs = fuse_hacks([hack_y, add_default])
+    assert is_hack_arg_with_specs(with_specs)
+    specs = get_static_arg_specs(lambda y=3: y, parse_type_hints=False)
+    # add_default gets the value returned by hack_y, along with the static spec of y
+    assert with_specs(specs, DynamicArgSpec('y', 1, False, specs.args[0])) == 23
+
+    seen: list[DynamicArgSpec] = []
+
+    @arg_hacker_with_specs
+    def record_spec(_: StaticArgSpecs, spec: DynamicArgSpec) -> Any:
+        seen.append(spec)
+        return spec.value
+
+    fused = fuse_hacks([record_spec, double, record_spec, double, record_spec])
+    assert is_hack_arg_with_specs(fused)
+    spec = DynamicArgSpec('y', 1, False, specs.args[0])
+    assert fused(specs, spec) == 4
+    # The spec of the call is left as is, the hacks after a change of value share a single copy of it
+    assert seen[0] is spec and seen[1] is seen[2] is not spec
+    assert spec.value == 1
+
+    marked = preprocess_default(arg_hacker(lambda value: f'{value}!'))
+    assert is_preprocessed_default_hack(fuse_hacks([marked, marked]))
+    assert not is_preprocessed_default_hack(fuse_hacks([marked, double]))
+    with raises(TypeError, match='cannot be chained'):
+        fuse_hacks([double, async_hack_x])
+    with raises(TypeError, match='cannot be chained'):
+        hack_args({'x': (pool_double, double)})(lambda x: x)
@@ -0,0 +1,30 @@
+import array
+
+from pytest import raises
+
+from art_deco.memoize_args.fingerprints import fingerprint
+
+
+def test_hashable_values() -> None:
+    assert fingerprint('a') == 'a'
+    assert fingerprint(1) == fingerprint(1.0)
+    assert fingerprint(1, typed=True) != fingerprint(1.0, typed=True)
+
+
+def test_containers() -> None:
+    assert fingerprint([1, {'a': [2]}]) == fingerprint([1, {'a': [2]}])
+    assert fingerprint([1, 2]) != fingerprint((1, [2]))
+    assert fingerprint([1, 2]) not in {(list, 1, 2), (tuple, 1, 2)}  # Never equal to the tuples of callers
+    assert fingerprint({1, 2}) == fingerprint({2, 1})
+    assert fingerprint({'a': 1, 'b': 2}) == fingerprint({'b': 2, 'a': 1})
+
+
+def test_buffers() -> None:
+    data = bytearray(b'abcdef')
+    assert fingerprint(data) == fingerprint(bytearray(b'abcdef'))
+    assert fingerprint(data) != fingerprint(bytearray(b'abcdeg'))
+    assert fingerprint(memoryview(data)[::2]) == fingerprint(memoryview(bytearray(b'ace')))  # Non-contiguous
+    assert fingerprint(memoryview(data).cast('B', (2, 3))) != fingerprint(memoryview(data).cast('B', (3, 2)))
+    assert fingerprint(array.array('i', [1])) != fingerprint(array.array('f', [1]))
+    with raises(TypeError, match='Cannot fingerprint'):
+        fingerprint(type('Unhashable', (), {'__hash__': None})())
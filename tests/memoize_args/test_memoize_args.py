@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from asyncio import run
+from typing import Any
+
+from pytest import raises
+
+from art_deco.memoize_args.memoizer import memoize_args
+
+
+def test_canonical_calls() -> None:
+    calls: list[tuple] = []
+
+    @memoize_args()
+    def add(x: int, y: int = 2, *args: int, **kwargs: int) -> int:
+        calls.append((x, y, args, kwargs))
+        return x + y + sum(args) + sum(kwargs.values())
+
+    assert add(1, y=2) == add(x=1, y=2) == add(1) == add(1, 2) == 3
+    assert add(1, 2, 3, z=4) == add(1, 2, 3, z=4) == 10
+    assert add(1, 2, z=3, w=4) == add(1, 2, w=4, z=3) == 10
+    assert len(calls) == 3
+    stats = add.cache.stats  # type: ignore[attr-defined]
+    assert (stats.hits, stats.misses) == (5, 3)
+    assert memoize_args()(add.__wrapped__).cache is not add.cache  # type: ignore[attr-defined]  # A cache per wrapper
+
+
+def test_unhashable_and_ignored_args() -> None:
+    calls: list[Any] = []
+
+    @memoize_args(maxsize=1, ignore=['log'])
+    def total(values: Any, log: list) -> int:
+        calls.append(values)
+        log.append(values)
+        return sum(values)
+
+    assert total([1, 2], []) == total([1, 2], []) == 3
+    assert total(bytearray(b'\x01'), []) == 1  # Evicts [1, 2]
+    assert total([1, 2], []) == 3
+    unhashable = type('Unhashable', (), {'__hash__': None})()
+    assert total({1: unhashable}, []) == 1  # Cannot be fingerprinted, not cached
+    assert total({1: unhashable}, []) == 1
+    assert len(calls) == 5
+    assert total.cache.stats.evictions == 2  # type: ignore[attr-defined]
+
+
+def test_invalid_calls_raise_the_errors_of_python() -> None:
+    @memoize_args()
+    def add(x: int, y: int = 2) -> int:
+        return x + y
+
+    with raises(TypeError, match="unexpected keyword argument 'z'"):
+        add(1, z=3)  # type: ignore[call-arg]
+    with raises(TypeError, match='positional arguments'):
+        add(1, 2, 3)  # type: ignore[call-arg]
+    with raises(TypeError, match="multiple values for argument 'x'"):
+        add(1, x=2)  # type: ignore[misc]
+    with raises(TypeError, match="missing 1 required positional argument: 'x'"):
+        add()  # type: ignore[call-arg]
+    assert add.cache.stats.misses == 2  # type: ignore[attr-defined]  # Only the calls that could be bound
+
+
+def test_methods_and_coroutines() -> None:
+    calls: list[Any] = []
+
+    class Example:
+        @memoize_args(typed=True)
+        def method(self, x: float) -> float:
+            calls.append(x)
+            return x * 2
+
+        @memoize_args()
+        async def coroutine(self, x: float) -> float:
+            calls.append(x)
+            return x * 3
+
+    example = Example()
+    assert example.method(1) == example.method(x=1) == Example.method(example, 1) == 2
+    assert example.method(1.0) == 2  # Typed
+    assert Example().method(1) == 2  # Other instance
+    assert run(example.coroutine(1)) == run(example.coroutine(x=1)) == 3
+    assert calls == [1, 1.0, 1, 1]
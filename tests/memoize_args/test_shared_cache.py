@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import os
+import subprocess  # noqa: S404
+import sys
+from functools import partial
+from pathlib import Path
+from unittest.mock import patch
+
+from pytest import fixture, raises
+
+from art_deco.memoize_args.memoizer import memoize_args
+from art_deco.memoize_args.shared_cache import SharedMemoryCache, stable_digest
+
+KEY = frozenset({('x', 'a'), ('y', (1, 2.5, None))})
+
+
+@fixture
+def cache(tmp_path: Path) -> SharedMemoryCache:
+    return SharedMemoryCache('test', n_slots=8, slot_size=128, ways=2, directory=tmp_path)
+
+
+def test_stable_digest_across_processes() -> None:
+    code = 'from art_deco.memoize_args.shared_cache import stable_digest; print(stable_digest({}).hex())'.format(
+        repr(KEY)
+    )
+    digests = {
+        subprocess.run(  # noqa: S603
+            [sys.executable, '-c', code],
+            env={**os.environ, 'PYTHONHASHSEED': seed},
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+        for seed in ('1', '2')
+    }
+    assert digests == {stable_digest(KEY).hex()}
+
+
+def test_shared_hits(cache: SharedMemoryCache, tmp_path: Path) -> None:
+    other_process = SharedMemoryCache('test', n_slots=8, slot_size=128, ways=2, directory=tmp_path)
+    assert cache.get(KEY, 'missing') == 'missing'
+    cache.put(KEY, {'result': [1, 2]})
+    assert other_process.get(KEY) == {'result': [1, 2]}
+    other_process.put(KEY, 'replaced')
+    assert cache.get(KEY) == 'replaced'
+    cache.put('large', 'x' * 128)  # Does not fit in a slot
+    assert cache.get('large') is None
+    cache.put(lambda: None, 1)  # Cannot be pickled
+    assert (cache.stats.hits, cache.stats.misses, other_process.stats.hits) == (1, 2, 1)
+    other_process.clear()
+    assert cache.get(KEY) is None
+    other_process.close()
+    with raises(ValueError, match='not 16 x 128 bytes'):
+        SharedMemoryCache('test', n_slots=16, slot_size=128, directory=tmp_path)
+
+
+def test_eviction_and_ttl(cache: SharedMemoryCache, tmp_path: Path) -> None:
+    for i in range(100):
+        cache.put(i, i)
+    assert sum(cache.get(i) is not None for i in range(100)) == 8
+    assert cache.stats.evictions == 92
+    expiring = SharedMemoryCache('test', n_slots=8, slot_size=128, ways=2, ttl=1e-9, directory=tmp_path)
+    assert all(expiring.get(i) is None for i in range(100))
+    assert expiring.stats.expirations == 8
+    with raises(ValueError, match='multiple of ways'):
+        SharedMemoryCache('other', n_slots=7, ways=2, directory=tmp_path)
+
+
+def test_memoize_args_with_shared_cache(cache: SharedMemoryCache) -> None:
+    calls = []
+
+    @memoize_args(cache=cache)
+    def add(x: int, y: list[int]) -> int:
+        calls.append(x)
+        return x + sum(y)
+
+    assert add(1, [2]) == add(y=[2], x=1) == 3
+    assert calls == [1]
+    assert add.cache is cache  # type: ignore[attr-defined]
+
+
+def test_only_private_tables_are_opened(tmp_path: Path) -> None:
+    open_table = partial(SharedMemoryCache, n_slots=8, slot_size=128, ways=2, directory=tmp_path)
+    open_table('private').close()
+    with patch('os.getuid', return_value=os.getuid() + 1), raises(PermissionError, match='owned'):
+        open_table('private')  # Created by another user
+    (tmp_path / 'art_deco_cache_shared').write_bytes(bytes(8 * 128))
+    (tmp_path / 'art_deco_cache_shared').chmod(0o662)
+    with raises(PermissionError, match='only writable'):
+        open_table('shared')
+    (tmp_path / 'art_deco_cache_link').symlink_to(tmp_path / 'art_deco_cache_private')
+    with raises(PermissionError, match='symlink'):
+        open_table('link')
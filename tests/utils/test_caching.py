@@ -0,0 +1,51 @@
+from pytest import raises
+
+from art_deco.utils.caching import LRUCache
+
+
+def test_lru_cache() -> None:
+    cache: LRUCache[str, int] = LRUCache(maxsize=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1  # 'b' becomes the least recently used
+    cache.put('c', 3)
+    assert 'b' not in cache
+    assert cache.get('b') is None
+    assert len(cache) == 2
+    assert (cache.stats.hits, cache.stats.misses, cache.stats.evictions) == (1, 1, 1)
+    cache.clear()
+    assert not len(cache)  # pylint: disable=use-implicit-booleaness-not-len
+    with raises(ValueError, match='positive'):
+        LRUCache(maxsize=0)
+
+
+def test_lru_cache_ttl() -> None:
+    now = [0.0]
+    cache: LRUCache[str, int] = LRUCache(maxsize=2, ttl=10, timer=lambda: now[0])
+    cache.put('a', 1)
+    now[0] = 5
+    assert cache.get('a') == 1
+    now[0] = 10
+    assert 'a' not in cache
+    assert cache.get('a', -1) == -1
+    assert not len(cache)  # pylint: disable=use-implicit-booleaness-not-len
+    assert (cache.stats.hits, cache.stats.misses, cache.stats.expirations) == (1, 1, 1)
+
+
+def test_lru_cache_maxbytes() -> None:
+    cache: LRUCache[str, str] = LRUCache(maxbytes=10, sizeof=len)
+    cache.put('a', 'xxxx')
+    cache.put('b', 'yyyy')
+    cache.put('a', 'xxx')  # Replaced, and the most recently used
+    assert cache.nbytes == 7
+    cache.put('c', 'zzzz')
+    assert 'b' not in cache
+    assert cache.nbytes == 7
+    cache.put('d', 'w' * 11)  # Larger than the whole cache
+    assert 'd' not in cache
+    assert len(cache) == 2
+    assert cache.stats.evictions == 1
+    with raises(ValueError, match='bounded'):
+        LRUCache()
+    with raises(ValueError, match='TTL'):
+        LRUCache(maxsize=1, ttl=0)
@@ -0,0 +1,35 @@
+import os
+from unittest.mock import Mock, patch
+
+from pytest import mark, raises
+
+from art_deco.utils import process_pool
+from art_deco.utils.process_pool import SUPPORTS_OUT_OF_BAND, get_shared_process_pool, submit_to_process_pool
+from art_deco_test_examples.functions.process_pool_funcs import Blob, blob_info, blob_size, pool_fail, worker_pid
+
+
+def test_submit_to_process_pool() -> None:
+    assert get_shared_process_pool() is get_shared_process_pool()
+    assert submit_to_process_pool(worker_pid, None).result() != os.getpid()
+    assert submit_to_process_pool(len, b'abc').result() == 3  # In-band values
+    assert submit_to_process_pool(blob_size, Blob(bytearray(10**6))).result() == 10**6
+    with raises(ValueError, match='Bad 1'):
+        submit_to_process_pool(pool_fail, 1).result()
+
+
+@mark.skipif(not SUPPORTS_OUT_OF_BAND, reason='Needs pickle protocol 5 and shared memory')
+def test_out_of_band_buffers_are_shared() -> None:
+    assert submit_to_process_pool(blob_info, Blob(bytearray(b'abcd'))).result() == (4, True)
+    assert submit_to_process_pool(blob_info, Blob(bytearray())).result() == (0, True)
+
+
+@mark.skipif(not SUPPORTS_OUT_OF_BAND, reason='Needs pickle protocol 5 and shared memory')
+def test_shared_memory_is_released_if_submit_fails() -> None:
+    pool = Mock(submit=Mock(side_effect=RuntimeError('cannot schedule new futures after shutdown')))
+    with patch.object(process_pool, 'get_shared_process_pool', return_value=pool):
+        with patch.object(process_pool, '_release', wraps=process_pool._release) as release:
+            with raises(RuntimeError, match='shutdown'):
+                submit_to_process_pool(blob_info, Blob(bytearray(b'abcd')))
+    (memory,), _ = release.call_args
+    with raises(FileNotFoundError):
+        process_pool.shared_memory.SharedMemory(name=memory.name)
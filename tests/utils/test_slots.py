@@ -0,0 +1,41 @@
+import pickle
+from dataclasses import FrozenInstanceError, dataclass, field
+
+from pytest import raises
+
+from art_deco.utils.slots import slotted
+
+
+@slotted()
+@dataclass(frozen=True)
+class _Point:
+    x: int
+    y: int = 0
+    norm: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, 'norm', abs(self.x) + abs(self.y))  # noqa: WPS609
+
+
+def test_slotted() -> None:
+    point = _Point(1, -2)
+    assert not hasattr(point, '__dict__')
+    assert (point.x, point.y, point.norm) == (1, -2, 3)
+    assert _Point(1) == _Point(1, 0)
+    assert _Point.__qualname__ == '_Point'
+    with raises(FrozenInstanceError):
+        point.x = 3  # type: ignore[misc]
+
+
+def test_slotted_pickle() -> None:
+    point = _Point(1, -2)
+    assert pickle.loads(pickle.dumps(point)) == point  # noqa: S301
+
+
+def test_slotted_rejects_non_init_defaults() -> None:
+    with raises(AssertionError, match='__post_init__'):
+
+        @slotted()
+        @dataclass
+        class _Invalid:  # pylint: disable=unused-variable
+            x: int = field(default=0, init=False)